@@ -0,0 +1,50 @@
+"""Measures the cold start cost of importing wrike and creating a client, each in a
+fresh interpreter"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import wrike
+imported = time.perf_counter()
+client = wrike.Wrike(api_key="token")
+created = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "client": created - start,
+    "modules": sorted(m for m in ("requests", "multiprocessing") if m in sys.modules),
+}))
+"""
+
+
+def measure(script: str = SCRIPT, runs: int = 5) -> dict:
+    """Runs the script in fresh interpreters, returns the fastest run"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    results = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", script],
+                env=env,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+    return min(results, key=lambda result: result["client"])
+
+
+if __name__ == "__main__":
+    result = measure()
+    print(
+        f"import wrike {result['import'] * 1e3:.1f} ms, "
+        f"+ Wrike() {result['client'] * 1e3:.1f} ms, "
+        f"heavy modules loaded: {result['modules'] or 'none'}"
+    )
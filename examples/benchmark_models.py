@@ -0,0 +1,81 @@
+"""Compares building models with their constructors against the compiled from_dict"""
+
+import timeit
+
+from wrike.models import Folder, Result, Task
+
+PAGE = 1000
+
+
+def page(kind, record):
+    return Result(
+        200,
+        headers={},
+        data={"kind": kind, "data": [dict(record) for _ in range(PAGE)]},
+    ).data
+
+
+folders = page(
+    "folders",
+    {
+        "id": "IEAAAAAQI4AAAAAA",
+        "accountId": "IEAAAAAQ",
+        "title": "Folder",
+        "createdDate": "2024-01-01T00:00:00Z",
+        "updatedDate": "2024-01-02T00:00:00Z",
+        "sharedIds": ["KUAAAAAA"],
+        "parentIds": ["IEAAAAAQI7777777"],
+        "childIds": [],
+        "scope": "WsFolder",
+        "permalink": "https://www.wrike.com/open.htm?id=1",
+        "workflowId": "IEAAAAAQK4AAAAAA",
+    },
+)
+tasks = page(
+    "tasks",
+    {
+        "id": "IEAAAAAQKQAAAAAA",
+        "accountId": "IEAAAAAQ",
+        "title": "Task",
+        "status": "Active",
+        "importance": "Normal",
+        "createdDate": "2024-01-01T00:00:00Z",
+        "updatedDate": "2024-01-02T00:00:00Z",
+        "dates": {"type": "Planned", "duration": 480},
+        "scope": "WsTask",
+        "customStatusId": "IEAAAAAQJMAAAAAA",
+        "permalink": "https://www.wrike.com/open.htm?id=2",
+        "priority": "1f1e3c00",
+    },
+)
+
+for name, model, records in [("Folder", Folder, folders), ("Task", Task, tasks)]:
+    constructor = min(
+        timeit.repeat(lambda: [model(**r) for r in records], number=20, repeat=5)
+    )
+    compiled = min(
+        timeit.repeat(
+            lambda: [model.from_dict(r) for r in records], number=20, repeat=5
+        )
+    )
+    dumped = min(
+        timeit.repeat(
+            lambda: [m.to_dict() for m in map(model.from_dict, records)],
+            number=20,
+            repeat=5,
+        )
+    )
+    per_page = 1e3 / 20
+    print(
+        f"{name}: constructor {constructor * per_page:.2f} ms/page, "
+        f"from_dict {compiled * per_page:.2f} ms/page "
+        f"({constructor / compiled:.1f}x), from_dict + to_dict {dumped * per_page:.2f} ms/page"
+    )
+
+# Converting dates, enums and ids costs most when eager, lazy defers it to first access
+for conversion in ("eager", "lazy"):
+    from_dict = Task.constructor(conversion)
+    built = min(
+        timeit.repeat(lambda: [from_dict(r) for r in tasks], number=20, repeat=5)
+    )
+    print(f"Task, {conversion} conversion: from_dict {built * 1e3 / 20:.2f} ms/page")
@@ -0,0 +1,108 @@
+from unittest import TestCase, mock
+import requests
+from wrike.adaptive import AdaptiveConcurrency
+from wrike.api import Wrike
+from wrike.exceptions import TransientWrikeException
+from wrike.scheduling import RequestScheduler
+
+
+class TestAdaptiveConcurrency(TestCase):
+    def test_additive_increase(self):
+        concurrency = AdaptiveConcurrency(initial_limit=4, max_limit=8)
+        for _ in range(4):
+            concurrency.record(0.1)
+        self.assertEqual(concurrency.limit, 4)
+        for _ in range(20):
+            concurrency.record(0.1)
+        self.assertEqual(concurrency.limit, 8)
+        self.assertEqual(
+            [limit for _, limit, _ in concurrency.history], [4, 5, 6, 7, 8]
+        )
+
+    def test_throttling_halves_once_per_round(self):
+        concurrency = AdaptiveConcurrency(initial_limit=16)
+        concurrency.record(10.0)
+        concurrency.record(10.0, "throttled")
+        concurrency.record(10.0, "throttled")
+        self.assertEqual(concurrency.limit, 8)
+        self.assertEqual(concurrency.throttled, 2)
+        self.assertEqual(concurrency.history[-1][1:], (8, "throttled"))
+
+    def test_burst_before_any_success_cuts_once(self):
+        concurrency = AdaptiveConcurrency(initial_limit=16)
+        for _ in range(4):
+            concurrency.record(10.0, "throttled")
+        self.assertEqual(concurrency.limit, 8)
+        self.assertEqual(concurrency.throttled, 4)
+
+    def test_errors_cut_down_to_min_limit(self):
+        concurrency = AdaptiveConcurrency(initial_limit=4, min_limit=2)
+        for _ in range(5):
+            concurrency.record(0.0, "error")
+        self.assertEqual(concurrency.limit, 2)
+        self.assertEqual(concurrency.metrics()["errors"], 5)
+
+    def test_rising_latency_cuts(self):
+        concurrency = AdaptiveConcurrency(
+            initial_limit=10, smoothing=1.0, latency_tolerance=2.0
+        )
+        concurrency.record(0.0)
+        concurrency._last_cut = float("-inf")
+        concurrency.record(0.0)
+        limit = concurrency.limit
+        concurrency.best_latency = 0.001
+        concurrency.record(0.003)
+        self.assertLess(concurrency.limit, limit)
+        self.assertEqual(concurrency.history[-1][2], "latency")
+
+    def test_latency_rebased_at_min_limit(self):
+        concurrency = AdaptiveConcurrency(initial_limit=1, max_limit=1, smoothing=1.0)
+        concurrency.record(0.001)
+        concurrency.record(0.005)
+        self.assertEqual(concurrency.best_latency, 0.005)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(initial_limit=40, max_limit=32)
+
+    def test_scheduler_follows_the_limit(self):
+        concurrency = AdaptiveConcurrency(initial_limit=1, max_limit=4)
+        scheduler = RequestScheduler(interactive_reserved=0, adaptive=concurrency)
+        self.assertEqual(scheduler.limit, 1)
+        scheduler.acquire("batch")
+        self.assertFalse(scheduler._slot_free("batch"))
+        for _ in range(4):
+            scheduler.release("batch", 0.01, "ok")
+            scheduler.acquire("batch")
+        self.assertEqual(scheduler.limit, 3)
+        self.assertTrue(scheduler._slot_free("batch"))
+
+
+class TestAdapterFeedback(TestCase):
+    def test_responses_feed_the_limit(self):
+        wrike = Wrike(adaptive_concurrency=True, max_concurrency=16)
+        self.assertEqual(wrike._max_workers(None), 16)
+        self.assertEqual(wrike._max_workers(2), 2)
+        response = requests.Response()
+        response.status_code = 429
+        response.reason = "Too Many Requests"
+        with mock.patch("requests.Session.request", return_value=response):
+            with self.assertRaises(TransientWrikeException):
+                wrike._rest_adapter.get("version")
+        self.assertEqual(wrike.concurrency.throttled, 1)
+        self.assertEqual(wrike.concurrency.limit, 2)
+        self.assertEqual(wrike._rest_adapter.scheduler.in_flight["interactive"], 0)
+
+    def test_fixed_concurrency_by_default(self):
+        wrike = Wrike()
+        self.assertIsNone(wrike.concurrency)
+        self.assertEqual(wrike._max_workers(None), 8)
+
+    def test_small_max_concurrency_starts_at_it(self):
+        for max_concurrency in (2, 3):
+            with self.subTest(max_concurrency=max_concurrency):
+                wrike = Wrike(
+                    adaptive_concurrency=True, max_concurrency=max_concurrency
+                )
+                self.assertEqual(wrike.concurrency.limit, max_concurrency)
+                self.assertEqual(wrike.concurrency.max_limit, max_concurrency)
@@ -0,0 +1,70 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from wrike.api import Wrike
+from wrike.async_jobs import JobPoller
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import AsyncJob, Result
+
+
+def job(status, progress=None):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "async_job",
+            "data": [{"id": "j1", "status": status, "progress": progress}],
+        },
+    )
+
+
+class TestJobPoller(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+
+    @patch("wrike.async_jobs.time.sleep")
+    def test_interval_backs_off_up_to_max(self, sleep):
+        self.wrike._rest_adapter.get.side_effect = [job("InProgress")] * 5 + [
+            job("Completed")
+        ]
+        poller = self.wrike.async_job_poller("j1", initial_interval=1, max_interval=3)
+        finished = poller.wait()
+        self.assertIsInstance(finished, AsyncJob)
+        self.assertEqual(poller.state, "Completed")
+        self.assertEqual(poller.polls, 6)
+        self.assertEqual(
+            [call.args[0] for call in sleep.call_args_list], [1, 1.5, 2.25, 3, 3]
+        )
+        self.assertEqual(
+            self.wrike._rest_adapter.get.call_args.kwargs["endpoint"], "async_job/j1"
+        )
+
+    @patch("wrike.async_jobs.time.sleep")
+    def test_progress_schedules_next_poll(self, sleep):
+        jobs = iter([AsyncJob("j1", "InProgress", progress=25, kind="async_job")])
+        poller = JobPoller(lambda: next(jobs), initial_interval=1, max_interval=60)
+        poller.poll()
+        poller.started -= 10
+        # 25% done after 10s leaves ~30s, so the next poll is ~15s away
+        self.assertAlmostEqual(poller._next_interval(1), 15, delta=0.1)
+
+    @patch("wrike.async_jobs.time.sleep")
+    def test_throttled_poll_waits_retry_after(self, sleep):
+        self.wrike._rest_adapter.get.side_effect = [
+            TransientWrikeException("429", status_code=429, retry_after=7),
+            job("Completed"),
+        ]
+        self.wrike.wait_for_async_job("j1", initial_interval=1)
+        sleep.assert_called_once_with(7)
+
+    @patch("wrike.async_jobs.time.sleep")
+    def test_failed_job_raises(self, sleep):
+        self.wrike._rest_adapter.get.return_value = job("Failed")
+        with self.assertRaises(WrikeException):
+            self.wrike.wait_for_async_job("j1")
+
+    @patch("wrike.async_jobs.time.sleep")
+    def test_timeout(self, sleep):
+        self.wrike._rest_adapter.get.return_value = job("InProgress")
+        with self.assertRaises(WrikeException):
+            self.wrike.wait_for_async_job("j1", initial_interval=1, timeout=0.5)
@@ -0,0 +1,169 @@
+import io
+import os
+import tempfile
+from unittest import TestCase, mock
+from unittest.mock import MagicMock, patch
+import requests
+from wrike.api import Wrike
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import Attachment, Result
+from wrike.rest_adapter import RestAdapter
+
+BODY = bytes(range(256)) * 40
+
+
+def attachment(id="a1", size=len(BODY)):
+    return Attachment(
+        id, "u1", "report.pdf", "2024-01-01T00:00:00Z", size=size, kind="attachments"
+    )
+
+
+class TestAttachments(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.offsets = []
+
+    def stream(self, fail_at=None):
+        failed = []
+
+        def stream(url, chunk_size, offset=0):
+            self.offsets.append(offset)
+            for i in range(offset, len(BODY), chunk_size):
+                if fail_at is not None and i >= fail_at and not failed:
+                    failed.append(i)
+                    raise TransientWrikeException("Download interrupted")
+                yield BODY[i : i + chunk_size]
+
+        return stream
+
+    @patch("wrike.deadlines.time.sleep")
+    def test_interrupted_download_resumes_from_last_byte(self, sleep):
+        self.wrike._rest_adapter.stream.side_effect = self.stream(fail_at=4096)
+        downloader = self.wrike.attachment_downloader(
+            self.directory.name, chunk_size=1024
+        )
+        path = downloader.download(attachment())
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), BODY)
+        self.assertEqual(self.offsets, [0, 4096])
+        self.assertEqual(downloader.resumes, 1)
+        self.assertEqual(downloader.bytes_downloaded, len(BODY))
+        self.assertTrue(path.endswith("a1_report.pdf"))
+
+    @patch("wrike.deadlines.time.sleep")
+    def test_mmap_download_resumes(self, sleep):
+        self.wrike._rest_adapter.stream.side_effect = self.stream(fail_at=2048)
+        downloader = self.wrike.attachment_downloader(
+            self.directory.name, chunk_size=1024, use_mmap=True
+        )
+        path = downloader.download(attachment())
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), BODY)
+        self.assertEqual(self.offsets, [0, 2048])
+
+    def test_leftover_part_file_is_resumed(self):
+        self.wrike._rest_adapter.stream.side_effect = self.stream()
+        downloader = self.wrike.attachment_downloader(
+            self.directory.name, chunk_size=1024
+        )
+        with open(downloader.path(attachment()) + ".part", "wb") as file:
+            file.write(BODY[:3000])
+        with open(downloader.download(attachment()), "rb") as file:
+            self.assertEqual(file.read(), BODY)
+        self.assertEqual(self.offsets, [3000])
+
+    def test_complete_part_file_is_renamed_without_a_request(self):
+        downloader = self.wrike.attachment_downloader(self.directory.name)
+        with open(downloader.path(attachment()) + ".part", "wb") as file:
+            file.write(BODY)
+        with open(downloader.download(attachment()), "rb") as file:
+            self.assertEqual(file.read(), BODY)
+        self.wrike._rest_adapter.stream.assert_not_called()
+
+    def test_download_many(self):
+        self.wrike._rest_adapter.stream.side_effect = self.stream()
+        downloader = self.wrike.attachment_downloader(self.directory.name)
+        results = dict(
+            (a.id, path)
+            for a, path in downloader.download_many(
+                attachment(str(i)) for i in range(10)
+            )
+        )
+        self.assertEqual(len(results), 10)
+        self.assertEqual(len(os.listdir(self.directory.name)), 10)
+
+    def test_upload_streams_file_handle(self):
+        self.wrike._rest_adapter.upload.return_value = Result(
+            200,
+            headers={},
+            data={
+                "kind": "attachments",
+                "data": [
+                    {
+                        "id": "a1",
+                        "authorId": "u1",
+                        "name": "report.pdf",
+                        "createdDate": "",
+                    }
+                ],
+            },
+        )
+        handle = io.BytesIO(BODY)
+        uploaded = self.wrike.upload_attachment(handle, task_id="t1", name="report.pdf")
+        self.assertEqual(uploaded.id, "a1")
+        args, kwargs = self.wrike._rest_adapter.upload.call_args
+        self.assertEqual(args[:3], ("tasks/t1/attachments", handle, "report.pdf"))
+        self.assertEqual(kwargs["content_type"], "application/pdf")
+
+
+class TestAdapterStreaming(TestCase):
+    def setUp(self) -> None:
+        self.rest_adapter = RestAdapter(api_key="key")
+        self.response = requests.Response()
+        self.response.raw = io.BytesIO(BODY)
+
+    def test_range_ignored_by_server_skips_resent_bytes(self):
+        self.response.status_code = 200
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
+            chunks = list(
+                self.rest_adapter.stream("attachments/a1/download", 1000, offset=2500)
+            )
+        self.assertEqual(b"".join(chunks), BODY[2500:])
+        headers = request.call_args.kwargs["headers"]
+        self.assertEqual(headers["Range"], "bytes=2500-")
+        self.assertEqual(headers["Authorization"], "bearer key")
+
+    def test_unsatisfiable_range_at_the_end_is_complete(self):
+        self.response.status_code = 416
+        self.response.headers["Content-Range"] = f"bytes */{len(BODY)}"
+        with mock.patch("requests.Session.request", return_value=self.response):
+            chunks = list(
+                self.rest_adapter.stream(
+                    "attachments/a1/download", 1000, offset=len(BODY)
+                )
+            )
+        self.assertEqual(chunks, [])
+
+    def test_unsatisfiable_range_of_another_size_raises(self):
+        self.response.status_code = 416
+        self.response.headers["Content-Range"] = f"bytes */{len(BODY)}"
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertRaises(WrikeException):
+                list(self.rest_adapter.stream("attachments/a1/download", offset=99999))
+
+    def test_upload_sends_file_handle_as_body(self):
+        self.response.status_code = 200
+        self.response._content = b"{}"
+        handle = io.BytesIO(BODY)
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
+            self.rest_adapter.upload("tasks/t1/attachments", handle, "rapport é.pdf")
+        kwargs = request.call_args.kwargs
+        self.assertIs(kwargs["data"], handle)
+        self.assertEqual(kwargs["headers"]["X-File-Name"], "rapport%20%C3%A9.pdf")
@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.batching import MicroBatcher
+from wrike.exceptions import (
+    NotFoundWrikeException,
+    TransientWrikeException,
+    WrikeException,
+)
+from wrike.models import Folder, Result
+
+
+def folders_result(endpoint, ep_params=None):
+    ids = endpoint.split("/")[1].split(",")
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "folders",
+            "data": [
+                {"id": id, "title": id, "childIds": [], "scope": "WsFolder"}
+                for id in ids
+                if not id.startswith("missing")
+            ],
+        },
+    )
+
+
+class TestMicroBatcher(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+        self.wrike._rest_adapter.get.side_effect = folders_result
+        self.batcher = self.wrike.folder_batcher(window=0.05)
+
+    def tearDown(self) -> None:
+        self.batcher.close()
+
+    def test_concurrent_lookups_share_one_request(self):
+        ids = [f"f{i}" for i in range(40)]
+        with ThreadPoolExecutor(max_workers=40) as executor:
+            folders = list(executor.map(self.batcher.get, ids))
+        self.assertEqual([folder.id for folder in folders], ids)
+        self.assertIsInstance(folders[0], Folder)
+        self.assertEqual(self.wrike._rest_adapter.get.call_count, 1)
+        endpoint = self.wrike._rest_adapter.get.call_args.kwargs["endpoint"]
+        self.assertEqual(sorted(endpoint[len("folders/") :].split(",")), sorted(ids))
+
+    def test_batches_hold_at_most_100_ids(self):
+        futures = [self.batcher.submit(f"f{i}") for i in range(250)]
+        self.assertEqual(len({future.result().id for future in futures}), 250)
+        for call in self.wrike._rest_adapter.get.call_args_list:
+            self.assertLessEqual(len(call.kwargs["endpoint"].split(",")), 100)
+        self.assertGreaterEqual(self.wrike._rest_adapter.get.call_count, 3)
+
+    def test_duplicate_ids_are_requested_once(self):
+        first, second = self.batcher.submit("f1"), self.batcher.submit("f1")
+        self.assertIs(first.result(), second.result())
+        self.assertEqual(
+            self.wrike._rest_adapter.get.call_args.kwargs["endpoint"], "folders/f1"
+        )
+
+    def test_missing_ids_fail_only_their_callers(self):
+        found, missing = self.batcher.submit("f1"), self.batcher.submit("missing1")
+        self.assertEqual(found.result().id, "f1")
+        with self.assertRaises(NotFoundWrikeException):
+            missing.result()
+
+    def test_request_failure_reaches_every_caller(self):
+        self.wrike._rest_adapter.get.side_effect = WrikeException("Request failed")
+        futures = [self.batcher.submit(f"f{i}") for i in range(3)]
+        for future in futures:
+            with self.assertRaises(WrikeException):
+                future.result()
+
+    def test_rejected_id_fails_only_its_caller(self):
+        def get(endpoint, ep_params=None):
+            if "bad" in endpoint:
+                raise WrikeException("400: Bad Request")
+            return folders_result(endpoint)
+
+        self.wrike._rest_adapter.get.side_effect = get
+        futures = {id: self.batcher.submit(id) for id in ("f1", "bad1", "f2", "f3")}
+        with self.assertRaisesRegex(WrikeException, "400"):
+            futures.pop("bad1").result()
+        self.assertEqual([f.result().id for f in futures.values()], ["f1", "f2", "f3"])
+
+    def test_transient_failure_is_not_split(self):
+        self.wrike._rest_adapter.get.side_effect = TransientWrikeException("503")
+        futures = [self.batcher.submit(f"f{i}") for i in range(4)]
+        for future in futures:
+            with self.assertRaises(TransientWrikeException):
+                future.result()
+        self.assertEqual(self.wrike._rest_adapter.get.call_count, 1)
+
+    def test_close_sends_queued_ids_and_rejects_new_ones(self):
+        batcher = MicroBatcher(lambda ids: [MagicMock(id=id) for id in ids], window=10)
+        future = batcher.submit("f1")
+        batcher.close()
+        self.assertEqual(future.result(timeout=1).id, "f1")
+        with self.assertRaises(WrikeException):
+            batcher.submit("f2")
+
+    def test_contact_batcher_uses_comma_joined_contacts(self):
+        self.wrike._rest_adapter.get.side_effect = lambda endpoint, ep_params: Result(
+            200, headers={}, data={"kind": "contacts", "data": [{"id": "c1"}]}
+        )
+        batcher = self.wrike.contact_batcher()
+        self.assertEqual(batcher.get("c1").id, "c1")
+        batcher.close()
@@ -0,0 +1,226 @@
+import itertools
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock
+import requests
+from wrike.api import Wrike
+from wrike.bulk import Operation, Ref
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import Folder, Result, Task
+from wrike.warnings import ZeroWarning
+
+
+def one(kind, **datum):
+    return Result(200, headers={}, data={"kind": kind, "data": [datum]})
+
+
+def folder(id):
+    return one("folders", id=id, title=id, childIds=[], scope="WsFolder")
+
+
+def task(id):
+    return one(
+        "tasks",
+        id=id,
+        title=id,
+        status="Active",
+        importance="Normal",
+        dates={},
+        scope="WsTask",
+        permalink="",
+        priority="",
+    )
+
+
+class FakeWrites:
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def post(self, endpoint, data=None):
+        with self.lock:
+            self.calls.append(("POST", endpoint, data))
+            id = f"new{next(self.ids)}"
+        return folder(id) if endpoint.endswith("/folders") else task(id)
+
+    def put(self, endpoint, data=None):
+        with self.lock:
+            self.calls.append(("PUT", endpoint, data))
+        id = endpoint.split("/")[1]
+        return folder(id) if endpoint.startswith("folders") else task(id)
+
+    def delete(self, endpoint):
+        with self.lock:
+            self.calls.append(("DELETE", endpoint, None))
+        return task(endpoint.split("/")[1])
+
+
+class TestBulk(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike(retry_backoff=0)
+        self.fake = FakeWrites()
+        self.wrike._rest_adapter = MagicMock()
+        self.wrike._rest_adapter.post.side_effect = self.fake.post
+        self.wrike._rest_adapter.put.side_effect = self.fake.put
+        self.wrike._rest_adapter.delete.side_effect = self.fake.delete
+
+    def test_operation_validates_its_arguments(self):
+        with self.assertRaises(ValueError):
+            Operation("rename", "tasks", id="t")
+        with self.assertRaises(ValueError):
+            Operation("update", "spaces", id="s")
+        with self.assertRaises(ValueError):
+            Operation("move", "tasks", id="t", parent_id="a")
+
+    def test_children_run_after_the_parent_they_reference(self):
+        operations = [
+            Operation("create", "tasks", parent_id=Ref("child"), data={"title": "t"}),
+            Operation(
+                "create",
+                "folders",
+                parent_id=Ref("parent"),
+                data={"title": "c"},
+                key="child",
+            ),
+            Operation(
+                "create", "folders", parent_id="root", data={"title": "p"}, key="parent"
+            ),
+        ]
+        engine = self.wrike.bulk()
+        results = list(engine.run(operations))
+        self.assertTrue(all(result.ok for result in results))
+        endpoints = [call[1] for call in self.fake.calls]
+        parent_id = next(r.model.id for r in results if r.operation.key == "parent")
+        child_id = next(r.model.id for r in results if r.operation.key == "child")
+        self.assertEqual(endpoints[0], "folders/root/folders")
+        self.assertEqual(endpoints[1], f"folders/{parent_id}/folders")
+        self.assertEqual(endpoints[2], f"folders/{child_id}/tasks")
+        self.assertIsInstance(results[-1].model, Task)
+        self.assertEqual(engine.stats.succeeded, 3)
+        self.assertGreater(engine.stats.throughput, 0)
+
+    def test_failures_do_not_stop_the_batch_and_fail_dependents(self):
+        self.wrike._rest_adapter.post.side_effect = WrikeException("400: Bad Request")
+        operations = [
+            Operation(
+                "create", "folders", parent_id="root", data={"title": "p"}, key="p"
+            ),
+            Operation("create", "tasks", parent_id=Ref("p"), data={"title": "t"}),
+            Operation("update", "tasks", id="t1", data={"status": "Completed"}),
+        ]
+        results = {
+            r.operation.action + r.operation.entity: r
+            for r in self.wrike.bulk().run(operations)
+        }
+        self.assertFalse(results["createfolders"].ok)
+        self.assertFalse(results["createtasks"].ok)
+        self.assertTrue(results["updatetasks"].ok)
+        self.assertEqual(self.wrike._rest_adapter.post.call_count, 1)
+
+    def test_create_without_an_entity_fails_only_its_dependents(self):
+        self.wrike._rest_adapter.post.side_effect = [
+            Result(200, headers={}, data={"kind": "folders", "data": []})
+        ]
+        operations = [
+            Operation(
+                "create", "folders", parent_id="root", data={"title": "p"}, key="p"
+            ),
+            Operation("create", "tasks", parent_id=Ref("p"), data={"title": "t"}),
+            Operation("update", "tasks", id="t1", data={"status": "Completed"}),
+        ]
+        with self.assertWarns(ZeroWarning):
+            results = {
+                r.operation.action + r.operation.entity: r
+                for r in self.wrike.bulk().run(operations)
+            }
+        self.assertTrue(results["createfolders"].ok)
+        self.assertIsNone(results["createfolders"].model)
+        self.assertIn("returned no id", str(results["createtasks"].error))
+        self.assertTrue(results["updatetasks"].ok)
+        self.assertEqual(self.wrike._rest_adapter.post.call_count, 1)
+
+    def test_updates_are_retried_on_transient_errors(self):
+        self.wrike._rest_adapter.put.side_effect = [
+            TransientWrikeException("503: Service Unavailable", status_code=503),
+            task("t1"),
+        ]
+        result = next(
+            self.wrike.bulk().run(
+                [Operation("update", "tasks", id="t1", data={"title": "x"})]
+            )
+        )
+        self.assertTrue(result.ok)
+        self.assertEqual(result.attempts, 2)
+
+    def test_ambiguous_creates_are_not_retried(self):
+        self.wrike._rest_adapter.post.side_effect = TransientWrikeException(
+            "503: Service Unavailable", status_code=503
+        )
+        result = next(
+            self.wrike.bulk().run(
+                [Operation("create", "tasks", parent_id="f", data={"title": "x"})]
+            )
+        )
+        self.assertFalse(result.ok)
+        self.assertTrue(result.ambiguous)
+        self.assertEqual(self.wrike._rest_adapter.post.call_count, 1)
+
+    def test_throttled_and_unconnected_creates_are_retried(self):
+        never_sent = TransientWrikeException("Request failed")
+        never_sent.__cause__ = requests.exceptions.ConnectTimeout()
+        self.wrike._rest_adapter.post.side_effect = [
+            TransientWrikeException("429: Too Many Requests", status_code=429),
+            never_sent,
+            task("t1"),
+        ]
+        result = next(
+            self.wrike.bulk().run(
+                [Operation("create", "tasks", parent_id="f", data={"title": "x"})]
+            )
+        )
+        self.assertTrue(result.ok)
+        self.assertEqual(result.attempts, 3)
+
+    def test_duplicate_keys_run_once(self):
+        operations = [
+            Operation(
+                "create", "folders", parent_id="root", data={"title": "p"}, key="p"
+            ),
+            Operation(
+                "create", "folders", parent_id="root", data={"title": "p"}, key="p"
+            ),
+        ]
+        results = list(self.wrike.bulk().run(operations))
+        self.assertEqual(sorted(result.ok for result in results), [False, True])
+        self.assertEqual(self.wrike._rest_adapter.post.call_count, 1)
+
+    def test_unknown_dependencies_fail(self):
+        operations = [Operation("delete", "tasks", id=Ref("nope"))]
+        result = next(self.wrike.bulk().run(operations))
+        self.assertFalse(result.ok)
+
+    def test_moves_and_deletes_use_the_write_api(self):
+        operations = [
+            Operation("move", "folders", id="f1", parent_id="a", to_parent_id="b"),
+            Operation("delete", "tasks", id="t1"),
+        ]
+        results = list(self.wrike.bulk().run(operations))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertIn(
+            ("PUT", "folders/f1", {"addParents": ["b"], "removeParents": ["a"]}),
+            self.fake.calls,
+        )
+        self.assertIn(("DELETE", "tasks/t1", None), self.fake.calls)
+        self.assertIsInstance(
+            next(r.model for r in results if r.operation.entity == "folders"), Folder
+        )
+
+    def test_many_operations_complete(self):
+        operations = [
+            Operation("update", "tasks", id=f"t{i}", data={"title": "x"})
+            for i in range(200)
+        ]
+        engine = self.wrike.bulk(max_workers=16)
+        self.assertEqual(len(list(engine.run(operations))), 200)
+        self.assertEqual(engine.stats.succeeded, 200)
@@ -0,0 +1,162 @@
+import io
+import json
+from unittest import TestCase, mock
+import requests
+from wrike.api import Wrike
+from wrike.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from wrike.exceptions import CircuitOpenException, TransientWrikeException
+
+
+def response(status_code, id="IEAAAAAQI4AAAAAA"):
+    result = requests.Response()
+    result.status_code = status_code
+    result.reason = "OK" if status_code == 200 else "Service Unavailable"
+    result._content = json.dumps({"kind": "folders", "data": [{"id": id}]}).encode()
+    return result
+
+
+class TestCircuitBreaker(TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_rate=0.5, min_requests=4, open_for=60)
+        self.changes = []
+        self.breaker.add_listener(lambda *change: self.changes.append(change))
+
+    def fail(self, endpoint, times):
+        for _ in range(times):
+            self.breaker.after(self.breaker.before(endpoint), "error")
+
+    def test_opens_at_the_failure_rate(self):
+        for outcome in ("ok", "ok", "error"):
+            permit = self.breaker.before("folders/IEAAAAAQI4AAAAAA")
+            self.breaker.after(permit, outcome)
+        self.assertEqual(self.breaker.state("folders/IEAAAAAQI4AAAAAB"), CLOSED)
+        self.fail("folders/IEAAAAAQI4AAAAAB", 1)
+        self.assertEqual(self.breaker.state("folders/IEAAAAAQI4AAAAAC"), OPEN)
+        self.assertEqual(self.changes, [("folders/*", CLOSED, OPEN)])
+        with self.assertRaises(CircuitOpenException) as raised:
+            self.breaker.before("folders/IEAAAAAQI4AAAAAA")
+        self.assertGreater(raised.exception.retry_after, 0)
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_endpoint_groups_have_their_own_circuit(self):
+        self.fail("folders/IEAAAAAQI4AAAAAA", 4)
+        self.breaker.before("tasks")
+        self.assertEqual(self.breaker.metrics()["circuits"]["tasks"], CLOSED)
+
+    def test_throttling_and_unsent_requests_are_not_failures(self):
+        for outcome in ("throttled", None, "throttled", None, "throttled"):
+            self.breaker.after(self.breaker.before("tasks"), outcome)
+        self.assertEqual(self.breaker.state("tasks"), CLOSED)
+
+    def test_half_open_probe_closes(self):
+        self.fail("tasks", 4)
+        self.breaker._circuits["tasks"].opened_at -= 60
+        probe = self.breaker.before("tasks")
+        self.assertEqual(self.breaker.state("tasks"), HALF_OPEN)
+        # Only one probe at a time
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before("tasks")
+        self.breaker.after(probe, "ok")
+        self.assertEqual(self.breaker.state("tasks"), CLOSED)
+        self.assertEqual([new for _, _, new in self.changes], [OPEN, HALF_OPEN, CLOSED])
+        self.assertEqual(
+            [event[3] for event in self.breaker.events], [OPEN, HALF_OPEN, CLOSED]
+        )
+
+    def test_failed_probe_opens_again(self):
+        self.fail("tasks", 4)
+        self.breaker._circuits["tasks"].opened_at -= 60
+        self.breaker.after(self.breaker.before("tasks"), "error")
+        self.assertEqual(self.breaker.state("tasks"), OPEN)
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before("tasks")
+
+    def half_open_with_earlier_request(self):
+        # A request let through while closed that is still running when it half opens
+        earlier = self.breaker.before("tasks")
+        self.fail("tasks", 4)
+        self.breaker._circuits["tasks"].opened_at -= 60
+        probe = self.breaker.before("tasks")
+        return earlier, probe
+
+    def test_earlier_success_does_not_close_half_open(self):
+        earlier, probe = self.half_open_with_earlier_request()
+        self.breaker.after(earlier, "ok")
+        self.assertEqual(self.breaker.state("tasks"), HALF_OPEN)
+        self.breaker.after(probe, "ok")
+        self.assertEqual(self.breaker.state("tasks"), CLOSED)
+
+    def test_earlier_unsent_request_does_not_free_a_probe(self):
+        earlier, probe = self.half_open_with_earlier_request()
+        self.breaker.after(earlier, None)
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before("tasks")
+
+    def test_listener_errors_are_contained(self):
+        self.breaker.add_listener(lambda *change: 1 / 0)
+        with self.assertLogs("wrike.circuit_breaker", "ERROR"):
+            self.fail("tasks", 4)
+        self.assertEqual(self.breaker.state("tasks"), OPEN)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_rate=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(half_open_probes=0)
+
+
+class TestAdapterCircuit(TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(min_requests=2, stale_cache=10)
+        self.wrike = Wrike(circuit_breaker=self.breaker)
+
+    def test_open_circuit_fails_fast(self):
+        with mock.patch(
+            "requests.Session.request", return_value=response(503)
+        ) as request:
+            for _ in range(2):
+                with self.assertRaises(TransientWrikeException):
+                    self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAA")
+            with self.assertRaises(CircuitOpenException):
+                self.wrike._rest_adapter.put("folders/IEAAAAAQI4AAAAAB")
+        self.assertEqual(request.call_count, 2)
+
+    def test_stale_response_served_while_open(self):
+        with mock.patch("requests.Session.request", return_value=response(200)):
+            fresh = self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAA")
+        self.assertFalse(fresh.stale)
+        # One failure in two requests opens it
+        with mock.patch("requests.Session.request", return_value=response(503)):
+            with self.assertRaises(TransientWrikeException):
+                self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        with mock.patch("requests.Session.request") as request:
+            stale = self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAA")
+            with self.assertRaises(CircuitOpenException):
+                self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        request.assert_not_called()
+        self.assertTrue(stale.stale)
+        self.assertEqual(stale.data, fresh.data)
+        self.assertEqual(self.breaker.stale_served, 1)
+
+    def test_downloads_go_through_the_circuit(self):
+        adapter = self.wrike._rest_adapter
+        failed = response(503)
+        failed.raw = io.BytesIO()
+        with mock.patch("requests.Session.request", return_value=failed) as request:
+            for _ in range(2):
+                with self.assertRaises(TransientWrikeException):
+                    list(adapter.stream("attachments/IEAAAAAQI4AAAAAA/download"))
+            with self.assertRaises(CircuitOpenException):
+                list(adapter.stream("attachments/IEAAAAAQI4AAAAAB/download"))
+            # Files outside the API have a circuit per host
+            url = "https://storage.example.com/export/tasks.csv"
+            for _ in range(2):
+                with self.assertRaises(TransientWrikeException):
+                    list(adapter.stream(url))
+            with self.assertRaises(CircuitOpenException):
+                list(adapter.stream("https://storage.example.com/export/folders.csv"))
+        self.assertEqual(request.call_count, 4)
+        self.assertEqual(self.breaker.state("storage.example.com"), OPEN)
+
+    def test_off_by_default(self):
+        self.assertIsNone(Wrike().circuit_breaker)
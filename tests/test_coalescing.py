@@ -0,0 +1,130 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.coalescing import WriteBehindBuffer, merge_fields
+from wrike.exceptions import WrikeException
+from wrike.models import Result, Task
+
+
+def entity(endpoint, data=None):
+    # Answers in the kind of the endpoint, e.g. a "folders" record for "folders/f1"
+    kind, id = endpoint.split("/")
+    record = {"id": id, "title": "test", "scope": "test"}
+    if kind == "folders":
+        record["childIds"] = []
+    else:
+        record.update(
+            status="test",
+            importance="test",
+            dates="test",
+            permalink="test",
+            priority="test",
+        )
+    return Result(200, headers={}, data={"kind": kind, "data": [record]})
+
+
+class TestMergeFields(TestCase):
+    def test_later_plain_fields_win(self):
+        self.assertEqual(
+            merge_fields({"status": "Active"}, {"status": "Completed"}),
+            {"status": "Completed"},
+        )
+
+    def test_add_and_remove_lists_accumulate_and_cancel(self):
+        pending = merge_fields({}, {"addResponsibles": ["a", "b"]})
+        merge_fields(pending, {"addResponsibles": ["c"], "removeResponsibles": ["b"]})
+        self.assertEqual(
+            pending, {"addResponsibles": ["a", "c"], "removeResponsibles": ["b"]}
+        )
+
+    def test_custom_fields_merge_by_id(self):
+        pending = merge_fields(
+            {}, {"customFields": [{"id": "x", "value": "1"}, {"id": "y", "value": "1"}]}
+        )
+        merge_fields(pending, {"customFields": [{"id": "x", "value": "2"}]})
+        self.assertEqual(
+            pending["customFields"],
+            [{"id": "x", "value": "2"}, {"id": "y", "value": "1"}],
+        )
+
+
+class TestWriteBehindBuffer(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+        self.wrike._rest_adapter.put.side_effect = entity
+
+    def test_updates_within_the_interval_become_one_put(self):
+        with self.wrike.write_behind(flush_interval=0.1) as buffer:
+            futures = [
+                buffer.update("tasks", "t1", status="Completed"),
+                buffer.update("tasks", "t1", customFields=[{"id": "c", "value": "v"}]),
+                buffer.update("tasks", "t1", addResponsibles=["u1"]),
+            ]
+            models = [future.result(timeout=2) for future in futures]
+        self.assertTrue(all(isinstance(model, Task) for model in models))
+        self.wrike._rest_adapter.put.assert_called_once_with(
+            endpoint="tasks/t1",
+            data={
+                "status": "Completed",
+                "customFields": [{"id": "c", "value": "v"}],
+                "addResponsibles": ["u1"],
+            },
+        )
+        self.assertEqual((buffer.updates, buffer.writes), (3, 1))
+
+    def test_entities_are_written_separately(self):
+        with self.wrike.write_behind(flush_interval=0.05) as buffer:
+            buffer.update("tasks", "t1", title="a")
+            buffer.update("folders", "f1", title="b")
+        endpoints = sorted(
+            c.kwargs["endpoint"] for c in self.wrike._rest_adapter.put.call_args_list
+        )
+        self.assertEqual(endpoints, ["folders/f1", "tasks/t1"])
+
+    def test_flush_sends_immediately(self):
+        buffer = self.wrike.write_behind(flush_interval=60)
+        future = buffer.update("tasks", "t1", title="a")
+        buffer.flush(timeout=2)
+        self.assertTrue(future.done())
+        buffer.close()
+
+    def test_close_writes_everything_and_rejects_new_updates(self):
+        buffer = self.wrike.write_behind(flush_interval=60)
+        future = buffer.update("tasks", "t1", title="a")
+        buffer.close()
+        self.assertEqual(future.result(timeout=0).id, "t1")
+        with self.assertRaises(WrikeException):
+            buffer.update("tasks", "t1", title="b")
+
+    def test_failures_reach_every_merged_caller(self):
+        self.wrike._rest_adapter.put.side_effect = WrikeException("400: Bad Request")
+        with self.wrike.write_behind(flush_interval=0.05) as buffer:
+            futures = [buffer.update("tasks", "t1", title=str(i)) for i in range(3)]
+        for future in futures:
+            with self.assertRaises(WrikeException):
+                future.result(timeout=0)
+
+    def test_writes_of_one_entity_never_overlap(self):
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def write(entity, id, fields):
+            with lock:
+                overlaps.append(bool(active))
+                active.append(id)
+            time.sleep(0.05)
+            with lock:
+                active.remove(id)
+            return fields
+
+        with WriteBehindBuffer(write, flush_interval=0.01) as buffer:
+            first = buffer.update("tasks", "t1", title="a")
+            time.sleep(0.03)
+            second = buffer.update("tasks", "t1", title="b")
+        self.assertEqual(first.result(timeout=0), {"title": "a"})
+        self.assertEqual(second.result(timeout=0), {"title": "b"})
+        self.assertFalse(any(overlaps))
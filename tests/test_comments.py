@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.models import Comment, Result
+
+
+def comments(*ids):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "comments",
+            "data": [
+                {
+                    "id": id,
+                    "authorId": "u1",
+                    "text": f"comment {id}",
+                    "createdDate": "2024-01-01T00:00:00Z",
+                    "taskId": "t1",
+                }
+                for id in ids
+            ],
+        },
+    )
+
+
+class TestComments(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+
+    def endpoints(self):
+        return [
+            (call.kwargs["endpoint"], call.kwargs["ep_params"])
+            for call in self.wrike._rest_adapter.get.call_args_list
+        ]
+
+    def test_get_comments(self):
+        self.wrike._rest_adapter.get.return_value = comments("c1")
+        comment_list = self.wrike.get_comments()
+        self.assertEqual(self.endpoints(), [("comments", None)])
+        self.assertIsInstance(comment_list[0], Comment)
+        self.assertEqual(comment_list[0].author_id, "u1")
+        self.assertEqual(comment_list[0].task_id, "t1")
+
+    def test_harvest_from_tasks_folders_and_ids(self):
+        self.wrike._rest_adapter.get.side_effect = lambda endpoint, ep_params: (
+            comments(endpoint)
+        )
+        harvested = []
+        count = self.wrike.harvest_comments(
+            harvested.append,
+            task_ids=["t1", "t2"],
+            folder_ids=["f1"],
+            comment_ids=[str(i) for i in range(150)],
+        )
+        self.assertEqual(count, 5)
+        self.assertEqual(
+            sorted(comment.id for comment in harvested),
+            sorted(
+                [
+                    "tasks/t1/comments",
+                    "tasks/t2/comments",
+                    "folders/f1/comments",
+                    f"comments/{','.join(str(i) for i in range(100))}",
+                    f"comments/{','.join(str(i) for i in range(100, 150))}",
+                ]
+            ),
+        )
+
+    def test_account_wide_range_is_split_into_disjoint_windows(self):
+        self.wrike._rest_adapter.get.return_value = comments()
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.wrike.harvest_comments(
+            lambda comment: None, start=start, end=start + timedelta(days=10)
+        )
+        windows = sorted(
+            (json.loads(ep_params["updatedDate"]) for _, ep_params in self.endpoints()),
+            key=lambda window: window["start"],
+        )
+        self.assertEqual(
+            windows,
+            [
+                {"start": "2024-01-01T00:00:00Z", "end": "2024-01-07T23:59:59Z"},
+                {"start": "2024-01-08T00:00:00Z", "end": "2024-01-11T00:00:00Z"},
+            ],
+        )
+
+    def test_non_positive_window_is_rejected(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for window in (timedelta(0), timedelta(days=-1)):
+            with self.subTest(window=window):
+                with self.assertRaises(ValueError):
+                    self.wrike.iter_comments(start=start, window=window)
+        self.wrike._rest_adapter.get.assert_not_called()
+
+    def test_sink_runs_on_consumer_thread(self):
+        self.wrike._rest_adapter.get.return_value = comments("c1")
+        threads = set()
+        self.wrike.harvest_comments(
+            lambda comment: threads.add(threading.get_ident()),
+            task_ids=["t1", "t2", "t3"],
+        )
+        self.assertEqual(threads, {threading.get_ident()})
@@ -0,0 +1,174 @@
+from datetime import date, datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.conversion import (
+    dump,
+    enum_converter,
+    intern_id,
+    parse_date,
+    parse_datetime,
+)
+from wrike.identity_map import IdentityMap
+from wrike.models import Comment, Importance, Result, Scope, Status, Task, TaskScope
+from wrike.paging import Batch
+
+
+def task_record(**overrides):
+    data = {
+        "kind": "tasks",
+        "id": "t1",
+        "accountId": "".join(["IEAA", "AAAQ"]),
+        "title": "Task",
+        "status": "Active",
+        "importance": "High",
+        "createdDate": "2024-01-31T12:00:00Z",
+        "updatedDate": "2024-02-01T08:30:00Z",
+        "dates": {"type": "Planned"},
+        "scope": "WsTask",
+        "permalink": "https://www.wrike.com/open.htm?id=1",
+        "priority": "1",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestConversion(TestCase):
+    def test_parse_datetime(self):
+        parsed = parse_datetime("2024-01-31T12:00:00Z")
+        self.assertEqual(parsed, datetime(2024, 1, 31, 12, tzinfo=timezone.utc))
+        self.assertIs(parse_datetime("2024-01-31T12:00:00Z"), parsed)
+        self.assertEqual(
+            parse_datetime("2024-01-31T12:00:00"),
+            datetime(2024, 1, 31, 12, tzinfo=timezone.utc),
+        )
+
+    def test_unparseable_values_pass_through(self):
+        self.assertEqual(parse_datetime("c"), "c")
+        self.assertEqual(parse_date("c"), "c")
+        self.assertEqual(enum_converter(Status)("Paused"), "Paused")
+        self.assertEqual(enum_converter(Status)(["Active"]), ["Active"])
+
+    def test_parse_date(self):
+        self.assertEqual(parse_date("2024-01-31"), date(2024, 1, 31))
+
+    def test_enum_converter(self):
+        self.assertIs(enum_converter(Scope)("WsFolder"), Scope.WS_FOLDER)
+
+    def test_intern_id(self):
+        a = "".join(["KUAA", "AAAA"])
+        b = "".join(["KUAA", "AAAA"])
+        self.assertIsNot(a, b)
+        self.assertIs(intern_id(a), intern_id(b))
+        self.assertIsNone(intern_id(None))
+
+    def test_dump(self):
+        self.assertEqual(dump(Status.ACTIVE), "Active")
+        self.assertEqual(
+            dump(parse_datetime("2024-01-31T12:00:00Z")), "2024-01-31T12:00:00Z"
+        )
+        self.assertEqual(dump(date(2024, 1, 31)), "2024-01-31")
+        self.assertEqual(dump("x"), "x")
+
+
+class TestModelConversion(TestCase):
+    def test_off_keeps_strings(self):
+        task = Task.from_dict(task_record())
+        self.assertEqual(task.status, "Active")
+        self.assertEqual(task.created_date, "2024-01-31T12:00:00Z")
+
+    def test_eager(self):
+        task = Task.constructor("eager")(task_record())
+        self.assertIs(task.status, Status.ACTIVE)
+        self.assertIs(task.importance, Importance.HIGH)
+        self.assertIs(task.scope, TaskScope.WS_TASK)
+        self.assertEqual(task.created_date.year, 2024)
+        self.assertIsNone(task.completed_date)
+        self.assertIs(
+            task.account_id, Task.constructor("eager")(task_record()).account_id
+        )
+
+    def test_lazy_converts_on_first_access(self):
+        task = Task.constructor("lazy")(task_record())
+        self.assertNotIn("status", task.__dict__)
+        self.assertIsNone(task.completed_date)
+        self.assertIs(task.status, Status.ACTIVE)
+        self.assertIn("status", task.__dict__)
+        self.assertNotIn("_raw_status", task.__dict__)
+        with self.assertRaises(AttributeError):
+            task.missing
+
+    def test_all_conversions_build_equal_models(self):
+        eager = Task.constructor("eager")(task_record())
+        lazy = Task.constructor("lazy")(task_record())
+        for attr in ("status", "importance", "scope", "created_date", "account_id"):
+            self.assertEqual(getattr(lazy, attr), getattr(eager, attr))
+
+    def test_to_dict_dumps_wire_values(self):
+        data = task_record()
+        expected = {k: v for k, v in data.items() if k != "kind"}
+        expected.update(completedDate=None, customStatusId="")
+        for conversion in ("off", "eager", "lazy"):
+            with self.subTest(conversion=conversion):
+                task = Task.constructor(conversion)(data)
+                self.assertEqual(task.to_dict(), expected)
+
+    def test_unknown_conversion(self):
+        with self.assertRaises(ValueError):
+            Task.constructor("sometimes")
+        with self.assertRaises(ValueError):
+            Wrike(conversion="sometimes")
+
+    def test_identity_map_refreshes_lazy_fields(self):
+        identity_map = IdentityMap()
+        lazy = Task.constructor("lazy")
+        first = identity_map.merge(lazy(task_record()))
+        self.assertIs(first.status, Status.ACTIVE)
+        second = identity_map.merge(
+            lazy(task_record(status="Completed", updatedDate="2024-03-01T00:00:00Z"))
+        )
+        self.assertIs(second, first)
+        self.assertIs(first.status, Status.COMPLETED)
+
+    def test_client_builds_converted_models(self):
+        wrike = Wrike(conversion="eager")
+        wrike._rest_adapter = MagicMock()
+        wrike._rest_adapter.get.return_value = Result(
+            200,
+            headers={},
+            data={
+                "kind": "comments",
+                "data": [
+                    {
+                        "id": "c1",
+                        "authorId": "u1",
+                        "text": "Hi",
+                        "createdDate": "2024-01-31T12:00:00Z",
+                    }
+                ],
+            },
+        )
+        (comment,) = wrike._models(wrike._get("comments"), Comment)
+        self.assertEqual(
+            comment.created_date, datetime(2024, 1, 31, 12, tzinfo=timezone.utc)
+        )
+
+    def test_filter_matches_wire_values_in_every_mode(self):
+        wrike = Wrike()
+        for conversion in ("off", "eager", "lazy"):
+            with self.subTest(conversion=conversion):
+                build = Task.constructor(conversion)
+                tasks = [build(task_record()), build(task_record(status="Completed"))]
+                matches = wrike._filter({"scope": "WsTask", "status": "Active"}, tasks)
+                self.assertEqual(matches, tasks[:1])
+                matches = wrike._filter(
+                    {"created_date": "2024-01-31T12:00:00Z", "title": "Task"}, tasks
+                )
+                self.assertEqual(len(matches), 2)
+                self.assertEqual(wrike._filter({"missing": None}, tasks), [])
+
+    def test_batch_columns_convert_lazy_fields(self):
+        lazy = Task.constructor("lazy")
+        columns = Batch([lazy(task_record())]).columns()
+        self.assertFalse([key for key in columns if key.startswith("_raw_")])
+        self.assertEqual(columns["status"], [Status.ACTIVE])
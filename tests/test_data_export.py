@@ -0,0 +1,115 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from wrike.api import Wrike
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import DataExport, Result
+
+CSV = {
+    "https://export/tasks.csv": b"\xef\xbb\xbfid,title\r\nt1,First\r\nt2,Second\r\nt3,Third\r\n",
+    "https://export/folders.csv": b"id,title\r\nf1,Folder\r\n",
+}
+
+
+def export(status="Completed"):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "data_export",
+            "data": [
+                {
+                    "id": "e1",
+                    "status": status,
+                    "resources": [
+                        {"name": "tasks", "url": "https://export/tasks.csv"},
+                        {"name": "folders", "url": "https://export/folders.csv"},
+                    ],
+                }
+            ],
+        },
+    )
+
+
+def stream(url, chunk_size):
+    body = CSV[url]
+    for i in range(0, len(body), chunk_size):
+        yield body[i : i + chunk_size]
+
+
+class TestDataExport(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+        self.wrike._rest_adapter.stream.side_effect = stream
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def downloader(self):
+        self.wrike._rest_adapter.get.return_value = export()
+        return self.wrike.data_export_downloader(
+            self.wrike.get_data_export(), self.directory.name, chunk_size=4
+        )
+
+    def test_download_all_resources(self):
+        downloader = self.downloader()
+        paths = downloader.download()
+        self.assertEqual(sorted(paths), ["folders", "tasks"])
+        with open(paths["folders"], "rb") as file:
+            self.assertEqual(file.read(), CSV["https://export/folders.csv"])
+        self.assertEqual(downloader.bytes_downloaded, sum(map(len, CSV.values())))
+        self.assertFalse(
+            any(name.endswith(".part") for name in os.listdir(self.directory.name))
+        )
+
+    def test_records_and_batches(self):
+        downloader = self.downloader()
+        self.assertEqual(
+            [record["title"] for record in downloader.records("tasks")],
+            ["First", "Second", "Third"],
+        )
+        self.assertEqual(
+            list(downloader.batches("tasks", batch_size=2)),
+            [
+                {"id": ["t1", "t2"], "title": ["First", "Second"]},
+                {"id": ["t3"], "title": ["Third"]},
+            ],
+        )
+
+    def test_process_in_parallel(self):
+        counts = self.downloader().process(
+            lambda name, records: sum(1 for _ in records)
+        )
+        self.assertEqual(counts, {"tasks": 3, "folders": 1})
+
+    @patch("wrike.deadlines.time.sleep")
+    def test_interrupted_download_restarts(self, sleep):
+        def flaky(url, chunk_size):
+            yield b"id,ti"
+            raise TransientWrikeException("Download interrupted")
+
+        self.wrike._rest_adapter.stream.side_effect = [
+            flaky("", 0),
+            stream("https://export/folders.csv", 4),
+        ]
+        downloader = self.downloader()
+        path = downloader.download(["folders"])["folders"]
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), CSV["https://export/folders.csv"])
+
+    def test_incomplete_export_is_rejected(self):
+        with self.assertRaises(WrikeException):
+            self.wrike.data_export_downloader(
+                DataExport("e1", "InProgress", kind="data_export"), self.directory.name
+            )
+
+    @patch("wrike.async_jobs.time.sleep")
+    def test_refresh_and_wait(self, sleep):
+        self.wrike._rest_adapter.post.return_value = export("InProgress")
+        self.wrike._rest_adapter.get.side_effect = [export("InProgress"), export()]
+        finished = self.wrike.wait_for_data_export(refresh=True)
+        self.assertEqual(finished.status, "Completed")
+        self.assertEqual(
+            self.wrike._rest_adapter.get.call_args.kwargs["endpoint"], "data_export/e1"
+        )
@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from unittest import TestCase, mock
+import requests
+from wrike import deadlines
+from wrike.api import Wrike
+from wrike.deadlines import CancellationToken, Deadline
+from wrike.exceptions import (
+    TransientWrikeException,
+    WrikeCancelledException,
+    WrikeTimeoutException,
+)
+from wrike.fan_out import fan_out
+from wrike.scheduling import RequestScheduler
+
+
+def task(id):
+    fields = ("title", "status", "importance", "dates", "scope", "permalink")
+    return {"id": id, "priority": "test", **dict.fromkeys(fields, "test")}
+
+
+def response(data, next_page_token=""):
+    result = requests.Response()
+    result.status_code = 200
+    result._content = json.dumps(
+        {
+            "kind": "tasks",
+            "nextPageToken": next_page_token,
+            "responseSize": 2,
+            "data": data,
+        }
+    ).encode()
+    return result
+
+
+class TestDeadline(TestCase):
+    def test_nested_deadline_never_outlives_its_parent(self):
+        with deadlines.deadline(1.0) as outer:
+            with deadlines.deadline(60.0) as inner:
+                self.assertIs(deadlines.current(), inner)
+                self.assertLessEqual(inner.remaining(), 1.0)
+            self.assertIs(deadlines.current(), outer)
+        self.assertIsNone(deadlines.current())
+
+    def test_parent_token_cancels_nested_deadline(self):
+        token = CancellationToken()
+        inner = Deadline(parent=Deadline(token=token))
+        inner.check()
+        token.cancel("Shutting down")
+        with self.assertRaisesRegex(WrikeCancelledException, "Shutting down"):
+            inner.check()
+
+    def test_sleep_past_the_deadline_raises_at_once(self):
+        start = time.monotonic()
+        with deadlines.deadline(0.5):
+            with self.assertRaises(WrikeTimeoutException):
+                deadlines.sleep(10)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_cancel_wakes_a_sleep(self):
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+        start = time.monotonic()
+        with deadlines.deadline(token=token):
+            with self.assertRaises(WrikeCancelledException):
+                deadlines.sleep(5)
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_timeout_is_transient(self):
+        self.assertTrue(issubclass(WrikeTimeoutException, TransientWrikeException))
+        self.assertFalse(issubclass(WrikeCancelledException, TransientWrikeException))
+
+
+class TestRequestTimeouts(TestCase):
+    def setUp(self):
+        self.wrike = Wrike(retry_backoff=0)
+
+    def test_default_timeouts_are_sent(self):
+        with mock.patch(
+            "requests.Session.request", return_value=response([])
+        ) as request:
+            self.wrike._rest_adapter.get("tasks")
+        self.assertEqual(request.call_args.kwargs["timeout"], (10.0, 120.0))
+
+    def test_timeouts_are_capped_by_the_deadline(self):
+        with mock.patch(
+            "requests.Session.request", return_value=response([])
+        ) as request:
+            self.wrike._rest_adapter.get("tasks", timeout=2.0)
+        connect, read = request.call_args.kwargs["timeout"]
+        self.assertLessEqual(connect, 2.0)
+        self.assertLessEqual(read, 2.0)
+
+    def test_timed_out_request_raises_timeout_exception(self):
+        with mock.patch(
+            "requests.Session.request", side_effect=requests.exceptions.ReadTimeout
+        ):
+            with self.assertRaises(WrikeTimeoutException):
+                self.wrike._rest_adapter.get("tasks")
+
+    def test_expired_deadline_is_not_sent(self):
+        with mock.patch("requests.Session.request") as request:
+            with self.wrike.deadline(0.0):
+                with self.assertRaises(WrikeTimeoutException):
+                    self.wrike._rest_adapter.get("tasks")
+        request.assert_not_called()
+
+    def test_pager_keeps_its_deadline_after_the_block(self):
+        token = CancellationToken()
+        with self.wrike.deadline(token=token):
+            pager = self.wrike.get_tasks_paged()
+        with mock.patch(
+            "requests.Session.request",
+            side_effect=[response([task(1)], "t2"), response([task(2)])],
+        ) as request:
+            next(pager)
+            token.cancel()
+            with self.assertRaises(WrikeCancelledException):
+                next(pager)
+        self.assertEqual(request.call_count, 1)
+
+
+class TestPropagation(TestCase):
+    def test_fan_out_workers_share_the_deadline(self):
+        seen = []
+
+        def source():
+            seen.append(deadlines.current())
+            yield 1
+
+        with deadlines.deadline(30) as active:
+            list(fan_out([source, source], max_workers=2))
+        self.assertEqual(seen, [active, active])
+
+    def test_fan_out_consumer_stops_when_cancelled(self):
+        token = CancellationToken()
+        release = threading.Event()
+
+        def source():
+            release.wait(2)
+            yield 1
+
+        threading.Timer(0.05, token.cancel).start()
+        with deadlines.deadline(token=token):
+            with self.assertRaises(WrikeCancelledException):
+                list(fan_out([source]))
+        release.set()
+
+    def test_queued_request_is_cancelled(self):
+        scheduler = RequestScheduler(max_concurrency=1, interactive_reserved=0)
+        scheduler.acquire()
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+        with deadlines.deadline(token=token):
+            with self.assertRaises(WrikeCancelledException):
+                scheduler.acquire()
+        self.assertEqual(scheduler.queued, 0)
+        self.assertEqual(scheduler.in_flight["interactive"], 1)
@@ -0,0 +1,89 @@
+import json
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.decoding import DecodePool
+from wrike.exceptions import WrikeException
+from wrike.models import Folder, Result
+
+PAYLOAD = {
+    "kind": "folders",
+    "nextPageToken": "next",
+    "responseSize": 3,
+    "data": [
+        {"id": "a", "title": "a", "childIds": [], "scope": "WsFolder"},
+        {"id": "b", "title": "b", "childIds": ["a"], "scope": "WsFolder", "color": "x"},
+        {"id": "c", "title": "c", "childIds": [], "scope": "WsRoot"},
+    ],
+}
+CONTENT = json.dumps(PAYLOAD).encode()
+
+
+class TestDecodePool(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.pool = DecodePool(max_workers=1, min_bytes=0)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.pool.close()
+
+    def test_decode_builds_the_same_models_as_in_process(self):
+        envelope, folders = self.pool.decode(CONTENT, Folder)
+        expected = [Folder(**datum) for datum in Result(200, {}, data=PAYLOAD).data]
+        self.assertEqual(envelope["nextPageToken"], "next")
+        self.assertTrue(all(isinstance(folder, Folder) for folder in folders))
+        self.assertEqual(
+            [folder.__dict__ for folder in folders],
+            [folder.__dict__ for folder in expected],
+        )
+
+    def test_decode_without_model_returns_records(self):
+        envelope, records = self.pool.decode(CONTENT)
+        self.assertEqual(envelope["kind"], "folders")
+        self.assertEqual(records, PAYLOAD["data"])
+
+    def test_pool_is_reused_across_calls(self):
+        self.pool.decode(CONTENT, Folder)
+        executor = self.pool._executor
+        self.pool.decode(CONTENT, Folder)
+        self.assertIs(self.pool._executor, executor)
+
+    def test_bad_json_raises_wrike_exception(self):
+        for pool in (self.pool, DecodePool()):
+            with self.subTest(in_process=pool is not self.pool):
+                with self.assertRaises(WrikeException):
+                    pool.decode(b"{not json", Folder)
+
+    def test_small_bodies_stay_in_process(self):
+        pool = DecodePool(min_bytes=len(CONTENT) + 1)
+        pool.decode(CONTENT, Folder)
+        self.assertIsNone(pool._executor)
+
+
+class TestWrikeDecodeWorkers(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike(page_size=3, decode_workers=1)
+        self.wrike._rest_adapter = MagicMock()
+        self.wrike._rest_adapter.get.return_value = Result(200, {}, content=CONTENT)
+
+    def tearDown(self) -> None:
+        self.wrike.close()
+
+    def test_get_folders_requests_raw_bodies_and_decodes_them(self):
+        folders = self.wrike.get_folders()
+        self.assertEqual([folder.id for folder in folders], ["a", "b", "c"])
+        self.assertTrue(self.wrike._rest_adapter.get.call_args.kwargs["raw"])
+
+    def test_paging_reads_the_envelope_from_the_decoded_body(self):
+        pager = self.wrike._page("folders", Folder, max_amt=3)
+        self.assertEqual(len(list(pager)), 3)
+        self.assertEqual(pager.next_page_token, "next")
+
+    def test_strict_validation_checks_decoded_bodies(self):
+        wrike = Wrike(decode_workers=1, validation="strict")
+        wrike._rest_adapter = MagicMock()
+        wrike._rest_adapter.get.return_value = Result(200, {}, content=CONTENT)
+        with self.assertRaises(WrikeException):
+            wrike.get_contacts()
+        wrike.close()
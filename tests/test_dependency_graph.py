@@ -0,0 +1,133 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.dependency_graph import DependencyGraph
+from wrike.exceptions import WrikeException
+from wrike.models import Result, Task
+
+
+def dependencies(*edges):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "dependencies",
+            "data": [
+                {
+                    "id": f"d-{pred}-{succ}",
+                    "predecessorId": pred,
+                    "successorId": succ,
+                    "relationType": "FinishToStart",
+                }
+                for pred, succ in edges
+            ],
+        },
+    )
+
+
+def task(id, duration, dependency_ids=None):
+    fields = {} if dependency_ids is None else {"dependencyIds": dependency_ids}
+    return Task(
+        id,
+        id,
+        "Active",
+        "Normal",
+        {"type": "Planned", "duration": duration},
+        "WsTask",
+        "",
+        "",
+        kind="tasks",
+        **fields,
+    )
+
+
+class TestDependencyGraph(TestCase):
+    def test_topological_order(self):
+        graph = DependencyGraph()
+        graph.add_dependency("c", "d")
+        graph.add_dependency("a", "b")
+        graph.add_dependency("b", "c")
+        graph.add_dependency("a", "c")
+        self.assertEqual(graph.topological_order(), ["a", "b", "c", "d"])
+
+    def test_cycles(self):
+        graph = DependencyGraph()
+        graph.add_dependency("a", "b")
+        graph.add_dependency("b", "c")
+        graph.add_dependency("c", "a")
+        graph.add_dependency("c", "d")
+        graph.add_dependency("e", "e")
+        self.assertTrue(graph.has_cycle())
+        self.assertEqual(
+            sorted(sorted(cycle) for cycle in graph.find_cycles()),
+            [["a", "b", "c"], ["e"]],
+        )
+        with self.assertRaises(WrikeException):
+            graph.topological_order()
+        self.assertTrue(graph.remove_dependency("c", "a"))
+        graph.remove_dependency("e", "e")
+        self.assertFalse(graph.has_cycle())
+        self.assertEqual(graph.find_cycles(), [])
+
+    def test_critical_path_relation_types(self):
+        graph = DependencyGraph()
+        for task_id, duration in [("a", 60), ("b", 30), ("c", 120), ("d", 10)]:
+            graph.add_task(task_id, duration)
+        graph.add_dependency("a", "b", lag_time=15)
+        graph.add_dependency("a", "c", "StartToStart", 30)
+        graph.add_dependency("b", "d")
+        graph.add_dependency("c", "d", "FinishToFinish")
+        # b: 75..105, c: 30..150, d finishes with c at 150
+        self.assertEqual(graph.critical_path(), (150, ["a", "c", "d"]))
+        graph.add_task("b", 200)
+        self.assertEqual(graph.critical_path(), (285, ["a", "b", "d"]))
+
+    def test_long_chain(self):
+        graph = DependencyGraph()
+        for i in range(50000):
+            graph.add_task(str(i), 1)
+            if i:
+                graph.add_dependency(str(i - 1), str(i))
+        self.assertEqual(graph.find_cycles(), [])
+        length, path = graph.critical_path()
+        self.assertEqual(length, 50000)
+        self.assertEqual(len(path), 50000)
+
+    def test_unknown_relation_type(self):
+        with self.assertRaises(ValueError):
+            DependencyGraph().add_dependency("a", "b", "Finish")
+
+
+class TestGetDependencies(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+
+    def test_get_dependency_graph(self):
+        def get(endpoint, ep_params=None, raw=False):
+            if endpoint == "dependencies/d-a-b,d-b-c":
+                return dependencies(("a", "b"), ("b", "c"))
+            if endpoint == "tasks/c/dependencies":
+                return dependencies(("b", "c"))
+            raise AssertionError(endpoint)
+
+        self.wrike._rest_adapter.get.side_effect = get
+        tasks = [
+            task("a", 60, ["d-a-b"]),
+            task("b", 60, ["d-a-b", "d-b-c"]),
+            task("c", 30),
+        ]
+        graph = self.wrike.get_dependency_graph(tasks)
+        self.assertEqual(graph.edge_count, 2)
+        self.assertEqual(graph.critical_path(), (150, ["a", "b", "c"]))
+
+    def test_ids_are_chunked(self):
+        self.wrike._rest_adapter.get.return_value = dependencies()
+        self.wrike.get_dependencies(dependency_ids=[str(i) for i in range(250)])
+        endpoints = [
+            call.kwargs["endpoint"]
+            for call in self.wrike._rest_adapter.get.call_args_list
+        ]
+        self.assertEqual(
+            sorted(len(endpoint.split(",")) for endpoint in endpoints), [50, 100, 100]
+        )
@@ -0,0 +1,110 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.fan_out import fan_out
+from wrike.models import Result, Task
+
+
+def task_page(ids, next_page_token="", response_size=0):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "tasks",
+            "nextPageToken": next_page_token,
+            "responseSize": response_size,
+            "data": [
+                {
+                    "id": id,
+                    "title": "test",
+                    "status": "test",
+                    "importance": "test",
+                    "dates": "test",
+                    "scope": "test",
+                    "permalink": "test",
+                    "priority": "test",
+                }
+                for id in ids
+            ],
+        },
+    )
+
+
+class TestFanOut(TestCase):
+    def test_ordered_yields_sources_in_order(self):
+        def slow_first():
+            time.sleep(0.05)
+            yield from [1, 2]
+
+        items = list(fan_out([slow_first, lambda: iter([3, 4])], ordered=True))
+        self.assertEqual(items, [1, 2, 3, 4])
+
+    def test_as_completed_yields_every_item(self):
+        sources = [lambda i=i: iter(range(i * 10, i * 10 + 10)) for i in range(20)]
+        items = list(fan_out(sources, max_workers=4))
+        self.assertEqual(sorted(items), list(range(200)))
+
+    def test_max_amt_caps_items_across_sources(self):
+        sources = [lambda: iter(range(100)) for _ in range(10)]
+        self.assertEqual(len(list(fan_out(sources, max_amt=150))), 150)
+
+    def test_max_workers_bounds_concurrency(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def source():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+            yield 1
+
+        list(fan_out([source] * 12, max_workers=3))
+        self.assertLessEqual(max(peak), 3)
+
+    def test_source_exception_reaches_consumer(self):
+        def broken():
+            yield 1
+            raise ValueError("broken")
+
+        with self.assertRaises(ValueError):
+            list(fan_out([broken], ordered=True))
+
+
+class TestTasksInFolders(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike(page_size=2)
+        self.wrike._rest_adapter = MagicMock()
+
+    def test_get_tasks_in_folders_pages_each_folder(self):
+        pages = {
+            ("folders/a/tasks", ""): task_page(["a1", "a2"], "ta", 3),
+            ("folders/a/tasks", "ta"): task_page(["a3"]),
+            ("folders/b/tasks", ""): task_page(["b1"], "", 1),
+        }
+
+        def get(endpoint, ep_params):
+            return pages[(endpoint, ep_params.get("nextPageToken", ""))]
+
+        self.wrike._rest_adapter.get.side_effect = get
+        tasks = list(self.wrike.get_tasks_in_folders(["a", "b"], ordered=True))
+        self.assertTrue(all(isinstance(task, Task) for task in tasks))
+        self.assertEqual([task.id for task in tasks], ["a1", "a2", "a3", "b1"])
+
+    def test_get_tasks_in_folders_enforces_global_max_amt(self):
+        self.wrike._rest_adapter.get.side_effect = lambda endpoint, ep_params: (
+            task_page([f"{endpoint}-1", f"{endpoint}-2"], "", 2)
+        )
+        tasks = list(
+            self.wrike.get_tasks_in_folders([str(i) for i in range(10)], max_amt=5)
+        )
+        self.assertEqual(len(tasks), 5)
+
+    def test_get_tasks_in_spaces_requires_list(self):
+        with self.assertRaises(TypeError):
+            self.wrike.get_tasks_in_spaces("space")
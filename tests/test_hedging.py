@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+from unittest import TestCase, mock
+import requests
+from wrike.api import Wrike
+from wrike.exceptions import WrikeException
+from wrike.hedging import HedgePolicy
+
+
+def response(id, status_code=200):
+    result = requests.Response()
+    result.status_code = status_code
+    result.reason = "OK" if status_code == 200 else "Not Found"
+    result._content = json.dumps({"kind": "folders", "data": [{"id": id}]}).encode()
+    return result
+
+
+class TestHedgePolicy(TestCase):
+    def test_no_delay_until_enough_samples(self):
+        policy = HedgePolicy(min_samples=3)
+        policy.record("folders/IEAAAAAQI4AAAAAA", 0.1)
+        policy.record("folders/IEAAAAAQI4AAAAAB", 0.2)
+        self.assertIsNone(policy.delay("folders/IEAAAAAQI4AAAAAC"))
+        policy.record("folders/IEAAAAAQI4AAAAAD", 0.3)
+        self.assertEqual(policy.delay("folders/IEAAAAAQI4AAAAAC"), 0.3)
+        self.assertIsNone(policy.delay("tasks"))
+
+    def test_delay_is_the_percentile(self):
+        policy = HedgePolicy(percentile=90, min_samples=10, refresh=1)
+        for latency in range(1, 101):
+            policy.record("folders", latency / 100)
+        self.assertEqual(policy.delay("folders"), 0.9)
+
+    def test_budget_caps_hedges(self):
+        policy = HedgePolicy(budget=0.1)
+        hedges = 0
+        for _ in range(100):
+            policy.delay("folders")
+            hedges += policy.try_hedge()
+        self.assertEqual(hedges, 10)
+        self.assertEqual(policy.over_budget, 90)
+        self.assertEqual(policy.metrics()["hedge_rate"], 0.1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            HedgePolicy(percentile=100)
+        with self.assertRaises(ValueError):
+            HedgePolicy(budget=2)
+
+
+class TestHedgedGet(TestCase):
+    def setUp(self):
+        self.policy = HedgePolicy(min_samples=1, budget=1.0, min_delay=0.02)
+        self.policy.record("folders/IEAAAAAQI4AAAAAA", 0.02)
+        self.wrike = Wrike(hedging=self.policy)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def send(self, *responses, slow=0.5):
+        # The first copy is slow, every later one answers at once
+        def request(*args, **kwargs):
+            with self.lock:
+                call = self.calls
+                self.calls += 1
+            if call == 0:
+                time.sleep(slow)
+            return responses[min(call, len(responses) - 1)]
+
+        return mock.patch("requests.Session.request", side_effect=request)
+
+    def test_hedge_answers_first(self):
+        # The slow GET already sent still runs to the end, but its answer is dropped
+        with self.send(response("slow"), response("hedge"), slow=0.2):
+            result = self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        self.assertEqual(result.data[0]["id"], "hedge")
+        self.assertEqual(self.calls, 2)
+        metrics = self.wrike.hedging.metrics()
+        self.assertEqual((metrics["hedges"], metrics["hedge_wins"]), (1, 1))
+        self.assertEqual(metrics["win_rate"], 1.0)
+
+    def test_fast_response_is_not_hedged(self):
+        with self.send(response("fast"), slow=0):
+            result = self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        self.assertEqual(result.data[0]["id"], "fast")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.policy.hedges, 0)
+
+    def test_no_hedge_over_budget(self):
+        self.policy.budget = 0.0
+        with self.send(response("slow"), slow=0.1):
+            result = self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        self.assertEqual(result.data[0]["id"], "slow")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.policy.over_budget, 1)
+
+    def test_failed_hedge_waits_for_the_original(self):
+        with self.send(response("slow"), response("hedge", 404), slow=0.1):
+            result = self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        self.assertEqual(result.data[0]["id"], "slow")
+        self.assertEqual(self.policy.hedge_wins, 0)
+
+    def test_both_failing_raises(self):
+        with self.send(response("slow", 404), response("hedge", 404), slow=0.1):
+            with self.assertRaises(WrikeException):
+                self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+
+    def test_off_by_default(self):
+        self.assertIsNone(Wrike().hedging)
+
+    def test_copies_share_the_call_timeout(self):
+        with self.send(response("slow"), response("hedge"), slow=0.3) as request:
+            self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB", timeout=5.0)
+        # The hedge, sent later, gets what is left of the same 5 seconds
+        first, second = [call.kwargs["timeout"][1] for call in request.call_args_list]
+        self.assertLess(second, first)
+
+    def test_close_stops_the_hedging_threads(self):
+        executor = self.wrike._rest_adapter._hedge_executor
+        with self.send(response("slow"), response("hedge"), slow=0.1):
+            self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        self.wrike.close()
+        self.assertTrue(executor._shutdown)
+        self.assertIsNot(self.wrike._rest_adapter._hedge_executor, executor)
+
+    def test_get_is_sent_from_the_calling_thread(self):
+        threads = []
+
+        def request(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return response("fast")
+
+        with mock.patch("requests.Session.request", side_effect=request):
+            self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_busy_hedging_pool_does_not_hold_gets_back(self):
+        self.policy.max_workers = 1
+        self.wrike = Wrike(hedging=self.policy)
+        # Its only thread is taken by a hedge that never ends
+        release = threading.Event()
+        self.wrike._rest_adapter._hedge_executor.submit(release.wait)
+        start = time.monotonic()
+        try:
+            with self.send(response("fast"), slow=0):
+                for _ in range(5):
+                    self.wrike._rest_adapter.get("folders/IEAAAAAQI4AAAAAB")
+        finally:
+            release.set()
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(self.policy.hedges, 0)
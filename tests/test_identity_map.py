@@ -0,0 +1,86 @@
+import gc
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.identity_map import IdentityMap
+from wrike.models import Folder, Result, Space
+
+
+def folders(*titles, updated="2024-01-02T00:00:00Z"):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "folders",
+            "data": [
+                {
+                    "id": f"f{i}",
+                    "title": title,
+                    "childIds": [],
+                    "scope": "WsFolder",
+                    "updatedDate": updated,
+                }
+                for i, title in enumerate(titles)
+            ],
+        },
+    )
+
+
+class TestIdentityMap(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike(identity_map=True)
+        self.wrike._rest_adapter = MagicMock()
+
+    def test_same_id_returns_same_instance_updated_in_place(self):
+        self.wrike._rest_adapter.get.return_value = folders("old")
+        first = self.wrike.get_folder_by_id("f0")
+        self.wrike._rest_adapter.get.return_value = folders("new", "other")
+        listed = self.wrike.get_folders()
+        self.assertIs(listed[0], first)
+        self.assertEqual(first.title, "new")
+        self.assertEqual(self.wrike.identity_map.hits, 1)
+        self.assertEqual(self.wrike.identity_map.misses, 2)
+        self.assertAlmostEqual(self.wrike.identity_map.hit_rate, 1 / 3)
+
+    def test_older_copies_do_not_overwrite_fresher_ones(self):
+        self.wrike._rest_adapter.get.return_value = folders(
+            "new", updated="2024-02-01T00:00:00Z"
+        )
+        folder = self.wrike.get_folder_by_id("f0")
+        self.wrike._rest_adapter.get.return_value = folders(
+            "stale", updated="2024-01-01T00:00:00Z"
+        )
+        self.assertIs(self.wrike.get_folder_by_id("f0"), folder)
+        self.assertEqual(folder.title, "new")
+
+    def test_unused_instances_are_collected(self):
+        identity_map = IdentityMap()
+        identity_map.merge(Folder("f0", "title", [], "WsFolder", kind="folders"))
+        gc.collect()
+        self.assertEqual(len(identity_map), 0)
+
+    def test_models_of_different_classes_do_not_collide(self):
+        identity_map = IdentityMap()
+        folder = identity_map.merge(
+            Folder("x", "title", [], "WsFolder", kind="folders")
+        )
+        space = identity_map.merge(
+            Space("x", "title", "", "Public", False, None, "", "", kind="spaces")
+        )
+        self.assertIsNot(folder, space)
+        self.assertIs(identity_map.get(Space, "x"), space)
+
+    def test_sessions_have_their_own_map(self):
+        self.wrike._rest_adapter.get.return_value = folders("title")
+        session = self.wrike.session()
+        self.assertIs(session._rest_adapter, self.wrike._rest_adapter)
+        self.assertIsNot(
+            session.get_folder_by_id("f0"), self.wrike.get_folder_by_id("f0")
+        )
+
+    def test_identity_map_is_off_by_default(self):
+        wrike = Wrike()
+        wrike._rest_adapter = MagicMock()
+        wrike._rest_adapter.get.return_value = folders("title")
+        self.assertIsNone(wrike.identity_map)
+        self.assertIsNot(wrike.get_folder_by_id("f0"), wrike.get_folder_by_id("f0"))
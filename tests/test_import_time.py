@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Generous next to the ~30 ms measured, but far below the ~200 ms it cost when
+# requests and multiprocessing were imported up front
+IMPORT_BUDGET = 0.15
+
+
+def run(script):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+CLIENT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import wrike
+client = wrike.Wrike(api_key="token")
+print(json.dumps({
+    "elapsed": time.perf_counter() - start,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+class TestImportTime(TestCase):
+    def test_import_wrike_loads_no_submodules(self):
+        modules = run("import json, sys, wrike; print(json.dumps(sorted(sys.modules)))")
+        self.assertEqual([m for m in modules if m.startswith("wrike.")], [])
+        self.assertNotIn("requests", modules)
+
+    def test_client_defers_heavy_dependencies(self):
+        modules = run(CLIENT_SCRIPT)["modules"]
+        self.assertIn("wrike.api", modules)
+        for heavy in ("requests", "urllib3", "multiprocessing"):
+            self.assertNotIn(heavy, modules)
+
+    def test_lazy_attributes(self):
+        result = run(
+            "import json, wrike; "
+            "print(json.dumps([wrike.Wrike.__module__, wrike.models.__name__, "
+            "wrike.WrikeException.__name__, 'Wrike' in dir(wrike)]))"
+        )
+        self.assertEqual(result, ["wrike.api", "wrike.models", "WrikeException", True])
+
+    def test_unknown_attribute(self):
+        import wrike
+
+        with self.assertRaises(AttributeError):
+            wrike.Nope
+
+    def test_import_time_budget(self):
+        # Fastest of a few fresh interpreters, so one slow start does not fail the test
+        elapsed = min(run(CLIENT_SCRIPT)["elapsed"] for _ in range(3))
+        self.assertLess(elapsed, IMPORT_BUDGET)
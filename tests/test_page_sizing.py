@@ -0,0 +1,135 @@
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike import deadlines
+from wrike.api import Wrike
+from wrike.exceptions import TransientWrikeException, WrikeTimeoutException
+from wrike.page_sizing import PageSizeTuner, endpoint_group
+from tests.test_paging import task_page
+
+
+class TestPageSizeTuner(TestCase):
+    def test_endpoint_group(self):
+        self.assertEqual(
+            endpoint_group("folders/IEAAAAAQI4AAAAAA/tasks"), "folders/*/tasks"
+        )
+        self.assertEqual(
+            endpoint_group("/tasks/IEAAAAAQKQAAAAAA,IEAAAAAQKQAAAAAB"), "tasks/*"
+        )
+        self.assertEqual(endpoint_group("tasks"), "tasks")
+
+    def test_slow_pages_shrink_by_at_most_half(self):
+        tuner = PageSizeTuner(min_size=10, max_size=1000, target_latency=1.0)
+        self.assertEqual(tuner.page_size("tasks"), 1000)
+        self.assertEqual(tuner.observe("tasks", 1000, 100.0), 500)
+        self.assertEqual(tuner.observe("tasks", 500, 50.0), 250)
+        self.assertEqual(tuner.page_size("tasks"), 250)
+        self.assertEqual([d[3] for d in tuner.decisions], [500, 250])
+
+    def test_fast_pages_grow_up_to_max_size(self):
+        tuner = PageSizeTuner(min_size=10, max_size=1000, target_latency=1.0)
+        tuner.failed("tasks")
+        tuner.failed("tasks")
+        self.assertEqual(tuner.page_size("tasks"), 250)
+        self.assertEqual(tuner.observe("tasks", 250, 0.01), 500)
+        self.assertEqual(tuner.observe("tasks", 500, 0.01), 1000)
+        self.assertEqual(tuner.observe("tasks", 1000, 0.01), 1000)
+
+    def test_large_payloads_shrink(self):
+        tuner = PageSizeTuner(min_size=10, max_size=1000, max_bytes=1000)
+        self.assertEqual(tuner.observe("tasks", 1000, 0.01, payload_bytes=4000), 500)
+
+    def test_endpoint_groups_are_tuned_separately(self):
+        tuner = PageSizeTuner(
+            min_size=10, max_size=1000, bounds={"folders/*/tasks": (50, 200)}
+        )
+        self.assertEqual(tuner.page_size("folders/IEAAAAAQI4AAAAAA/tasks"), 200)
+        for _ in range(5):
+            tuner.failed("folders/IEAAAAAQI4AAAAAB/tasks")
+        self.assertEqual(tuner.page_size("folders/IEAAAAAQI4AAAAAA/tasks"), 50)
+        self.assertEqual(tuner.page_size("tasks"), 1000)
+
+    def test_empty_pages_are_ignored(self):
+        tuner = PageSizeTuner()
+        self.assertEqual(tuner.observe("tasks", 0, 10.0), 1000)
+        self.assertEqual(len(tuner.decisions), 0)
+
+    def test_changes_are_logged(self):
+        tuner = PageSizeTuner(min_size=10)
+        with self.assertLogs("wrike.page_sizing", "INFO") as logs:
+            tuner.failed("tasks")
+        self.assertIn("tasks: 1000 -> 500", logs.output[0])
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            PageSizeTuner(min_size=100, max_size=10)
+
+
+class TestAdaptivePager(TestCase):
+    def setUp(self) -> None:
+        self.tuner = PageSizeTuner(min_size=1, max_size=4, target_latency=1.0)
+        self.wrike = Wrike(page_size=4, retry_backoff=0, adaptive_page_size=self.tuner)
+        self.wrike._rest_adapter = MagicMock()
+
+    def test_page_size_follows_the_tuner(self):
+        sizes = []
+
+        def get(endpoint, ep_params):
+            sizes.append(ep_params["pageSize"])
+            # Every page is too slow, so the next one is halved
+            self.tuner.target_latency = 0.0
+            start = sum(sizes[:-1])
+            ids = list(range(start + 1, min(start + ep_params["pageSize"], 7) + 1))
+            return task_page(ids, "" if ids[-1] == 7 else f"t{len(sizes)}", 7)
+
+        self.wrike._rest_adapter.get.side_effect = get
+        pager = self.wrike.get_tasks_paged()
+        ids = [task.id for task in pager]
+        self.assertEqual(ids, [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(sizes, [4, 2, 1])
+        self.assertEqual(pager.cursor.amt_fetched, 6)
+
+    def test_last_page_uses_the_next_page_size(self):
+        self.tuner.target_latency = 0.0
+        self.wrike._rest_adapter.get.return_value = task_page([1, 2, 3, 4], "t2", 10)
+        pager = self.wrike.get_tasks_paged()
+        next(pager)
+        # 6 records left at the halved size of 2
+        self.assertEqual(pager.cursor.curr_page, 1)
+        self.assertEqual(pager.cursor.last_page, 4)
+
+    def test_transient_errors_shrink_the_page(self):
+        self.wrike._rest_adapter.get.side_effect = [
+            TransientWrikeException("504: Gateway Timeout", status_code=504),
+            task_page([1, 2], "", 2),
+        ]
+        self.assertEqual(len(list(self.wrike.get_tasks_paged())), 2)
+        calls = self.wrike._rest_adapter.get.call_args_list
+        self.assertEqual(calls[-1].kwargs["ep_params"]["pageSize"], 2)
+
+    def test_throttling_keeps_the_page_size(self):
+        self.wrike._rest_adapter.get.side_effect = [
+            TransientWrikeException("429: Too Many Requests", status_code=429),
+            task_page([1, 2], "", 2),
+        ]
+        self.assertEqual(len(list(self.wrike.get_tasks_paged())), 2)
+        calls = self.wrike._rest_adapter.get.call_args_list
+        self.assertEqual(calls[-1].kwargs["ep_params"]["pageSize"], 4)
+
+    def test_expired_deadline_is_not_retried(self):
+        def get(endpoint, ep_params):
+            time.sleep(0.06)
+            raise WrikeTimeoutException("Request timed out")
+
+        self.wrike._rest_adapter.get.side_effect = get
+        with deadlines.deadline(0.05):
+            with self.assertRaises(WrikeTimeoutException):
+                list(self.wrike.get_tasks_paged())
+        self.assertEqual(self.wrike._rest_adapter.get.call_count, 1)
+        self.assertEqual(self.tuner.page_size("tasks"), 4)
+
+    def test_fixed_page_size_by_default(self):
+        self.assertIsNone(Wrike().page_sizer)
+        self.assertEqual(
+            Wrike(page_size=50, adaptive_page_size=True).page_sizer.max_size, 50
+        )
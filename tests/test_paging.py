@@ -0,0 +1,139 @@
+import json
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import Result, Task
+from wrike.paging import Batch, PageCursor, Pager
+
+
+def task_page(ids, next_page_token="", response_size=0):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": "tasks",
+            "nextPageToken": next_page_token,
+            "responseSize": response_size,
+            "data": [
+                {
+                    "id": id,
+                    "title": "test",
+                    "status": "test",
+                    "importance": "test",
+                    "dates": "test",
+                    "scope": "test",
+                    "permalink": "test",
+                    "priority": "test",
+                }
+                for id in ids
+            ],
+        },
+    )
+
+
+PAGES = {
+    "": task_page([1, 2], "t2", 5),
+    "t2": task_page([3, 4], "t3", 5),
+    "t3": task_page([5], "", 5),
+}
+
+
+def get(endpoint, ep_params):
+    return PAGES[ep_params.get("nextPageToken", "")]
+
+
+class TestPaging(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike(page_size=2, retry_backoff=0)
+        self.wrike._rest_adapter = MagicMock()
+        self.wrike._rest_adapter.get.side_effect = get
+
+    def test_pager_yields_every_page(self):
+        pager = self.wrike.get_tasks_paged()
+        self.assertIsInstance(pager, Pager)
+        tasks = list(pager)
+        self.assertIsInstance(tasks[0], Task)
+        self.assertEqual([task.id for task in tasks], [1, 2, 3, 4, 5])
+        self.assertEqual(self.wrike._rest_adapter.get.call_count, 3)
+
+    def test_cursor_is_json_serializable(self):
+        pager = self.wrike.get_tasks_paged()
+        next(pager)
+        cursor = json.loads(json.dumps(pager.cursor.to_dict()))
+        self.assertEqual(cursor["amt_yielded"], 1)
+        self.assertEqual(cursor["next_page_token"], "t2")
+        self.assertEqual(cursor["ep_params"], {})
+        self.assertEqual(cursor["model"], "Task")
+
+    def test_resume_mid_page_continues_where_it_left_off(self):
+        pager = self.wrike.get_tasks_paged()
+        ids = [next(pager).id for _ in range(3)]
+        cursor = json.dumps(pager.cursor.to_dict())
+        resumed = self.wrike.resume_paged(json.loads(cursor))
+        ids += [task.id for task in resumed]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+        self.assertEqual(resumed.amt_yielded, 5)
+
+    def test_resume_respects_max_amt(self):
+        pager = self.wrike.get_tasks_paged(max_amt=3)
+        next(pager)
+        resumed = self.wrike.resume_paged(pager.cursor)
+        self.assertEqual([task.id for task in resumed], [2, 3])
+
+    def test_resume_with_unknown_model_raises_value_error(self):
+        cursor = PageCursor("tasks", "NotAModel")
+        with self.assertRaises(ValueError):
+            self.wrike.resume_paged(cursor)
+
+    def test_transient_errors_are_retried_inside_the_page_loop(self):
+        self.wrike._rest_adapter.get.side_effect = [
+            PAGES[""],
+            TransientWrikeException("503: Service Unavailable", status_code=503),
+            PAGES["t2"],
+            PAGES["t3"],
+        ]
+        self.assertEqual(len(list(self.wrike.get_tasks_paged())), 5)
+
+    def test_transient_errors_raise_after_retries(self):
+        self.wrike._rest_adapter.get.side_effect = TransientWrikeException(
+            "Request failed"
+        )
+        with self.assertRaises(TransientWrikeException):
+            list(self.wrike.get_tasks_paged())
+        self.assertEqual(self.wrike._rest_adapter.get.call_count, 4)
+
+    def test_other_errors_are_not_retried(self):
+        self.wrike._rest_adapter.get.side_effect = WrikeException("400: Bad Request")
+        with self.assertRaises(WrikeException):
+            list(self.wrike.get_tasks_paged())
+        self.assertEqual(self.wrike._rest_adapter.get.call_count, 1)
+
+    def test_batches_default_to_one_batch_per_page(self):
+        batches = list(self.wrike.get_tasks_paged().batches())
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertIsInstance(batches[0], Batch)
+        self.assertEqual(batches[0].response_size, 5)
+        self.assertEqual(batches[0].next_page_token, "t2")
+        self.assertEqual(batches[0].pages, 1)
+        self.assertGreaterEqual(batches[0].fetch_latency, 0.0)
+
+    def test_batches_are_rechunked_across_pages(self):
+        batches = list(self.wrike.get_task_batches(batch_size=3))
+        self.assertEqual(
+            [[t.id for t in batch] for batch in batches], [[1, 2, 3], [4, 5]]
+        )
+        self.assertEqual(batches[0].pages, 2)
+
+    def test_raw_batches_skip_models_and_give_columns(self):
+        batch = next(self.wrike.get_task_batches(batch_size=5, raw=True))
+        self.assertIsInstance(batch.items[0], dict)
+        columns = batch.columns()
+        self.assertEqual(columns["id"], [1, 2, 3, 4, 5])
+        self.assertNotIn("next_page_token", columns)
+
+    def test_batches_respect_max_amt_and_update_cursor(self):
+        pager = self.wrike.get_tasks_paged(max_amt=3)
+        batches = list(pager.batches(batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(pager.amt_yielded, 3)
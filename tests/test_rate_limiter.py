@@ -0,0 +1,20 @@
+import time
+from unittest import TestCase
+from wrike.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+    def test_burst_is_not_delayed(self):
+        limiter = RateLimiter(rate=10, burst=5)
+        self.assertEqual(sum(limiter.acquire() for _ in range(5)), 0)
+
+    def test_requests_beyond_the_burst_wait_for_the_rate(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
@@ -1,7 +1,8 @@
+import io
 import requests
 from requests.exceptions import RequestException
 from unittest import TestCase, mock
-from wrike.exceptions import WrikeException
+from wrike.exceptions import TransientWrikeException, WrikeException
 from wrike.models import Result
 from wrike.rest_adapter import RestAdapter
 
@@ -17,54 +18,93 @@ class TestRestAdapter(TestCase):
     def test__do_good_request_returns_result(self):
         self.response.status_code = 200
         self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
             result = self.rest_adapter._do("GET", "")
             self.assertIsInstance(result, Result)
 
     def test__do_bad_request_raises_wrike_exception(self):
-        with mock.patch("requests.request", side_effect=RequestException):
+        with mock.patch("requests.Session.request", side_effect=RequestException):
             with self.assertRaises(WrikeException):
                 self.rest_adapter._do("GET", "")
 
     def test__do_bad_json_raises_wrike_exception(self):
         bad_json = '{"some bad json": '
         self.response._content = bad_json
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
             with self.assertRaises(WrikeException):
                 self.rest_adapter._do("GET", "")
 
     def test__do_300_or_higher_raises_wrike_exception(self):
         self.response.status_code = 300
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
             with self.assertRaises(WrikeException):
                 self.rest_adapter._do("GET", "")
 
+    def test__do_500_or_higher_raises_transient_wrike_exception(self):
+        self.response.status_code = 503
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertRaises(TransientWrikeException) as cm:
+                self.rest_adapter._do("GET", "")
+            self.assertEqual(cm.exception.status_code, 503)
+
+    def test__do_429_raises_transient_wrike_exception_with_retry_after(self):
+        self.response.status_code = 429
+        self.response.headers["Retry-After"] = "7"
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertRaises(TransientWrikeException) as cm:
+                self.rest_adapter._do("GET", "")
+            self.assertEqual(cm.exception.retry_after, 7.0)
+
     def test__do_199_or_lower_raises_wrike_exception(self):
         self.response.status_code = 199
-        with mock.patch("requests.request", return_value=self.response):
+        with mock.patch("requests.Session.request", return_value=self.response):
             with self.assertRaises(WrikeException):
                 self.rest_adapter._do("GET", "")
 
     def test_get_method_passes_in_get(self):
         self.response.status_code = 200
         self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response) as request:
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
             self.rest_adapter.get("")
             self.assertTrue(request.method, "GET")
 
     def test_post_method_passes_in_post(self):
         self.response.status_code = 200
         self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response) as request:
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
             self.rest_adapter.post("")
             self.assertTrue(request.method, "POST")
 
     def test_delete_method_passes_in_delete(self):
         self.response.status_code = 200
         self.response._content = "{}".encode()
-        with mock.patch("requests.request", return_value=self.response) as request:
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
             self.rest_adapter.delete("")
             self.assertTrue(request.method, "DELETE")
 
+    def test_stream_yields_chunks_and_keeps_token_on_api_host(self):
+        self.response.status_code = 200
+        self.response.raw = io.BytesIO(b"id,title\r\nt1,First\r\n")
+        with mock.patch(
+            "requests.Session.request", return_value=self.response
+        ) as request:
+            chunks = list(self.rest_adapter.stream("https://export/tasks.csv", 8))
+            self.assertEqual(b"".join(chunks), b"id,title\r\nt1,First\r\n")
+            self.assertEqual(len(chunks), 3)
+            self.assertNotIn("Authorization", request.call_args.kwargs["headers"])
+
+    def test_stream_404_raises_wrike_exception(self):
+        self.response.status_code = 404
+        self.response.raw = io.BytesIO(b"")
+        with mock.patch("requests.Session.request", return_value=self.response):
+            with self.assertRaises(WrikeException):
+                list(self.rest_adapter.stream("attachments/a1/download"))
+
     # def test_fetch_data(self):
     #     self.fail()
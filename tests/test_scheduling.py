@@ -0,0 +1,116 @@
+import threading
+import time
+from unittest import TestCase, mock
+import requests
+from wrike.api import Wrike
+from wrike.rate_limiter import RateLimiter
+from wrike.rest_adapter import RestAdapter
+from wrike.scheduling import RequestScheduler
+
+
+def start(target, *args):
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.001)
+
+
+class TestRequestScheduler(TestCase):
+    def test_batch_cannot_take_reserved_slots(self):
+        scheduler = RequestScheduler(max_concurrency=2, interactive_reserved=1)
+        scheduler.acquire("batch")
+        admitted = []
+        start(lambda: admitted.append(scheduler.acquire("batch")))
+        wait_until(lambda: scheduler.queued == 1)
+        # The reserved slot is free for an interactive request
+        scheduler.acquire("interactive")
+        self.assertEqual(scheduler.in_flight, {"interactive": 1, "batch": 1})
+        self.assertEqual(admitted, [])
+        scheduler.release("interactive")
+        scheduler.release("batch")
+        wait_until(lambda: admitted)
+        self.assertEqual(scheduler.in_flight["batch"], 1)
+
+    def test_interactive_goes_to_the_front_of_the_queue(self):
+        scheduler = RequestScheduler(max_concurrency=1, interactive_reserved=0)
+        scheduler.acquire("batch")
+        order = []
+
+        def request(priority):
+            scheduler.acquire(priority)
+            order.append(priority)
+            scheduler.release(priority)
+
+        threads = [start(request, "batch") for _ in range(3)]
+        wait_until(lambda: scheduler.queued == 3)
+        threads.append(start(request, "interactive"))
+        wait_until(lambda: scheduler.queued == 4)
+        scheduler.release("batch")
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(order, ["interactive", "batch", "batch", "batch"])
+        self.assertEqual(scheduler.admitted, {"interactive": 1, "batch": 4})
+
+    def test_interactive_takes_the_next_rate_token(self):
+        scheduler = RequestScheduler(rate_limiter=RateLimiter(rate=50, burst=1))
+        scheduler.acquire("batch")
+        order = []
+
+        def request(priority):
+            scheduler.acquire(priority)
+            order.append(priority)
+
+        threads = [start(request, "batch"), start(request, "batch")]
+        wait_until(lambda: scheduler.queued == 2)
+        threads.append(start(request, "interactive"))
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(order[0], "interactive")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RequestScheduler(max_concurrency=2, interactive_reserved=2)
+        with self.assertRaises(ValueError):
+            RequestScheduler().acquire("urgent")
+        with self.assertRaises(ValueError):
+            RestAdapter(priority="urgent")
+
+
+class TestPriorityHandles(TestCase):
+    def setUp(self):
+        self.response = requests.Response()
+        self.response.status_code = 200
+        self.response._content = b'{"kind": "version", "data": []}'
+
+    def test_requests_use_the_handle_lane(self):
+        wrike = Wrike(max_concurrency=4)
+        batch = wrike.batch()
+        scheduler = wrike._rest_adapter.scheduler
+        self.assertIs(batch._rest_adapter.scheduler, scheduler)
+        self.assertIs(batch._rest_adapter._local, wrike._rest_adapter._local)
+        with mock.patch("requests.Session.request", return_value=self.response):
+            batch._rest_adapter.get("version")
+            wrike._rest_adapter.get("version")
+            wrike._rest_adapter.get("version", priority="batch")
+        self.assertEqual(scheduler.admitted, {"interactive": 1, "batch": 2})
+        self.assertEqual(scheduler.in_flight, {"interactive": 0, "batch": 0})
+
+    def test_slot_released_when_request_fails(self):
+        adapter = RestAdapter(max_concurrency=1, interactive_reserved=0)
+        with mock.patch(
+            "requests.Session.request",
+            side_effect=requests.exceptions.ConnectionError,
+        ):
+            with self.assertRaises(Exception):
+                adapter.get("version")
+        self.assertEqual(adapter.scheduler.in_flight["interactive"], 0)
+
+    def test_no_scheduler_without_limits(self):
+        self.assertIsNone(RestAdapter().scheduler)
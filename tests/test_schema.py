@@ -0,0 +1,125 @@
+import inspect
+from unittest import TestCase
+from wrike import models
+from wrike.models import Folder, Method
+from wrike.schema import REQUIRED, Field, compile_from_dict
+
+MODELS = [
+    model
+    for model in vars(models).values()
+    if isinstance(model, type) and issubclass(model, Method) and model is not Method
+]
+
+
+def record(model, full=True):
+    # Required fields always, optional ones only when full, plus a key outside the schema
+    data = {
+        "kind": model._expected_kind,
+        "state": "",
+        "next_page_token": "",
+        "response_size": 0,
+    }
+    for i, field in enumerate(model._schema):
+        if full or field.default is REQUIRED:
+            data[field.wire] = f"value-{i}"
+    data["extraKey"] = "extra"
+    return data
+
+
+class TestSchema(TestCase):
+    def test_from_dict_matches_constructor_for_every_model(self):
+        self.assertGreater(len(MODELS), 10)
+        for model in MODELS:
+            for full in (True, False):
+                with self.subTest(model=model.__name__, full=full):
+                    data = record(model, full)
+                    expected = model(**data).__dict__
+                    built = model.from_dict(data)
+                    self.assertIs(type(built), model)
+                    self.assertEqual(built.__dict__, expected)
+
+    def test_schema_matches_constructor_signature(self):
+        # The schema and the hand-written __init__ describe the same fields, keep them in step
+        for model in MODELS:
+            with self.subTest(model=model.__name__):
+                signature = inspect.signature(model.__init__).parameters.values()
+                parameters = {
+                    parameter.name: parameter.default
+                    for parameter in signature
+                    if parameter.name != "self"
+                    and parameter.kind != parameter.VAR_KEYWORD
+                }
+                self.assertEqual(
+                    set(parameters), {field.wire for field in model._schema}
+                )
+                for field in model._schema:
+                    default = parameters[field.wire]
+                    if field.default is REQUIRED:
+                        self.assertIs(default, inspect.Parameter.empty, field.wire)
+                    elif field.default_factory is not None:
+                        # None when __init__ builds the fresh value itself
+                        self.assertIn(
+                            default, (None, field.default_factory()), field.wire
+                        )
+                    else:
+                        self.assertEqual(default, field.default, field.wire)
+
+    def test_to_dict_round_trips(self):
+        for model in MODELS:
+            with self.subTest(model=model.__name__):
+                data = record(model)
+                dumped = model.from_dict(data).to_dict()
+                envelope = {"kind", "state", "next_page_token", "response_size"}
+                self.assertEqual(
+                    dumped, {k: v for k, v in data.items() if k not in envelope}
+                )
+
+    def test_record_is_not_modified(self):
+        data = record(Folder)
+        copy = dict(data)
+        Folder.from_dict(data)
+        self.assertEqual(data, copy)
+
+    def test_missing_required_field(self):
+        with self.assertRaises(KeyError):
+            Folder.from_dict({"id": "f1", "title": "t", "childIds": []})
+
+    def test_converters_skip_defaults(self):
+        class Example:
+            pass
+
+        from_dict = compile_from_dict(
+            Example,
+            (
+                Field("count", default=REQUIRED, converter=int),
+                Field("sizeBytes", "size", default=None, converter=int),
+                Field("fileName", "name", default="", converter=str.upper),
+            ),
+        )
+        built = from_dict({"count": "3", "fileName": "a.txt"})
+        self.assertEqual(built.__dict__, {"count": 3, "name": "A.TXT", "size": None})
+
+    def test_mutable_defaults_are_not_shared(self):
+        data = record(Folder, full=False)
+        first, second = Folder.from_dict(data), Folder.from_dict(data)
+        self.assertEqual(first.custom_column_ids, [])
+        self.assertIsNot(first.custom_column_ids, second.custom_column_ids)
+        first.project.append("p1")
+        self.assertEqual(second.project, [])
+
+    def test_default_factory_with_converter(self):
+        class Example:
+            pass
+
+        for conversion in ("eager", "lazy", "off"):
+            with self.subTest(conversion=conversion):
+                from_dict = compile_from_dict(
+                    Example,
+                    (Field("tagIds", "tags", default_factory=list, converter=sorted),),
+                    conversion,
+                )
+                first, second = from_dict({}), from_dict({})
+                self.assertEqual(first.tags, [])
+                self.assertIsNot(first.tags, second.tags)
+                if conversion == "eager":
+                    self.assertEqual(from_dict({"tagIds": [2, 1]}).tags, [1, 2])
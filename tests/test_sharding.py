@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.models import Result, Task
+from wrike.sharding import DATE_FORMAT, Shard, time_windows
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=8)
+
+
+class FakeTasks:
+    def __init__(self, created_dates, page_size):
+        self.created_dates = created_dates
+        self.page_size = page_size
+        self.windows = []
+        self.lock = threading.Lock()
+
+    def get(self, endpoint, ep_params):
+        window = json.loads(ep_params["createdDate"])
+        with self.lock:
+            self.windows.append(window)
+        start = datetime.strptime(window["start"], DATE_FORMAT)
+        end = datetime.strptime(window["end"], DATE_FORMAT)
+        # Wrike date ranges include both ends
+        matches = [
+            id
+            for id, created in enumerate(self.created_dates)
+            if start <= created.replace(tzinfo=None) <= end
+        ]
+        offset = int(ep_params.get("nextPageToken") or 0)
+        page = matches[offset : offset + self.page_size]
+        next_offset = offset + self.page_size
+        return Result(
+            200,
+            headers={},
+            data={
+                "kind": "tasks",
+                "responseSize": len(matches),
+                "nextPageToken": str(next_offset) if next_offset < len(matches) else "",
+                "data": [
+                    {
+                        "id": str(id),
+                        "title": "test",
+                        "status": "test",
+                        "importance": "test",
+                        "dates": "test",
+                        "scope": "test",
+                        "permalink": "test",
+                        "priority": "test",
+                    }
+                    for id in page
+                ],
+            },
+        )
+
+
+class TestSharding(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike(page_size=5)
+        self.wrike._rest_adapter = MagicMock()
+
+    def use(self, created_dates):
+        fake = FakeTasks(created_dates, page_size=5)
+        self.wrike._rest_adapter.get.side_effect = fake.get
+        return fake
+
+    def test_time_windows_are_adjacent(self):
+        windows = time_windows(START, END, 4)
+        self.assertEqual(windows[0][0], START)
+        self.assertEqual(windows[-1][1], END)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(windows, windows[1:])))
+
+    def test_shard_split_halves_the_window(self):
+        left, right = Shard("createdDate", START, END).split()
+        self.assertEqual(left.end, right.start)
+        self.assertEqual(right.depth, 1)
+
+    def test_scan_yields_every_task_once(self):
+        dates = [START + timedelta(hours=3 * i) for i in range(60)]
+        self.use(dates)
+        tasks = list(self.wrike.scan_tasks(START, END, shards=4, max_workers=4))
+        self.assertTrue(all(isinstance(task, Task) for task in tasks))
+        self.assertEqual(sorted(int(task.id) for task in tasks), list(range(60)))
+
+    def test_records_on_window_boundaries_are_deduplicated(self):
+        # Day 2 is the boundary between the first and second of four windows
+        self.use([START + timedelta(days=2), START + timedelta(hours=1)])
+        scan = self.wrike.scan_tasks(START, END, shards=4)
+        self.assertEqual(len(list(scan)), 2)
+        self.assertEqual(scan.duplicates, 1)
+
+    def test_dense_windows_are_split_and_reported(self):
+        dense = [START + timedelta(minutes=i) for i in range(40)]
+        sparse = [START + timedelta(days=6, hours=i) for i in range(3)]
+        fake = self.use(dense + sparse)
+        reports = []
+        scan = self.wrike.scan_tasks(
+            START, END, shards=2, max_shard_size=10, progress=reports.append
+        )
+        self.assertEqual(len(list(scan)), 43)
+        self.assertIn("split", [report.state for report in reports])
+        self.assertGreater(scan.shards_split, 0)
+        self.assertEqual(
+            scan.shards_done, len([r for r in reports if r.state == "done"])
+        )
+        self.assertGreater(len(fake.windows), 2)
+
+    def test_partitions_multiply_shards(self):
+        fake = self.use([START])
+        list(
+            self.wrike.scan_tasks(START, END, shards=2, partitions=[{"a": 1}, {"a": 2}])
+        )
+        self.assertEqual(len(fake.windows), 4)
+
+    def test_max_amt_caps_unique_records(self):
+        self.use([START + timedelta(hours=i) for i in range(50)])
+        self.assertEqual(len(list(self.wrike.scan_tasks(START, END, max_amt=7))), 7)
+
+    def test_shard_failure_reaches_consumer(self):
+        self.wrike._rest_adapter.get.side_effect = ValueError("broken")
+        with self.assertRaises(ValueError):
+            list(self.wrike.scan_tasks(START, END, shards=2))
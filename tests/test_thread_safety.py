@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from unittest import TestCase
+from wrike.api import Wrike
+from wrike.models import Folder
+
+RESPONSE_DELAY = 0.02
+
+
+class FakeWrikeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        # Echo the requested folder id back so each caller can check it got its own data
+        folder_id = self.path.split("?")[0].rstrip("/").split("/")[-1]
+        time.sleep(RESPONSE_DELAY)
+        body = json.dumps(
+            {
+                "kind": "folders",
+                "data": [
+                    {
+                        "id": folder_id,
+                        "title": f"title-{folder_id}",
+                        "childIds": [],
+                        "scope": "WsFolder",
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestThreadSafety(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeWrikeHandler)
+        cls.server.daemon_threads = True
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.daemon = True
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.wrike = Wrike(api_key="test")
+        self.wrike._rest_adapter.url = (
+            f"http://127.0.0.1:{self.server.server_address[1]}/v4/"
+        )
+
+    def tearDown(self) -> None:
+        self.wrike.close()
+
+    def _fetch_all(self, ids, workers):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.wrike.get_folder_by_id, ids))
+
+    def test_shared_client_returns_each_caller_its_own_result(self):
+        ids = [f"folder{i}" for i in range(256)]
+        folders = self._fetch_all(ids, workers=64)
+        self.assertEqual(len(folders), len(ids))
+        for folder_id, folder in zip(ids, folders):
+            self.assertIsInstance(folder, Folder)
+            self.assertEqual(folder.id, folder_id)
+            self.assertEqual(folder.title, f"title-{folder_id}")
+
+    def test_one_session_per_thread(self):
+        self._fetch_all([f"folder{i}" for i in range(64)], workers=8)
+        self.assertLessEqual(len(self.wrike._rest_adapter._sessions), 8)
+
+    def test_throughput_scales_with_threads(self):
+        ids = [f"folder{i}" for i in range(32)]
+        start = time.perf_counter()
+        self._fetch_all(ids, workers=1)
+        serial = time.perf_counter() - start
+        start = time.perf_counter()
+        self._fetch_all(ids, workers=16)
+        parallel = time.perf_counter() - start
+        self.assertLess(parallel, serial / 3)
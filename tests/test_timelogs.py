@@ -0,0 +1,142 @@
+from datetime import date
+import json
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.models import Result, Timelog
+from wrike.timelogs import ALL, TimelogStore
+
+RECORDS = [
+    {
+        "id": "l1",
+        "taskId": "t1",
+        "userId": "u1",
+        "hours": 1.5,
+        "trackedDate": "2024-01-30",
+        "categoryId": "c1",
+    },
+    {
+        "id": "l2",
+        "taskId": "t2",
+        "userId": "u1",
+        "hours": 2,
+        "trackedDate": "2024-02-01",
+    },
+    {
+        "id": "l3",
+        "taskId": "t1",
+        "userId": "u2",
+        "hours": 0.25,
+        "trackedDate": "2024-02-01",
+        "categoryId": "c1",
+    },
+    {
+        "id": "l4",
+        "taskId": "t1",
+        "userId": "u1",
+        "hours": 1,
+        "trackedDate": "2024-02-05",
+        "categoryId": "c1",
+    },
+]
+
+
+def timelogs(records):
+    return Result(200, headers={}, data={"kind": "timelogs", "data": records})
+
+
+class TestTimelogStore(TestCase):
+    def setUp(self) -> None:
+        self.store = TimelogStore()
+        self.store.extend(RECORDS)
+
+    def test_columns(self):
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(list(self.store.minutes), [90, 120, 15, 60])
+        self.assertEqual(self.store.minutes.itemsize, 4)
+        self.assertEqual(self.store.user_ids.ids, ["u1", "u2"])
+        self.assertEqual(list(self.store.categories), [0, -1, 0, 0])
+        self.assertEqual(self.store.days[0], 19752)
+
+    def test_group_by(self):
+        self.assertEqual(self.store.group_by("user"), {"u1": 270, "u2": 15})
+        self.assertEqual(self.store.group_by("category"), {"c1": 165, None: 120})
+        self.assertEqual(self.store.group_by("month"), {"2024-01": 90, "2024-02": 195})
+        self.assertEqual(
+            self.store.group_by("week"),
+            {date(2024, 1, 29): 225, date(2024, 2, 5): 60},
+        )
+        self.assertEqual(
+            self.store.group_by("user", "task"),
+            {("u1", "t1"): 150, ("u1", "t2"): 120, ("u2", "t1"): 15},
+        )
+        self.assertEqual(
+            self.store.group_by("user", start=date(2024, 2, 1), end=date(2024, 2, 1)),
+            {"u1": 120, "u2": 15},
+        )
+        with self.assertRaises(ValueError):
+            self.store.group_by("hour")
+
+    def test_rollup(self):
+        self.assertEqual(
+            self.store.rollup("user", "category"),
+            {
+                ("u1", "c1"): 150,
+                ("u1", None): 120,
+                ("u2", "c1"): 15,
+                ("u1", ALL): 270,
+                ("u2", ALL): 15,
+                (ALL, ALL): 285,
+            },
+        )
+
+
+class TestLoadTimelogs(TestCase):
+    def setUp(self) -> None:
+        self.wrike = Wrike()
+        self.wrike._rest_adapter = MagicMock()
+
+    def test_windows_are_disjoint_and_loaded_concurrently(self):
+        def get(endpoint, ep_params=None):
+            window = json.loads(ep_params["trackedDate"])
+            return timelogs(
+                [
+                    r
+                    for r in RECORDS
+                    if window["start"] <= r["trackedDate"] <= window["end"]
+                ]
+            )
+
+        self.wrike._rest_adapter.get.side_effect = get
+        store = self.wrike.load_timelogs(
+            date(2024, 1, 29), date(2024, 2, 11), folder_id="f1", window_days=3
+        )
+        self.assertEqual(store.total_minutes, 285)
+        windows = sorted(
+            json.loads(call.kwargs["ep_params"]["trackedDate"])["start"]
+            for call in self.wrike._rest_adapter.get.call_args_list
+        )
+        self.assertEqual(
+            windows,
+            ["2024-01-29", "2024-02-01", "2024-02-04", "2024-02-07", "2024-02-10"],
+        )
+        self.assertEqual(
+            self.wrike._rest_adapter.get.call_args.kwargs["endpoint"],
+            "folders/f1/timelogs",
+        )
+
+    def test_window_days_below_one_is_rejected(self):
+        for window_days in (0, -1):
+            with self.subTest(window_days=window_days):
+                with self.assertRaises(ValueError):
+                    self.wrike.load_timelogs(
+                        date(2024, 1, 29), date(2024, 2, 11), window_days=window_days
+                    )
+        self.wrike._rest_adapter.get.assert_not_called()
+
+    def test_get_timelogs_paged(self):
+        self.wrike._rest_adapter.get.return_value = timelogs(RECORDS[:1])
+        timelog = list(self.wrike.get_timelogs_paged(task_id="t1"))[0]
+        self.assertIsInstance(timelog, Timelog)
+        self.assertEqual(timelog.hours, 1.5)
+        self.assertEqual(timelog.category_id, "c1")
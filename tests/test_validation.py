@@ -0,0 +1,72 @@
+import warnings
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrike.api import Wrike
+from wrike.exceptions import WrikeException
+from wrike.models import Folder, Result
+from wrike.warnings import KindWarning
+
+
+def folders(kind="folders", count=3):
+    return Result(
+        200,
+        headers={},
+        data={
+            "kind": kind,
+            "data": [
+                {"id": f"f{i}", "title": "title", "childIds": [], "scope": "WsFolder"}
+                for i in range(count)
+            ],
+        },
+    )
+
+
+class TestKindValidation(TestCase):
+    def wrike(self, validation):
+        wrike = Wrike(validation=validation)
+        wrike._rest_adapter = MagicMock()
+        return wrike
+
+    def test_matching_kind_does_not_warn(self):
+        wrike = self.wrike("warn_once")
+        wrike._rest_adapter.get.return_value = folders()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertIsInstance(wrike.get_folders()[0], Folder)
+
+    def test_warn_once_warns_once_per_mismatch(self):
+        wrike = self.wrike("warn_once")
+        wrike._rest_adapter.get.return_value = folders("tasks")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            wrike.get_folders()
+            wrike.get_folders()
+        self.assertEqual([w.category for w in caught], [KindWarning])
+
+    def test_strict_raises(self):
+        wrike = self.wrike("strict")
+        wrike._rest_adapter.get.return_value = folders("tasks")
+        with self.assertRaises(WrikeException):
+            wrike.get_folders()
+
+    def test_strict_ignores_empty_responses(self):
+        wrike = self.wrike("strict")
+        wrike._rest_adapter.get.return_value = folders("", count=0)
+        self.assertEqual(list(wrike._page("folders", Folder)), [])
+
+    def test_off_skips_check(self):
+        wrike = self.wrike("off")
+        wrike._rest_adapter.get.return_value = folders("tasks")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(len(wrike.get_folders()), 3)
+
+    def test_raw_pages_are_checked(self):
+        wrike = self.wrike("strict")
+        wrike._rest_adapter.get.return_value = folders("tasks")
+        with self.assertRaises(WrikeException):
+            list(wrike._page("folders", Folder).batches(raw=True))
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            Wrike(validation="sometimes")
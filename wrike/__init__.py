@@ -4,6 +4,70 @@ wrike.
 A Python JSON REST API wrapper for the Wrike API.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Zack Pelster"
 __credits__ = "Qorvo"
+
+# Public names and the submodule defining each. Nothing is imported until a name is
+# first read, so `import wrike` stays cheap for short-lived processes
+_LAZY_ATTRS = {
+    "Wrike": "wrike.api",
+    "RestAdapter": "wrike.rest_adapter",
+    "Result": "wrike.models",
+    "WrikeException": "wrike.exceptions",
+    "TransientWrikeException": "wrike.exceptions",
+    "NotFoundWrikeException": "wrike.exceptions",
+    "WrikeTimeoutException": "wrike.exceptions",
+    "WrikeCancelledException": "wrike.exceptions",
+    "CircuitOpenException": "wrike.exceptions",
+}
+_SUBMODULES = {
+    "adaptive",
+    "api",
+    "async_jobs",
+    "attachments",
+    "batching",
+    "bulk",
+    "circuit_breaker",
+    "coalescing",
+    "conversion",
+    "data_export",
+    "deadlines",
+    "decoding",
+    "dependency_graph",
+    "exceptions",
+    "fan_out",
+    "hedging",
+    "identity_map",
+    "lazy",
+    "models",
+    "page_sizing",
+    "paging",
+    "rate_limiter",
+    "rest_adapter",
+    "scheduling",
+    "schema",
+    "sharding",
+    "timelogs",
+    "warnings",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it, so the next read is a plain module attribute
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _SUBMODULES)
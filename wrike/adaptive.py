@@ -0,0 +1,135 @@
+from collections import deque
+import logging
+import threading
+import time
+from typing import Deque, Dict, Tuple
+
+_logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrency:
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_backoff: float = 0.9,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        history_size: int = 256,
+    ) -> None:
+        """Limit on requests in flight, tuned by additive increase, multiplicative
+            decrease (AIMD) from the outcome and latency of every response
+
+        Each successful response adds 1/limit, so the limit grows by about one per round
+        of requests. A 429 or a failed request cuts it by backoff. A smoothed latency
+        beyond latency_tolerance times the best latency seen means requests are queuing
+        at Wrike, and cuts it by the gentler latency_backoff; at min_limit the best
+        latency is reset to the smoothed one instead. Cuts are at most one per
+        smoothed latency, so a burst of failures from one round counts once.
+
+        Args:
+            initial_limit (int, optional): Starting limit. Defaults to 4.
+            min_limit (int, optional): Lowest limit. Defaults to 1.
+            max_limit (int, optional): Highest limit. Defaults to 32.
+            backoff (float, optional): Factor applied on a 429 or an error. Defaults to 0.5.
+            latency_backoff (float, optional): Factor applied when latency rises.
+                Defaults to 0.9.
+            latency_tolerance (float, optional): Smoothed latency, as a multiple of the
+                best latency, above which the limit is cut. Defaults to 2.0.
+            smoothing (float, optional): Weight of the newest sample in the smoothed
+                latency. Defaults to 0.2.
+            history_size (int, optional): Number of limit changes kept. Defaults to 256.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Expected 1 <= min_limit <= initial_limit <= max_limit, "
+                f"{min_limit}, {initial_limit}, {max_limit} were provided"
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_backoff = latency_backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial_limit)
+        self._last_cut = float("-inf")
+        self._lock = threading.Lock()
+        self.latency: float = None
+        self.best_latency: float = None
+        self.samples = 0
+        self.throttled = 0
+        self.errors = 0
+        # (monotonic time, new limit, reason) of every change of the integer limit
+        self.history: Deque[Tuple[float, int, str]] = deque(maxlen=history_size)
+        self.history.append((time.monotonic(), initial_limit, "initial"))
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _set(self, limit: float, reason: str) -> None:
+        previous = int(self._limit)
+        self._limit = min(self.max_limit, max(self.min_limit, limit))
+        if int(self._limit) != previous:
+            self.history.append((time.monotonic(), int(self._limit), reason))
+            _logger.debug(
+                msg=f"Concurrency limit {previous} -> {int(self._limit)} ({reason})"
+            )
+
+    def _cut(self, factor: float, reason: str, latency: float) -> None:
+        # Before any success there is no smoothed latency: the failing request's own
+        # latency stands in for the length of a round
+        window = self.latency if self.latency is not None else latency
+        now = time.monotonic()
+        if now - self._last_cut < window:
+            return
+        self._last_cut = now
+        self._set(self._limit * factor, reason)
+
+    def record(self, latency: float, outcome: str = "ok") -> None:
+        """Adjusts the limit from one response
+
+        Args:
+            latency (float): Seconds from sending the request to its response
+            outcome (str, optional): 'ok', 'throttled' for a 429, or 'error' for a
+                5xx or a failed connection. Defaults to 'ok'.
+        """
+        with self._lock:
+            self.samples += 1
+            if outcome == "throttled":
+                self.throttled += 1
+                self._cut(self.backoff, "throttled", latency)
+                return
+            if outcome == "error":
+                self.errors += 1
+                self._cut(self.backoff, "error", latency)
+                return
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.smoothing * (latency - self.latency)
+            if self.best_latency is None or latency < self.best_latency:
+                self.best_latency = latency
+            if self.latency > self.latency_tolerance * self.best_latency:
+                if int(self._limit) == self.min_limit:
+                    # Still slow with the fewest requests: the latency is the new normal
+                    self.best_latency = self.latency
+                self._cut(self.latency_backoff, "latency", latency)
+            else:
+                self._set(self._limit + 1 / self._limit, "increase")
+
+    def metrics(self) -> Dict:
+        """Current state, for dashboards and logs"""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "latency": self.latency,
+                "best_latency": self.best_latency,
+                "samples": self.samples,
+                "throttled": self.throttled,
+                "errors": self.errors,
+            }
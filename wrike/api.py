@@ -1,15 +1,46 @@
+import copy
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+import json
 import logging
-import math
-from typing import Callable, Iterator, List, Union, Any
+import mimetypes
+import os
+import sys
+from typing import Any, BinaryIO, Callable, ContextManager, Iterator, List, Union
 import warnings
 
 from wrike.rest_adapter import RestAdapter
+from wrike.async_jobs import JobPoller
+from wrike.attachments import AttachmentDownloader
+from wrike.batching import MicroBatcher
+from wrike.bulk import BulkEngine, Operation, OperationResult, Ref
+from wrike.circuit_breaker import CircuitBreaker
+from wrike.coalescing import WriteBehindBuffer
+from wrike.conversion import CONVERSIONS
+from wrike.data_export import DataExportDownloader
+from wrike.deadlines import CancellationToken, Deadline, deadline
+from wrike.decoding import DecodePool
+from wrike.dependency_graph import DependencyGraph
 from wrike.exceptions import WrikeException
+from wrike.hedging import HedgePolicy
+from wrike.identity_map import IdentityMap
+from wrike.fan_out import fan_out
 from wrike.models import *
-from wrike.warnings import DataCappedWarning, GreaterThanOneWarning, ZeroWarning
+from wrike.page_sizing import PageSizeTuner
+from wrike.paging import Batch, PageCursor, Pager
+from wrike.sharding import DATE_FORMAT, ShardedScan, ShardProgress
+from wrike.timelogs import TimelogStore
+from wrike.warnings import (
+    DataCappedWarning,
+    GreaterThanOneWarning,
+    KindWarning,
+    ZeroWarning,
+)
 
 # TODO: Special syntax https://developers.wrike.com/special-syntax/
 
+VALIDATION_POLICIES = ("strict", "warn_once", "off")
+
 
 class Wrike:
     def __init__(
@@ -20,42 +51,206 @@ class Wrike:
         ssl_verify: bool = True,
         logger: logging.Logger = None,
         page_size: int = 1000,
+        pool_maxsize: int = 10,
+        retries: int = 3,
+        retry_backoff: float = 0.5,
+        decode_workers: int = 0,
+        rate_limit: float = None,
+        identity_map: bool = False,
+        validation: str = "warn_once",
+        conversion: str = "off",
+        max_concurrency: int = None,
+        interactive_reserved: int = 1,
+        adaptive_concurrency: bool = False,
+        adaptive_page_size: Union[bool, PageSizeTuner] = False,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 120.0,
+        hedging: Union[bool, HedgePolicy] = False,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
     ):
-        self._rest_adapter = RestAdapter(hostname, api_key, ver, ssl_verify, logger)
+        # A Wrike client may be shared between threads: it holds no per-request state,
+        # paging state lives inside each Pager and the RestAdapter keeps a
+        # connection pool per thread
+        self._rest_adapter = RestAdapter(
+            hostname,
+            api_key,
+            ver,
+            ssl_verify,
+            logger,
+            pool_maxsize,
+            rate_limit,
+            max_concurrency,
+            interactive_reserved,
+            adaptive_concurrency=adaptive_concurrency,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+        )
+        # Current limit, history and metrics of adaptive concurrency, None when fixed
+        self.concurrency = self._rest_adapter.concurrency
+        # Hedge counts, win rate and delays of hedged GETs, None when off
+        self.hedging = self._rest_adapter.hedging
+        # Circuit states, state change events and listeners, None when off
+        self.circuit_breaker = self._rest_adapter.circuit_breaker
         self._page_size = page_size
+        # Opt-in: size each page from the latency and payload of earlier pages of its
+        # endpoint, up to page_size, instead of always requesting page_size
+        if adaptive_page_size is True:
+            adaptive_page_size = PageSizeTuner(min(100, page_size), page_size)
+        self.page_sizer = adaptive_page_size or None
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        # Opt-in: decode large responses and build their models in a reusable process pool
+        self._decode_pool = DecodePool(decode_workers) if decode_workers else None
+        self.identity_map = IdentityMap() if identity_map else None
+        if validation not in VALIDATION_POLICIES:
+            raise ValueError(
+                f"Expected validation to be one of {VALIDATION_POLICIES}, {validation} was provided"
+            )
+        # Response kinds are checked once per response: strict raises, warn_once warns
+        # once per mismatching (expected, returned) kind pair, off skips the check
+        self._validation = validation
+        self._kind_mismatches = set()
+        if conversion not in CONVERSIONS:
+            raise ValueError(
+                f"Expected conversion to be one of {CONVERSIONS}, {conversion} was provided"
+            )
+        # Dates, enums and repeated ids are converted when models are built (eager), on
+        # first access of each field (lazy), or left as the strings Wrike sent (off)
+        self._conversion = conversion
+
+    def __enter__(self) -> "Wrike":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._rest_adapter.close()
+        if self._decode_pool:
+            self._decode_pool.close()
+
+    def session(self) -> "Wrike":
+        # Shares this client's connections and settings, but maps ids to its own instances
+        session = copy.copy(self)
+        session.identity_map = IdentityMap()
+        return session
+
+    def with_priority(self, priority: str) -> "Wrike":
+        # Shares this client's connections, rate limit and scheduler, but queues every
+        # request it sends in the given lane
+        handle = copy.copy(self)
+        handle._rest_adapter = self._rest_adapter.with_priority(priority)
+        return handle
+
+    def interactive(self) -> "Wrike":
+        # Lookups a user is waiting on: reserved slots and the front of the queue
+        return self.with_priority("interactive")
+
+    def batch(self) -> "Wrike":
+        # Background work: fills the concurrency and rate budget interactive calls leave
+        return self.with_priority("batch")
+
+    def deadline(
+        self, timeout: float = None, token: CancellationToken = None
+    ) -> ContextManager[Deadline]:
+        # Limits every request inside the with block, including retries, later pages of
+        # Pagers created in it and fan-out workers, to timeout seconds in total; the
+        # token cancels them. Raises WrikeTimeoutException or WrikeCancelledException
+        return deadline(timeout, token)
+
+    def _max_workers(self, max_workers: int = None) -> int:
+        # Adaptive concurrency gets enough workers for its limit to grow into, the
+        # scheduler holds back the ones above the current limit
+        if max_workers is not None:
+            return max_workers
+        concurrency = self.concurrency
+        return concurrency.max_limit if concurrency else 8
+
+    def _get(self, endpoint: str, ep_params: Dict = None) -> Result:
+        if self._decode_pool:
+            return self._rest_adapter.get(
+                endpoint=endpoint, ep_params=ep_params, raw=True
+            )
+        return self._rest_adapter.get(endpoint=endpoint, ep_params=ep_params)
 
     def _page(
-        self, endpoint: str, model: Callable[..., Model], max_amt: int = 1000
-    ) -> Iterator[Model]:
-        # Init variables
-        amt_yielded = 0
-        curr_page = 0
-        last_page = 0
-        ep_params = {"pageSize": self._page_size}
-
-        # Keep fetching pages of tasks until the last page
-        while curr_page <= last_page:
-            result = self._rest_adapter.get(endpoint=endpoint, ep_params=ep_params)
-
-            # Increment curr_page by 1 and update the last_page based on header info returned
-            ep_params["nextPageToken"] = result.next_page_token
-            response_size = result.response_size
-            if response_size > 0:
-                last_page = int(math.ceil(response_size / self._page_size))
-            curr_page += 1
-
-            # Yield 1 task from the page; break/end loop if beyond max_amt
-            for datum in result.data:
-                yield model(**datum)
-                amt_yielded += 1
-                if amt_yielded >= max_amt:
-                    last_page = 0
-                    break
+        self,
+        endpoint: str,
+        model: Callable[..., Model],
+        max_amt: int = 1000,
+        ep_params: Dict = None,
+    ) -> Pager:
+        return Pager(
+            self,
+            endpoint,
+            model,
+            max_amt=max_amt,
+            ep_params=ep_params,
+            page_size=self._page_size,
+            retries=self._retries,
+            retry_backoff=self._retry_backoff,
+            page_sizer=self.page_sizer,
+        )
+
+    def resume_paged(self, cursor: Union[PageCursor, Dict]) -> Pager:
+        if isinstance(cursor, dict):
+            cursor = PageCursor.from_dict(cursor)
+        model = globals().get(cursor.model)
+        if not (isinstance(model, type) and issubclass(model, Method)):
+            raise ValueError(f"Unknown model in cursor: {cursor.model}")
+        return Pager(
+            self,
+            cursor.endpoint,
+            model,
+            cursor=cursor,
+            retries=self._retries,
+            retry_backoff=self._retry_backoff,
+            page_sizer=self.page_sizer,
+        )
+
+    def _check_kind(
+        self, result: Result, model: Callable[..., Model], records: int = None
+    ) -> None:
+        expected_kind = getattr(model, "_expected_kind", "")
+        if self._validation == "off" or result.check_kind(expected_kind, records):
+            return
+        message = f"Response kind ({result.kind}) does not match expected kind ({expected_kind})"
+        if self._validation == "strict":
+            raise WrikeException(message)
+        mismatch = (expected_kind, result.kind)
+        if mismatch not in self._kind_mismatches:
+            self._kind_mismatches.add(mismatch)
+            warnings.warn(message, KindWarning)
 
     def _models(self, result: Result, model: Callable[..., Model]) -> List[Model]:
-        model_list = [model(**datum) for datum in result.data]
+        if result.content is not None and self._decode_pool:
+            envelope, model_list = self._decode_pool.decode(
+                result.content, model, self._conversion
+            )
+            result._parse_data(**envelope)
+            self._check_kind(result, model, len(model_list))
+        else:
+            self._check_kind(result, model)
+            from_dict = model.constructor(self._conversion)
+            model_list = [from_dict(datum) for datum in result.data]
+        if self.identity_map is not None:
+            model_list = [self.identity_map.merge(m) for m in model_list]
         return model_list
 
+    def _records(
+        self, result: Result, model: Callable[..., Model] = None
+    ) -> List[Dict]:
+        if result.content is not None and self._decode_pool:
+            envelope, records = self._decode_pool.decode(result.content)
+            result._parse_data(**envelope)
+        else:
+            records = result._data
+        if model is not None:
+            self._check_kind(result, model, len(records))
+        return records
+
     def _one(self, models: [Callable[..., Model]]) -> Model:
         if len(models) > 1:
             warnings.warn(
@@ -99,9 +294,20 @@ class Wrike:
         return new_param_dict
 
     def _filter(self, param_dict: Dict, model_list: List[Model]) -> List[Model]:
+        # Compare through getattr and each field's converter on both sides, so wire
+        # values match fields converted eagerly, lazily or not at all
+        missing = object()
         new_model_list = []
         for model in model_list:
-            if param_dict.items() <= model.__dict__.items():
+            converters = getattr(model, "_converters", {})
+            for key, value in param_dict.items():
+                actual = getattr(model, key, missing)
+                convert = converters.get(key)
+                if convert is not None and actual is not missing:
+                    actual, value = convert(actual), convert(value)
+                if actual != value:
+                    break
+            else:
                 new_model_list.append(model)
         return new_model_list
 
@@ -147,9 +353,18 @@ class Wrike:
             self._add_param(ed_params, "deleted", deleted, bool)
             self._add_param(ed_params, "customFields", custom_fields, List[Dict])
 
-        result = self._rest_adapter.get(endpoint=endpoint, ed_params=ed_params)
+        result = self._get(endpoint=endpoint, ep_params=ed_params)
         return self._models(result, Contact)
 
+    def contact_batcher(
+        self, window: float = 0.005, max_concurrency: int = 4
+    ) -> MicroBatcher:
+        return MicroBatcher(
+            lambda ids: self.get_contacts(id=ids),
+            window=window,
+            max_concurrency=max_concurrency,
+        )
+
     def get_me(self) -> Contact:
         return self._one(self.get_contacts(me=True))
 
@@ -200,7 +415,7 @@ class Wrike:
             ed_params, "plainTextCustomFields", plain_text_custom_fields, bool
         )
         self._add_param(ed_params, "fields", fields, List[str])
-        result = self._rest_adapter.get(endpoint=endpoint, ed_params=ed_params)
+        result = self._get(endpoint=endpoint, ep_params=ed_params)
         output = self._models(result, Folder)
         if expect_one:
             output = self._one(output)
@@ -297,6 +512,32 @@ class Wrike:
             fields=fields,
         )
 
+    def create_folder(self, parent_id: str, title: str, **fields) -> Folder:
+        result = self._rest_adapter.post(
+            endpoint=f"folders/{parent_id}/folders", data={"title": title, **fields}
+        )
+        return self._one(self._models(result, Folder))
+
+    def update_folder(self, id: str, **fields) -> Folder:
+        result = self._rest_adapter.put(endpoint=f"folders/{id}", data=fields)
+        return self._one(self._models(result, Folder))
+
+    def move_folder(self, id: str, from_parent_id: str, to_parent_id: str) -> Folder:
+        return self.update_folder(
+            id, addParents=[to_parent_id], removeParents=[from_parent_id]
+        )
+
+    def delete_folder(self, id: str) -> Folder:
+        result = self._rest_adapter.delete(endpoint=f"folders/{id}")
+        return self._one(self._models(result, Folder))
+
+    def folder_batcher(
+        self, window: float = 0.005, max_concurrency: int = 4
+    ) -> MicroBatcher:
+        return MicroBatcher(
+            self.get_folder_by_ids, window=window, max_concurrency=max_concurrency
+        )
+
     def get_folder_and_filter(
         self,
         title: str = None,
@@ -351,7 +592,7 @@ class Wrike:
     #     return self._one(output)
 
     def get_tasks(self) -> List[Task]:
-        result = self._rest_adapter.get(endpoint="tasks")
+        result = self._get(endpoint="tasks")
         task_list = self._models(result, Task)
         if len(task_list) == 1000:
             warnings.warn(
@@ -367,16 +608,480 @@ class Wrike:
         task = self._one(result)
         return task
 
-    def get_tasks_paged(self, max_amt: int = 1000) -> Iterator[Task]:
+    def get_tasks_paged(self, max_amt: int = 1000) -> Pager:
         return self._page(endpoint="tasks", model=Task, max_amt=max_amt)
 
-    def get_comments(self) -> List[Comment]:
-        result = self._rest_adapter.get(endpoint="commments")
+    def create_task(self, folder_id: str, title: str, **fields) -> Task:
+        result = self._rest_adapter.post(
+            endpoint=f"folders/{folder_id}/tasks", data={"title": title, **fields}
+        )
+        return self._one(self._models(result, Task))
+
+    def update_task(self, id: str, **fields) -> Task:
+        result = self._rest_adapter.put(endpoint=f"tasks/{id}", data=fields)
+        return self._one(self._models(result, Task))
+
+    def move_task(self, id: str, from_folder_id: str, to_folder_id: str) -> Task:
+        return self.update_task(
+            id, addParents=[to_folder_id], removeParents=[from_folder_id]
+        )
+
+    def delete_task(self, id: str) -> Task:
+        result = self._rest_adapter.delete(endpoint=f"tasks/{id}")
+        return self._one(self._models(result, Task))
+
+    def bulk(self, max_workers: int = None, retries: int = None) -> BulkEngine:
+        return BulkEngine(
+            self,
+            max_workers=self._max_workers(max_workers),
+            retries=self._retries if retries is None else retries,
+            retry_backoff=self._retry_backoff,
+        )
+
+    def _update(self, entity: str, id: str, fields: Dict) -> Union[Task, Folder]:
+        if entity == "tasks":
+            return self.update_task(id, **fields)
+        if entity == "folders":
+            return self.update_folder(id, **fields)
+        raise ValueError(
+            f"Expected entity to be 'tasks' or 'folders', {entity} was provided"
+        )
+
+    def write_behind(
+        self, flush_interval: float = 1.0, max_workers: int = 4
+    ) -> WriteBehindBuffer:
+        return WriteBehindBuffer(
+            self._update, flush_interval=flush_interval, max_workers=max_workers
+        )
+
+    def get_task_batches(
+        self, batch_size: int = 1000, max_amt: int = 1000, raw: bool = False
+    ) -> Iterator[Batch]:
+        return self.get_tasks_paged(max_amt=max_amt).batches(batch_size, raw=raw)
+
+    def _get_tasks_in_containers(
+        self,
+        container: str,
+        ids: List[str],
+        max_amt: int,
+        max_workers: int,
+        ordered: bool,
+    ) -> Iterator[Task]:
+        if isinstance(ids, str) or not isinstance(ids, list):
+            raise TypeError(
+                f"Expected type for ids is a list of strings, {type(ids)} was provided"
+            )
+        # Every source gets its own _page generator, so each container keeps its own paging state
+        sources = [
+            partial(self._page, f"{container}/{id}/tasks", Task, max_amt) for id in ids
+        ]
+        return fan_out(
+            sources,
+            max_workers=self._max_workers(max_workers),
+            ordered=ordered,
+            max_amt=max_amt,
+        )
+
+    def get_tasks_in_folders(
+        self,
+        folder_ids: List[str],
+        max_amt: int = 1000,
+        max_workers: int = None,
+        ordered: bool = False,
+    ) -> Iterator[Task]:
+        return self._get_tasks_in_containers(
+            "folders", folder_ids, max_amt, max_workers, ordered
+        )
+
+    def get_tasks_in_spaces(
+        self,
+        space_ids: List[str],
+        max_amt: int = 1000,
+        max_workers: int = None,
+        ordered: bool = False,
+    ) -> Iterator[Task]:
+        return self._get_tasks_in_containers(
+            "spaces", space_ids, max_amt, max_workers, ordered
+        )
+
+    def scan_tasks(
+        self,
+        start: datetime,
+        end: datetime = None,
+        field: str = "createdDate",
+        shards: int = 8,
+        max_workers: int = None,
+        max_shard_size: int = None,
+        partitions: List[Dict] = None,
+        progress: Callable[[ShardProgress], None] = None,
+        max_amt: int = None,
+    ) -> ShardedScan:
+        return ShardedScan(
+            self,
+            "tasks",
+            Task,
+            start,
+            end,
+            field=field,
+            shards=shards,
+            max_workers=self._max_workers(max_workers),
+            max_shard_size=max_shard_size,
+            partitions=partitions,
+            progress=progress,
+            max_amt=max_amt,
+        )
+
+    def scan_folders(
+        self,
+        start: datetime,
+        end: datetime = None,
+        field: str = "updatedDate",
+        shards: int = 8,
+        max_workers: int = None,
+        max_shard_size: int = None,
+        partitions: List[Dict] = None,
+        progress: Callable[[ShardProgress], None] = None,
+        max_amt: int = None,
+    ) -> ShardedScan:
+        return ShardedScan(
+            self,
+            "folders",
+            Folder,
+            start,
+            end,
+            field=field,
+            shards=shards,
+            max_workers=self._max_workers(max_workers),
+            max_shard_size=max_shard_size,
+            partitions=partitions,
+            progress=progress,
+            max_amt=max_amt,
+        )
+
+    def get_dependencies(
+        self,
+        task_ids: List[str] = None,
+        dependency_ids: List[str] = None,
+        max_workers: int = None,
+    ) -> List[Dependency]:
+        # Dependency ids are fetched 100 per request, tasks one request each, all concurrently
+        sources = [
+            partial(self._get_dependency_chunk, dependency_ids[i : i + 100])
+            for i in range(0, len(dependency_ids or []), 100)
+        ]
+        sources += [
+            partial(self._get_dependency_chunk, None, task_id)
+            for task_id in task_ids or []
+        ]
+        dependencies = {}
+        for dependency in fan_out(sources, max_workers=self._max_workers(max_workers)):
+            dependencies.setdefault(dependency.id, dependency)
+        return list(dependencies.values())
+
+    def _get_dependency_chunk(
+        self, dependency_ids: List[str] = None, task_id: str = None
+    ) -> List[Dependency]:
+        if task_id is not None:
+            result = self._get(endpoint=f"tasks/{task_id}/dependencies")
+        else:
+            result = self._get(endpoint=f"dependencies/{','.join(dependency_ids)}")
+        return self._models(result, Dependency)
+
+    def get_dependency_graph(
+        self, tasks: List[Task], max_workers: int = None
+    ) -> DependencyGraph:
+        # Tasks carrying dependencyIds are loaded in bulk, the rest through their own endpoint
+        dependency_ids = []
+        task_ids = []
+        for task in tasks:
+            if getattr(task, "dependencyIds", None) is None:
+                task_ids.append(task.id)
+            else:
+                dependency_ids.extend(task.dependencyIds)
+        dependencies = self.get_dependencies(
+            task_ids=task_ids,
+            dependency_ids=list(dict.fromkeys(dependency_ids)),
+            max_workers=max_workers,
+        )
+        return DependencyGraph.from_models(dependencies, tasks)
+
+    def get_comments(self, plain_text: bool = None) -> List[Comment]:
+        ep_params = {}
+        self._add_param(ep_params, "plainText", plain_text, bool)
+        result = self._get(endpoint="comments", ep_params=ep_params or None)
         comment_list = self._models(result, Comment)
         return comment_list
 
+    def _get_comments_from(
+        self, endpoint: str, ep_params: Dict = None
+    ) -> Iterator[Comment]:
+        yield from self._models(
+            self._get(endpoint=endpoint, ep_params=ep_params or None), Comment
+        )
+
+    def iter_comments(
+        self,
+        task_ids: List[str] = None,
+        folder_ids: List[str] = None,
+        comment_ids: List[str] = None,
+        start: datetime = None,
+        end: datetime = None,
+        window: timedelta = timedelta(days=7),
+        plain_text: bool = None,
+        max_workers: int = None,
+    ) -> Iterator[Comment]:
+        if window <= timedelta(0):
+            raise ValueError(f"window must be positive, {window} was provided")
+        ep_params = {}
+        self._add_param(ep_params, "plainText", plain_text, bool)
+        sources = [
+            partial(self._get_comments_from, f"tasks/{id}/comments", ep_params)
+            for id in task_ids or []
+        ]
+        sources += [
+            partial(self._get_comments_from, f"folders/{id}/comments", ep_params)
+            for id in folder_ids or []
+        ]
+        # Comment ids are comma-joined, 100 per request
+        sources += [
+            partial(
+                self._get_comments_from,
+                f"comments/{','.join(comment_ids[i : i + 100])}",
+                ep_params,
+            )
+            for i in range(0, len(comment_ids or []), 100)
+        ]
+        if start is not None:
+            # Account-wide pulls accept at most a week per request, so the range is split into
+            # windows ending one second before the next starts, never returning a comment twice
+            end = end or datetime.now(timezone.utc).replace(microsecond=0)
+            window_start = start
+            while window_start < end:
+                window_end = min(window_start + window, end)
+                updated_date = {
+                    "start": window_start.strftime(DATE_FORMAT),
+                    "end": (
+                        window_end
+                        if window_end == end
+                        else window_end - timedelta(seconds=1)
+                    ).strftime(DATE_FORMAT),
+                }
+                sources.append(
+                    partial(
+                        self._get_comments_from,
+                        "comments",
+                        {**ep_params, "updatedDate": json.dumps(updated_date)},
+                    )
+                )
+                window_start = window_end
+        return fan_out(sources, max_workers=self._max_workers(max_workers))
+
+    def harvest_comments(
+        self,
+        sink: Callable[[Comment], Any],
+        task_ids: List[str] = None,
+        folder_ids: List[str] = None,
+        comment_ids: List[str] = None,
+        start: datetime = None,
+        end: datetime = None,
+        window: timedelta = timedelta(days=7),
+        plain_text: bool = None,
+        max_workers: int = None,
+    ) -> int:
+        # Comments are handed to the sink as they arrive, so memory stays bounded by fan_out's buffer
+        harvested = 0
+        for comment in self.iter_comments(
+            task_ids=task_ids,
+            folder_ids=folder_ids,
+            comment_ids=comment_ids,
+            start=start,
+            end=end,
+            window=window,
+            plain_text=plain_text,
+            max_workers=max_workers,
+        ):
+            sink(comment)
+            harvested += 1
+        return harvested
+
+    def _timelogs_endpoint(
+        self,
+        task_id: str = None,
+        folder_id: str = None,
+        contact_id: str = None,
+        category_id: str = None,
+    ) -> str:
+        if task_id:
+            return f"tasks/{task_id}/timelogs"
+        if folder_id:
+            return f"folders/{folder_id}/timelogs"
+        if contact_id:
+            return f"contacts/{contact_id}/timelogs"
+        if category_id:
+            return f"timelog_categories/{category_id}/timelogs"
+        return "timelogs"
+
+    def get_timelogs_paged(
+        self,
+        task_id: str = None,
+        folder_id: str = None,
+        contact_id: str = None,
+        category_id: str = None,
+        start: date = None,
+        end: date = None,
+        max_amt: int = 1000,
+    ) -> Pager:
+        ep_params = {}
+        if start or end:
+            tracked_date = {}
+            if start:
+                tracked_date["start"] = start.isoformat()
+            if end:
+                tracked_date["end"] = end.isoformat()
+            ep_params["trackedDate"] = json.dumps(tracked_date)
+        return self._page(
+            self._timelogs_endpoint(task_id, folder_id, contact_id, category_id),
+            Timelog,
+            max_amt=max_amt,
+            ep_params=ep_params or None,
+        )
+
+    def _get_timelog_records(self, endpoint: str, ep_params: Dict) -> Iterator[List]:
+        pager = self._page(endpoint, Timelog, max_amt=sys.maxsize, ep_params=ep_params)
+        for batch in pager.batches(raw=True):
+            yield batch.items
+
+    def load_timelogs(
+        self,
+        start: date,
+        end: date,
+        task_id: str = None,
+        folder_id: str = None,
+        contact_id: str = None,
+        category_id: str = None,
+        window_days: int = 7,
+        max_workers: int = None,
+        store: TimelogStore = None,
+    ) -> TimelogStore:
+        if window_days < 1:
+            raise ValueError(
+                f"window_days must be at least 1, {window_days} was provided"
+            )
+        # Windows of whole tracked days are disjoint, and raw records go straight into the store
+        endpoint = self._timelogs_endpoint(task_id, folder_id, contact_id, category_id)
+        sources = []
+        window_start = start
+        while window_start <= end:
+            window_end = min(window_start + timedelta(days=window_days - 1), end)
+            tracked_date = {
+                "start": window_start.isoformat(),
+                "end": window_end.isoformat(),
+            }
+            sources.append(
+                partial(
+                    self._get_timelog_records,
+                    endpoint,
+                    {"trackedDate": json.dumps(tracked_date)},
+                )
+            )
+            window_start = window_end + timedelta(days=1)
+        store = store if store is not None else TimelogStore()
+        for records in fan_out(
+            sources, max_workers=self._max_workers(max_workers), buffer_size=16
+        ):
+            store.extend(records)
+        return store
+
+    def get_attachments(
+        self,
+        task_id: str = None,
+        folder_id: str = None,
+        ids: List[str] = None,
+        with_urls: bool = None,
+    ) -> List[Attachment]:
+        ep_params = {}
+        self._add_param(ep_params, "withUrls", with_urls, bool)
+        if task_id:
+            endpoint = f"tasks/{task_id}/attachments"
+        elif folder_id:
+            endpoint = f"folders/{folder_id}/attachments"
+        elif ids:
+            endpoint = f"attachments/{','.join(ids)}"
+        else:
+            raise ValueError("Expected one of task_id, folder_id or ids")
+        result = self._get(endpoint=endpoint, ep_params=ep_params or None)
+        return self._models(result, Attachment)
+
+    def attachment_downloader(
+        self,
+        directory: str,
+        chunk_size: int = 1 << 20,
+        max_workers: int = 8,
+        use_mmap: bool = False,
+    ) -> AttachmentDownloader:
+        return AttachmentDownloader(
+            self,
+            directory,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            retries=self._retries,
+            retry_backoff=self._retry_backoff,
+            use_mmap=use_mmap,
+        )
+
+    def _upload(
+        self,
+        endpoint: str,
+        file: Union[str, BinaryIO],
+        name: str,
+        content_type: str,
+        http_method: str,
+    ) -> Attachment:
+        # Paths are opened here, handles are streamed from wherever they are positioned
+        if isinstance(file, str):
+            name = name or os.path.basename(file)
+            with open(file, "rb") as handle:
+                return self._upload(endpoint, handle, name, content_type, http_method)
+        name = name or os.path.basename(getattr(file, "name", "")) or "file"
+        content_type = (
+            content_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+        )
+        result = self._rest_adapter.upload(
+            endpoint, file, name, content_type=content_type, http_method=http_method
+        )
+        return self._one(self._models(result, Attachment))
+
+    def upload_attachment(
+        self,
+        file: Union[str, BinaryIO],
+        task_id: str = None,
+        folder_id: str = None,
+        name: str = None,
+        content_type: str = None,
+    ) -> Attachment:
+        if task_id:
+            endpoint = f"tasks/{task_id}/attachments"
+        elif folder_id:
+            endpoint = f"folders/{folder_id}/attachments"
+        else:
+            raise ValueError("Expected one of task_id or folder_id")
+        return self._upload(endpoint, file, name, content_type, "POST")
+
+    def update_attachment(
+        self,
+        id: str,
+        file: Union[str, BinaryIO],
+        name: str = None,
+        content_type: str = None,
+    ) -> Attachment:
+        return self._upload(f"attachments/{id}", file, name, content_type, "PUT")
+
+    def delete_attachment(self, id: str) -> Attachment:
+        result = self._rest_adapter.delete(endpoint=f"attachments/{id}")
+        return self._one(self._models(result, Attachment))
+
     def get_version(self) -> Version:
-        result = self._rest_adapter.get(endpoint="version")
+        result = self._get(endpoint="version")
         version = self._one(self._models(result, Version))
         return version
 
@@ -399,7 +1104,7 @@ class Wrike:
             self._add_param(ed_params, "withArchived", with_archived, bool)
             self._add_param(ed_params, "userIsMember", user_is_member, bool)
         self._add_param(ed_params, "fields", fields, List[str])
-        result = self._rest_adapter.get(endpoint=endpoint, ed_params=ed_params)
+        result = self._get(endpoint=endpoint, ep_params=ed_params)
         output = self._models(result, Space)
         if expect_one:
             output = self._one(output)
@@ -479,3 +1184,73 @@ class Wrike:
             fields,
         )
         return self._one(output)
+
+    def get_data_export(self, id: str = None) -> DataExport:
+        endpoint = f"data_export/{id}" if id else "data_export"
+        result = self._get(endpoint=endpoint)
+        return self._one(self._models(result, DataExport))
+
+    def refresh_data_export(self) -> DataExport:
+        result = self._rest_adapter.post(endpoint="data_export")
+        return self._one(self._models(result, DataExport))
+
+    def wait_for_data_export(
+        self,
+        id: str = None,
+        refresh: bool = False,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        timeout: float = None,
+    ) -> DataExport:
+        if refresh:
+            id = self.refresh_data_export().id
+        return JobPoller(
+            partial(self.get_data_export, id),
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        ).wait()
+
+    def data_export_downloader(
+        self,
+        export: DataExport,
+        directory: str,
+        chunk_size: int = 1 << 20,
+        max_workers: int = 4,
+    ) -> DataExportDownloader:
+        return DataExportDownloader(
+            self,
+            export,
+            directory,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            retries=self._retries,
+            retry_backoff=self._retry_backoff,
+        )
+
+    def get_async_job(self, id: str) -> AsyncJob:
+        result = self._get(endpoint=f"async_job/{id}")
+        return self._one(self._models(result, AsyncJob))
+
+    def async_job_poller(
+        self,
+        id: str,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        timeout: float = None,
+    ) -> JobPoller:
+        return JobPoller(
+            partial(self.get_async_job, id),
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+
+    def wait_for_async_job(
+        self,
+        id: str,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        timeout: float = None,
+    ) -> AsyncJob:
+        return self.async_job_poller(id, initial_interval, max_interval, timeout).wait()
@@ -0,0 +1,117 @@
+import logging
+import time
+from typing import Callable, Iterable
+
+from wrike import deadlines
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import Model
+
+_logger = logging.getLogger(__name__)
+
+DONE_STATES = ("Completed",)
+FAILED_STATES = ("Failed", "Cancelled")
+
+
+class JobPoller:
+    def __init__(
+        self,
+        fetch: Callable[[], Model],
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        timeout: float = None,
+        done_states: Iterable[str] = DONE_STATES,
+        failed_states: Iterable[str] = FAILED_STATES,
+    ) -> None:
+        """Polls a long running Wrike job (an async job or a data export) until it finishes
+
+        The interval between polls starts at initial_interval and grows by backoff up to
+        max_interval, so short jobs are noticed quickly while long ones cost few requests.
+        When the job reports progress (percent), the next poll is scheduled for half the
+        remaining time estimated from the progress rate instead. Throttled polls wait for
+        Retry-After.
+
+        Args:
+            fetch (Callable[[], Model]): Returns the current state of the job, a model
+                with a status (and optionally progress) attribute
+            initial_interval (float, optional): Seconds before the second poll. Defaults to 1.0.
+            max_interval (float, optional): Max seconds between polls. Defaults to 30.0.
+            backoff (float, optional): Growth factor of the interval. Defaults to 1.5.
+            timeout (float, optional): Max seconds to wait, None to wait until the job
+                finishes. Defaults to None.
+            done_states (Iterable[str], optional): Statuses of a finished job.
+                Defaults to ('Completed',).
+            failed_states (Iterable[str], optional): Statuses of a failed job.
+                Defaults to ('Failed', 'Cancelled').
+        """
+        self._fetch = fetch
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._timeout = timeout
+        self._done_states = tuple(done_states)
+        self._failed_states = tuple(failed_states)
+        self.job = None
+        self.state = None
+        self.polls = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def latency(self) -> float:
+        """Seconds from the first poll until the job finished, or until now"""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def _next_interval(self, interval: float) -> float:
+        progress = getattr(self.job, "progress", None)
+        if isinstance(progress, (int, float)) and 0 < progress < 100:
+            remaining = self.latency * (100 - progress) / progress
+            return min(self._max_interval, max(self._initial_interval, remaining / 2))
+        return min(self._max_interval, interval * self._backoff)
+
+    def poll(self) -> Model:
+        """Fetches the job once and updates state, without waiting"""
+        if self.started is None:
+            self.started = time.monotonic()
+        self.job = self._fetch()
+        self.polls += 1
+        self.state = self.job.status
+        if self.state in self._done_states + self._failed_states:
+            self.finished = time.monotonic()
+        return self.job
+
+    def wait(self) -> Model:
+        """Polls until the job is done
+
+        Raises:
+            WrikeException: The job failed, or did not finish within the timeout
+
+        Returns:
+            Model: The finished job
+        """
+        interval = self._initial_interval
+        while True:
+            try:
+                self.poll()
+                delay = interval
+            except TransientWrikeException as e:
+                delay = max(interval, e.retry_after or 0)
+            if self.finished is not None:
+                break
+            if self._timeout is not None and self.latency + delay > self._timeout:
+                raise WrikeException(
+                    f"Job did not finish within {self._timeout}s, last state: {self.state}"
+                )
+            _logger.debug(
+                msg=f"job={getattr(self.job, 'id', None)}, state={self.state}, polls={self.polls}, next_poll={delay:.2f}s"
+            )
+            deadlines.sleep(delay)
+            interval = self._next_interval(interval)
+        _logger.debug(
+            msg=f"job={self.job.id}, state={self.state}, polls={self.polls}, latency={self.latency:.2f}s"
+        )
+        if self.state in self._failed_states:
+            raise WrikeException(f"Job {self.job.id} finished as {self.state}")
+        return self.job
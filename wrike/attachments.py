@@ -0,0 +1,163 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import mmap
+import os
+import random
+import threading
+from typing import Iterable, Iterator, Tuple, Union
+
+from wrike import deadlines
+from wrike.exceptions import TransientWrikeException
+from wrike.models import Attachment
+
+_logger = logging.getLogger(__name__)
+
+
+class _Progress:
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+
+
+class AttachmentDownloader:
+    def __init__(
+        self,
+        client,
+        directory: str,
+        chunk_size: int = 1 << 20,
+        max_workers: int = 8,
+        retries: int = 3,
+        retry_backoff: float = 0.5,
+        use_mmap: bool = False,
+    ) -> None:
+        """Downloads attachments straight to disk in chunks, resuming interrupted downloads
+            with a Range request from the last byte written
+
+        Files are written under a .part name until complete, and a .part file left by an
+        earlier run is resumed rather than downloaded again.
+
+        Args:
+            client (Wrike): Client whose RestAdapter streams the files
+            directory (str): Directory the files are written to
+            chunk_size (int, optional): Bytes written per chunk. Defaults to 1 MiB.
+            max_workers (int, optional): Max number of attachments downloaded
+                concurrently. Defaults to 8.
+            retries (int, optional): Max resumes of one download. Defaults to 3.
+            retry_backoff (float, optional): Seconds to wait before the first retry,
+                doubled on every further retry. Defaults to 0.5.
+            use_mmap (bool, optional): Preallocate each file at its known size and write
+                chunks through a memory map. Defaults to False.
+        """
+        self._client = client
+        self._directory = directory
+        self._chunk_size = chunk_size
+        self._max_workers = max_workers
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        self._use_mmap = use_mmap
+        self._lock = threading.Lock()
+        self.bytes_downloaded = 0
+        self.resumes = 0
+
+    def path(self, attachment: Attachment) -> str:
+        # The id keeps attachments sharing a name apart, basename keeps them in the directory
+        return os.path.join(
+            self._directory, f"{attachment.id}_{os.path.basename(attachment.name)}"
+        )
+
+    def _count(self, written: int) -> None:
+        with self._lock:
+            self.bytes_downloaded += written
+
+    def _write_file(self, url: str, path: str, progress: _Progress) -> None:
+        with open(path, "ab") as file:
+            file.truncate(progress.offset)
+            for chunk in self._client._rest_adapter.stream(
+                url, chunk_size=self._chunk_size, offset=progress.offset
+            ):
+                file.write(chunk)
+                progress.offset += len(chunk)
+                self._count(len(chunk))
+
+    def _write_mmap(self, url: str, path: str, size: int, progress: _Progress) -> None:
+        with open(path, "r+b" if os.path.exists(path) else "w+b") as file:
+            file.truncate(size)
+            with mmap.mmap(file.fileno(), size) as memory:
+                for chunk in self._client._rest_adapter.stream(
+                    url, chunk_size=self._chunk_size, offset=progress.offset
+                ):
+                    memory[progress.offset : progress.offset + len(chunk)] = chunk
+                    progress.offset += len(chunk)
+                    self._count(len(chunk))
+
+    def download(self, attachment: Attachment, path: str = None) -> str:
+        """Downloads one attachment
+
+        Args:
+            attachment (Attachment): Attachment to download
+            path (str, optional): File to write, None for a file in the directory named
+                after the attachment. Defaults to None.
+
+        Raises:
+            TransientWrikeException: Still failing after all retries
+
+        Returns:
+            str: Path of the downloaded file
+        """
+        path = path or self.path(attachment)
+        partial_path = path + ".part"
+        url = f"attachments/{attachment.id}/download"
+        use_mmap = self._use_mmap and bool(attachment.size)
+        # A memory mapped .part file is preallocated, so its size says nothing about progress
+        if not use_mmap and os.path.exists(partial_path):
+            progress = _Progress(os.path.getsize(partial_path))
+            # An earlier run wrote the whole file but stopped before renaming it
+            if attachment.size and progress.offset == attachment.size:
+                os.replace(partial_path, path)
+                return path
+        else:
+            progress = _Progress(0)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                if use_mmap:
+                    self._write_mmap(url, partial_path, attachment.size, progress)
+                else:
+                    self._write_file(url, partial_path, progress)
+                break
+            except TransientWrikeException as e:
+                if attempts > self._retries:
+                    raise
+                with self._lock:
+                    self.resumes += 1
+                delay = (
+                    self._retry_backoff * 2 ** (attempts - 1) * (1 + random.random())
+                )
+                _logger.warning(
+                    msg=f"Download of attachment {attachment.id} interrupted at byte {progress.offset}: {e}, resuming"
+                )
+                deadlines.sleep(max(delay, e.retry_after or 0))
+        os.replace(partial_path, path)
+        return path
+
+    def download_many(
+        self, attachments: Iterable[Attachment]
+    ) -> Iterator[Tuple[Attachment, Union[str, Exception]]]:
+        """Downloads attachments concurrently
+
+        Args:
+            attachments (Iterable[Attachment]): Attachments to download
+
+        Yields:
+            Iterator[Tuple[Attachment, Union[str, Exception]]]: Each attachment with the
+                path it was written to, or the error that stopped it, in completion order
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(deadlines.bind(self.download, attachment)): attachment
+                for attachment in attachments
+            }
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], future.result() if error is None else error
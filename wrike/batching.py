@@ -0,0 +1,155 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Union
+
+from wrike.exceptions import (
+    NotFoundWrikeException,
+    TransientWrikeException,
+    WrikeException,
+)
+from wrike.models import Model
+
+_logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], List[Model]],
+        window: float = 0.005,
+        max_batch: int = 100,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Collects single-id lookups from many threads into comma-joined batch requests
+
+        The first id submitted opens a window; every id submitted before the window closes
+        (or until max_batch distinct ids are queued) goes out in the same request, and each
+        caller's Future resolves to the record with its own id.
+
+        Args:
+            fetch (Callable[[List[str]], List[Model]]): Fetches the models of up to max_batch
+                ids in one request, e.g. Wrike.get_folder_by_ids
+            window (float, optional): Seconds to wait for more ids after the first one.
+                Defaults to 0.005.
+            max_batch (int, optional): Max number of distinct ids per request; Wrike accepts
+                up to 100. Defaults to 100.
+            max_concurrency (int, optional): Max number of batch requests in flight.
+                Defaults to 4.
+        """
+        self._fetch = fetch
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: Dict[str, List[Future]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.lookups = 0
+        self.requests = 0
+
+    def submit(self, id: str) -> Future:
+        """Queues one id for the next batch
+
+        Args:
+            id (str): Wrike id to look up
+
+        Raises:
+            WrikeException: The batcher is closed
+
+        Returns:
+            Future: Resolves to the model of id, or raises NotFoundWrikeException if Wrike
+                did not return it, or the exception of the batch request. A batch
+                rejected with a non-transient error is split until only the ids causing
+                it get the error
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise WrikeException("MicroBatcher is closed")
+            self._pending.setdefault(id, []).append(future)
+            self.lookups += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def get(self, id: str, timeout: float = None) -> Model:
+        """Looks up one id through the batcher and blocks until its record arrives"""
+        return self.submit(id).result(timeout)
+
+    def close(self) -> None:
+        """Sends the ids still queued and waits for every batch in flight"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # Hold the window open for more ids, unless the batch is full or closing
+                deadline = time.monotonic() + self._window
+                while len(self._pending) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                ids = list(islice(self._pending, self._max_batch))
+                batch = {id: self._pending.pop(id) for id in ids}
+                self.requests += 1
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: Dict[str, List[Future]]) -> None:
+        # Callers may have cancelled their Future while it was queued
+        futures = {
+            future
+            for waiting in batch.values()
+            for future in waiting
+            if future.set_running_or_notify_cancel()
+        }
+        if not futures:
+            return
+        results = self._lookup(list(batch))
+        for id, waiting in batch.items():
+            result = results.get(id)
+            for future in waiting:
+                if future not in futures:
+                    continue
+                if result is None:
+                    future.set_exception(
+                        NotFoundWrikeException(f"No record was returned for id {id}")
+                    )
+                elif isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _lookup(self, ids: List[str]) -> Dict[str, Union[Model, Exception]]:
+        # Model or error of each id; ids Wrike did not return are left out
+        try:
+            models = self._fetch(ids)
+        except WrikeException as e:
+            if len(ids) == 1 or isinstance(e, TransientWrikeException):
+                _logger.error(msg=f"Batch lookup of {len(ids)} ids failed: {e}")
+                return dict.fromkeys(ids, e)
+            # One bad or inaccessible id fails the whole request: split the batch until
+            # only the failing ids get the error
+            half = len(ids) // 2
+            with self._cond:
+                self.requests += 2
+            return {**self._lookup(ids[:half]), **self._lookup(ids[half:])}
+        except Exception as e:
+            _logger.error(msg=f"Batch lookup of {len(ids)} ids failed: {e}")
+            return dict.fromkeys(ids, e)
+        return {model.id: model for model in models}
@@ -0,0 +1,411 @@
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import queue
+import random
+import time
+from typing import Any, Dict, Iterable, Iterator, Set
+
+from wrike import deadlines
+from wrike.exceptions import (
+    TransientWrikeException,
+    WrikeException,
+    WrikeTimeoutException,
+)
+from wrike.lazy import lazy_import
+from wrike.models import Model
+
+_logger = logging.getLogger(__name__)
+requests = lazy_import("requests")
+
+ACTIONS = ("create", "update", "move", "delete")
+ENTITIES = ("folders", "tasks")
+
+
+class Ref:
+    key: str
+
+    def __init__(self, key: str) -> None:
+        """Placeholder for the id of the entity created by the operation with this key.
+            An operation using a Ref only runs after that operation succeeded.
+
+        Args:
+            key (str): Key of the operation whose created id is referenced
+        """
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"Ref({self.key!r})"
+
+
+class Operation:
+    action: str
+    entity: str
+    id: str
+    parent_id: str
+    to_parent_id: str
+    data: Dict
+    key: str
+
+    def __init__(
+        self,
+        action: str,
+        entity: str,
+        id: str = None,
+        parent_id: str = None,
+        to_parent_id: str = None,
+        data: Dict = None,
+        key: str = None,
+    ) -> None:
+        """One write in a bulk run
+
+        Args:
+            action (str): 'create', 'update', 'move' or 'delete'
+            entity (str): 'folders' or 'tasks'
+            id (str, optional): Entity to update, move or delete. Defaults to None.
+            parent_id (str, optional): Folder to create in, or to move from. Defaults to None.
+            to_parent_id (str, optional): Folder to move to. Defaults to None.
+            data (Dict, optional): Wrike fields to create or update with, e.g. {'title': 'x'}.
+                Defaults to None.
+            key (str, optional): Unique key of the operation, so other operations can
+                reference what it created with Ref(key). Defaults to None.
+
+        Raises:
+            ValueError: Unknown action or entity, or an argument the action needs is missing
+        """
+        if action not in ACTIONS:
+            raise ValueError(
+                f"Expected action to be one of {ACTIONS}, {action} was provided"
+            )
+        if entity not in ENTITIES:
+            raise ValueError(
+                f"Expected entity to be one of {ENTITIES}, {entity} was provided"
+            )
+        required = {
+            "create": ("parent_id",),
+            "update": ("id",),
+            "move": ("id", "parent_id", "to_parent_id"),
+            "delete": ("id",),
+        }[action]
+        given = {"id": id, "parent_id": parent_id, "to_parent_id": to_parent_id}
+        missing = [name for name in required if given[name] is None]
+        if missing:
+            raise ValueError(f"A {action} operation needs {', '.join(missing)}")
+        self.action = action
+        self.entity = entity
+        self.id = id
+        self.parent_id = parent_id
+        self.to_parent_id = to_parent_id
+        self.data = dict(data or {})
+        self.key = key
+
+    def dependencies(self) -> Set[str]:
+        """Keys of the operations that must succeed before this one can run"""
+        values = [self.id, self.parent_id, self.to_parent_id, *self.data.values()]
+        keys = set()
+        for value in values:
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, Ref):
+                    keys.add(item.key)
+        return keys
+
+    def __repr__(self) -> str:
+        return f"Operation({self.action}, {self.entity}, id={self.id}, key={self.key})"
+
+
+class OperationResult:
+    operation: Operation
+    model: Model
+    error: Exception
+    attempts: int
+    latency: float
+    ambiguous: bool
+
+    def __init__(
+        self,
+        operation: Operation,
+        model: Model = None,
+        error: Exception = None,
+        attempts: int = 0,
+        latency: float = 0.0,
+        ambiguous: bool = False,
+    ) -> None:
+        """Outcome of one Operation
+
+        Args:
+            operation (Operation): The operation
+            model (Model, optional): Entity returned by Wrike on success. Defaults to None.
+            error (Exception, optional): Why the operation failed. Defaults to None.
+            attempts (int, optional): Number of requests sent. Defaults to 0.
+            latency (float, optional): Seconds from first attempt to outcome. Defaults to 0.0.
+            ambiguous (bool, optional): True if a create failed in a way where Wrike may
+                still have created the entity, so it was not retried. Defaults to False.
+        """
+        self.operation = operation
+        self.model = model
+        self.error = error
+        self.attempts = attempts
+        self.latency = latency
+        self.ambiguous = ambiguous
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkStats:
+    def __init__(self) -> None:
+        """Counters of a bulk run, updated as results are yielded"""
+        self.succeeded = 0
+        self.failed = 0
+        self.attempts = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Operations completed per second"""
+        elapsed = self.elapsed
+        return (self.succeeded + self.failed) / elapsed if elapsed > 0 else 0.0
+
+
+def _never_sent(e: TransientWrikeException) -> bool:
+    # Only these failures guarantee Wrike did not act on the request; a deadline
+    # that passed before sending has no cause
+    if isinstance(e, WrikeTimeoutException) and e.__cause__ is None:
+        return True
+    return e.status_code == 429 or isinstance(
+        e.__cause__, requests.exceptions.ConnectTimeout
+    )
+
+
+class BulkEngine:
+    def __init__(
+        self,
+        client,
+        max_workers: int = 8,
+        retries: int = 3,
+        retry_backoff: float = 0.5,
+    ) -> None:
+        """Runs a stream of create, update, move and delete operations with bounded
+            concurrency, through the client's RestAdapter and so its rate limiter
+
+        Updates, moves and deletes are idempotent and retried on TransientWrikeException.
+        A create is only retried when Wrike cannot have acted on it (429 or a connect
+        timeout); other failures are reported as ambiguous instead of risking a duplicate,
+        and two operations with the same key are never both run.
+
+        Args:
+            client (Wrike): Client whose write methods run the operations
+            max_workers (int, optional): Max number of operations in flight. Defaults to 8.
+            retries (int, optional): Max retries of one operation. Defaults to 3.
+            retry_backoff (float, optional): Seconds to wait before the first retry,
+                doubled on every further retry. Defaults to 0.5.
+        """
+        self._client = client
+        self._max_workers = max_workers
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        self.stats = BulkStats()
+
+    def _call(self, operation: Operation) -> Model:
+        client = self._client
+        noun = "folder" if operation.entity == "folders" else "task"
+        if operation.action == "create":
+            return getattr(client, f"create_{noun}")(
+                operation.parent_id, **operation.data
+            )
+        if operation.action == "update":
+            return getattr(client, f"update_{noun}")(operation.id, **operation.data)
+        if operation.action == "move":
+            return getattr(client, f"move_{noun}")(
+                operation.id, operation.parent_id, operation.to_parent_id
+            )
+        return getattr(client, f"delete_{noun}")(operation.id)
+
+    def _execute(self, operation: Operation, done: queue.Queue) -> None:
+        start = time.monotonic()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                model = self._call(operation)
+            except TransientWrikeException as e:
+                is_create = operation.action == "create"
+                if (is_create and not _never_sent(e)) or attempts > self._retries:
+                    done.put(
+                        OperationResult(
+                            operation,
+                            error=e,
+                            attempts=attempts,
+                            latency=time.monotonic() - start,
+                            ambiguous=is_create and not _never_sent(e),
+                        )
+                    )
+                    return
+                delay = (
+                    self._retry_backoff * 2 ** (attempts - 1) * (1 + random.random())
+                )
+                try:
+                    deadlines.sleep(max(delay, e.retry_after or 0))
+                except WrikeException as stopped:
+                    # Out of time or cancelled before the retry
+                    done.put(
+                        OperationResult(
+                            operation,
+                            error=stopped,
+                            attempts=attempts,
+                            latency=time.monotonic() - start,
+                            ambiguous=is_create and not _never_sent(e),
+                        )
+                    )
+                    return
+            except Exception as e:
+                done.put(
+                    OperationResult(
+                        operation,
+                        error=e,
+                        attempts=attempts,
+                        latency=time.monotonic() - start,
+                    )
+                )
+                return
+            else:
+                done.put(
+                    OperationResult(
+                        operation,
+                        model=model,
+                        attempts=attempts,
+                        latency=time.monotonic() - start,
+                    )
+                )
+                return
+
+    def _resolve(self, value: Any, outcomes: Dict[str, OperationResult]) -> Any:
+        if isinstance(value, Ref):
+            model = outcomes[value.key].model
+            if getattr(model, "id", None) is None:
+                raise WrikeException(f"Dependency {value.key} returned no id")
+            return model.id
+        if isinstance(value, list):
+            return [self._resolve(item, outcomes) for item in value]
+        return value
+
+    def run(self, operations: Iterable[Operation]) -> Iterator[OperationResult]:
+        """Runs the operations, yielding each result as soon as it is known
+
+        Operations are read lazily. One whose Ref dependencies have not all succeeded
+        waits for them, and fails without being sent if any of them failed. A failed
+        operation never stops the rest of the run.
+
+        Args:
+            operations (Iterable[Operation]): Operations to run
+
+        Yields:
+            Iterator[OperationResult]: One result per operation, in completion order
+        """
+        self.stats = stats = BulkStats()
+        operations = iter(operations)
+        done = queue.Queue()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        outcomes: Dict[str, OperationResult] = {}
+        blocked = defaultdict(list)
+        keys: Dict[str, Operation] = {}
+        in_flight = 0
+        exhausted = False
+
+        def dispatch(operation: Operation) -> OperationResult:
+            # Submit the operation, park it behind a pending dependency, or fail it now
+            nonlocal in_flight
+            for key in operation.dependencies():
+                if key not in outcomes:
+                    blocked[key].append(operation)
+                    return None
+                if not outcomes[key].ok:
+                    return OperationResult(
+                        operation,
+                        error=WrikeException(f"Dependency {key} failed"),
+                    )
+            try:
+                operation.id = self._resolve(operation.id, outcomes)
+                operation.parent_id = self._resolve(operation.parent_id, outcomes)
+                operation.to_parent_id = self._resolve(operation.to_parent_id, outcomes)
+                operation.data = {
+                    name: self._resolve(value, outcomes)
+                    for name, value in operation.data.items()
+                }
+            except WrikeException as e:
+                return OperationResult(operation, error=e)
+            executor.submit(deadlines.bind(self._execute, operation, done))
+            in_flight += 1
+            return None
+
+        try:
+            while True:
+                finished = deque()
+                while not exhausted and in_flight < self._max_workers * 2:
+                    operation = next(operations, None)
+                    if operation is None:
+                        exhausted = True
+                        break
+                    if operation.key is not None:
+                        if operation.key in keys:
+                            finished.append(
+                                OperationResult(
+                                    operation,
+                                    error=WrikeException(
+                                        f"Duplicate operation key {operation.key}"
+                                    ),
+                                )
+                            )
+                            continue
+                        keys[operation.key] = operation
+                    failure = dispatch(operation)
+                    if failure:
+                        finished.append(failure)
+
+                if not finished:
+                    if in_flight:
+                        finished.append(done.get())
+                        in_flight -= 1
+                    elif exhausted:
+                        # Whatever is still parked depends on keys that never showed up
+                        for key, waiting in list(blocked.items()):
+                            for operation in waiting:
+                                finished.append(
+                                    OperationResult(
+                                        operation,
+                                        error=WrikeException(
+                                            f"Depends on unknown operation key {key}"
+                                        ),
+                                    )
+                                )
+                        blocked.clear()
+                        if not finished:
+                            break
+
+                while finished:
+                    result = finished.popleft()
+                    stats.attempts += result.attempts
+                    if result.ok:
+                        stats.succeeded += 1
+                    else:
+                        stats.failed += 1
+                        _logger.warning(
+                            msg=f"{result.operation} failed: {result.error}"
+                        )
+                    key = result.operation.key
+                    if key is not None and keys.get(key) is result.operation:
+                        outcomes[key] = result
+                        for operation in blocked.pop(key, []):
+                            failure = dispatch(operation)
+                            if failure:
+                                finished.append(failure)
+                    yield result
+        finally:
+            stats.finished = time.monotonic()
+            executor.shutdown(wait=False, cancel_futures=True)
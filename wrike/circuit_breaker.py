@@ -0,0 +1,248 @@
+from collections import OrderedDict, deque
+import copy
+import json
+import logging
+import threading
+import time
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from wrike.exceptions import CircuitOpenException
+from wrike.models import Result
+from wrike.page_sizing import endpoint_group
+
+_logger = logging.getLogger(__name__)
+
+# States of a circuit
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CLOSED
+        # (monotonic time, failed) of recent requests
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        # Bumped on every state change, so late results of an earlier state are ignored
+        self.generation = 0
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 30.0,
+        open_for: float = 30.0,
+        half_open_probes: int = 1,
+        stale_cache: int = 0,
+        history_size: int = 256,
+    ) -> None:
+        """Stops sending requests to an endpoint group while Wrike keeps failing them
+
+        Each endpoint group (see page_sizing.endpoint_group) has its own circuit. A
+        closed circuit counts server errors, failed connections and timeouts among the
+        requests of the last window seconds, and opens once they reach failure_rate of
+        at least min_requests. An open circuit fails every request at once with
+        CircuitOpenException. After open_for seconds it turns half open and lets
+        half_open_probes requests through: if they all succeed it closes, if one fails
+        it opens again. 429s and 4xx responses mean Wrike is up, and count as
+        successes.
+
+        Args:
+            failure_rate (float, optional): Share of failed requests that opens the
+                circuit. Defaults to 0.5.
+            min_requests (int, optional): Requests in the window before the failure
+                rate is trusted. Defaults to 20.
+            window (float, optional): Seconds of requests the failure rate covers.
+                Defaults to 30.0.
+            open_for (float, optional): Seconds an open circuit fails fast before
+                probing. Defaults to 30.0.
+            half_open_probes (int, optional): Requests a half open circuit lets through,
+                and that must succeed to close it. Defaults to 1.
+            stale_cache (int, optional): Successful GET responses kept, by endpoint and
+                parameters, and returned with Result.stale set while their circuit is
+                open; 0 to fail fast instead. Defaults to 0.
+            history_size (int, optional): Number of state changes kept. Defaults to 256.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError(
+                f"failure_rate must be above 0 and at most 1, {failure_rate} was provided"
+            )
+        if half_open_probes < 1:
+            raise ValueError(
+                f"half_open_probes must be at least 1, {half_open_probes} was provided"
+            )
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_for = open_for
+        self.half_open_probes = half_open_probes
+        self.stale_cache = stale_cache
+        self._circuits: Dict[str, _Circuit] = {}
+        self._cache: "OrderedDict[Tuple, Result]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str, str, str], None]] = []
+        self.rejected = 0
+        self.stale_served = 0
+        # (monotonic time, endpoint group, old state, new state) of every change
+        self.events: Deque[Tuple[float, str, str, str]] = deque(maxlen=history_size)
+
+    def add_listener(self, listener: Callable[[str, str, str], None]) -> None:
+        """Calls listener(endpoint group, old state, new state) on every state change,
+        outside of the breaker's lock"""
+        self._listeners.append(listener)
+
+    def state(self, endpoint: str) -> str:
+        """'closed', 'open' or 'half_open'"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint_group(endpoint))
+            return circuit.state if circuit else CLOSED
+
+    def _circuit(self, group: str) -> _Circuit:
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit()
+        return circuit
+
+    def _move(self, group: str, circuit: _Circuit, state: str, changes: List) -> None:
+        changes.append((group, circuit.state, state))
+        self.events.append((time.monotonic(), group, circuit.state, state))
+        circuit.state = state
+        circuit.generation += 1
+        circuit.outcomes.clear()
+        circuit.failures = 0
+        circuit.probes = 0
+        circuit.probe_successes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+
+    def _notify(self, changes: List) -> None:
+        for group, old, new in changes:
+            log = _logger.warning if new == OPEN else _logger.info
+            log(msg=f"Circuit of {group}: {old} -> {new}")
+            for listener in self._listeners:
+                try:
+                    listener(group, old, new)
+                except Exception:
+                    _logger.exception(msg="Circuit breaker listener failed")
+
+    def before(self, endpoint: str) -> Tuple[str, int]:
+        """Lets a request through or fails it fast
+
+        Every request let through must be followed by after() with the permit returned.
+
+        Raises:
+            CircuitOpenException: The circuit is open, or half open with all its
+                probes in flight
+
+        Returns:
+            Tuple[str, int]: Permit naming the endpoint group and the circuit's
+                generation when the request was let through
+        """
+        group = endpoint_group(endpoint)
+        changes = []
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state == OPEN:
+                retry_after = circuit.opened_at + self.open_for - time.monotonic()
+                if retry_after > 0:
+                    self.rejected += 1
+                    raise CircuitOpenException(
+                        f"Circuit of {group} is open", retry_after=retry_after
+                    )
+                self._move(group, circuit, HALF_OPEN, changes)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpenException(
+                        f"Circuit of {group} is half open, waiting for its probes",
+                        retry_after=0.0,
+                    )
+                circuit.probes += 1
+            permit = group, circuit.generation
+        self._notify(changes)
+        return permit
+
+    def after(self, permit: Tuple[str, int], outcome: Optional[str]) -> None:
+        """Records how a request let through by before() went. Requests let through
+            before the circuit last changed state are ignored, e.g. one sent while
+            closed cannot close or free a probe of the half open circuit
+
+        Args:
+            permit (Tuple[str, int]): What before() returned for the request
+            outcome (Optional[str]): 'ok', 'throttled' or 'error', None if the request
+                was never sent
+        """
+        group, generation = permit
+        changes = []
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.generation != generation:
+                return
+            if circuit.state == HALF_OPEN:
+                if outcome is None:
+                    circuit.probes -= 1
+                elif outcome == "error":
+                    self._move(group, circuit, OPEN, changes)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_probes:
+                        self._move(group, circuit, CLOSED, changes)
+            elif circuit.state == CLOSED and outcome is not None:
+                now = time.monotonic()
+                failed = outcome == "error"
+                circuit.outcomes.append((now, failed))
+                circuit.failures += failed
+                while circuit.outcomes and circuit.outcomes[0][0] < now - self.window:
+                    circuit.failures -= circuit.outcomes.popleft()[1]
+                total = len(circuit.outcomes)
+                if (
+                    total >= self.min_requests
+                    and circuit.failures >= self.failure_rate * total
+                ):
+                    self._move(group, circuit, OPEN, changes)
+        self._notify(changes)
+
+    @staticmethod
+    def _key(endpoint: str, ep_params: Dict, raw: bool) -> Tuple:
+        return endpoint, raw, json.dumps(ep_params or {}, sort_keys=True, default=str)
+
+    def store(self, endpoint: str, ep_params: Dict, raw: bool, result: Result) -> None:
+        """Keeps a successful GET response to serve while its circuit is open"""
+        if not self.stale_cache:
+            return
+        key = self._key(endpoint, ep_params, raw)
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.stale_cache:
+                self._cache.popitem(last=False)
+
+    def stale(self, endpoint: str, ep_params: Dict, raw: bool) -> Optional[Result]:
+        """Copy of the last response to the same GET, marked stale, None if there is none"""
+        if not self.stale_cache:
+            return None
+        with self._lock:
+            result = self._cache.get(self._key(endpoint, ep_params, raw))
+            if result is None:
+                return None
+            self.stale_served += 1
+        result = copy.copy(result)
+        result.stale = True
+        return result
+
+    def metrics(self) -> Dict:
+        """State of every circuit and counts, for dashboards and logs"""
+        with self._lock:
+            return {
+                "circuits": {
+                    group: circuit.state for group, circuit in self._circuits.items()
+                },
+                "rejected": self.rejected,
+                "stale_served": self.stale_served,
+            }
@@ -0,0 +1,192 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from wrike.exceptions import WrikeException
+from wrike.models import Model
+
+_logger = logging.getLogger(__name__)
+
+
+def _add_unique(target: List, values: List) -> List:
+    return target + [value for value in values if value not in target]
+
+
+def merge_fields(pending: Dict, fields: Dict) -> Dict:
+    """Merges a later update into the fields already waiting for the same entity
+
+    Plain fields take the later value. add*/remove* lists (addResponsibles,
+    removeParents, ...) accumulate, and adding an id cancels a pending removal of it
+    and vice versa. customFields are merged by custom field id.
+
+    Args:
+        pending (Dict): Fields waiting to be sent, updated in place
+        fields (Dict): Fields of the later update
+
+    Returns:
+        Dict: pending
+    """
+    for name, value in fields.items():
+        if name == "customFields" and isinstance(value, list):
+            merged = {field["id"]: field for field in pending.get(name, [])}
+            merged.update({field["id"]: field for field in value})
+            pending[name] = list(merged.values())
+        elif name.startswith(("add", "remove")) and isinstance(value, list):
+            if name.startswith("add"):
+                opposite = "remove" + name[len("add") :]
+            else:
+                opposite = "add" + name[len("remove") :]
+            if opposite in pending:
+                pending[opposite] = [v for v in pending[opposite] if v not in value]
+                if not pending[opposite]:
+                    del pending[opposite]
+            pending[name] = _add_unique(pending.get(name, []), value)
+        else:
+            pending[name] = value
+    return pending
+
+
+class _Pending:
+    def __init__(self, due: float) -> None:
+        self.due = due
+        self.fields = {}
+        self.futures = []
+
+
+class WriteBehindBuffer:
+    def __init__(
+        self,
+        write: Callable[[str, str, Dict], Model],
+        flush_interval: float = 1.0,
+        max_workers: int = 4,
+    ) -> None:
+        """Buffers updates and sends one combined PUT per entity per flush interval
+
+        The first update of an entity starts its interval. Updates of the same entity
+        arriving before it ends are merged with merge_fields(), and every caller's Future
+        resolves with the outcome of the combined write. Writes of one entity never
+        overlap, so a later combined write always lands after an earlier one.
+
+        Args:
+            write (Callable[[str, str, Dict], Model]): Sends one update, called with
+                entity ('tasks' or 'folders'), id and fields
+            flush_interval (float, optional): Seconds updates of an entity are held before
+                being sent. Defaults to 1.0.
+            max_workers (int, optional): Max number of writes in flight. Defaults to 4.
+        """
+        self._write = write
+        self._flush_interval = flush_interval
+        self._pending: Dict[Tuple[str, str], _Pending] = {}
+        self._in_flight: Dict[Tuple[str, str], List[Future]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.updates = 0
+        self.writes = 0
+
+    def __enter__(self) -> "WriteBehindBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(self, entity: str, id: str, **fields) -> Future:
+        """Queues an update of one entity
+
+        Args:
+            entity (str): 'tasks' or 'folders'
+            id (str): Id of the entity
+            **fields: Wrike fields to update, e.g. status='Completed'
+
+        Raises:
+            WrikeException: The buffer is closed
+
+        Returns:
+            Future: Resolves to the entity returned by the combined write, or raises its error
+        """
+        future = Future()
+        key = (entity, id)
+        with self._cond:
+            if self._closed:
+                raise WrikeException("WriteBehindBuffer is closed")
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = _Pending(time.monotonic() + self._flush_interval)
+                self._pending[key] = pending
+            merge_fields(pending.fields, fields)
+            pending.futures.append(future)
+            self.updates += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def flush(self, timeout: float = None) -> None:
+        """Sends every buffered update now and waits until they are written
+
+        Args:
+            timeout (float, optional): Max seconds to wait, None to wait until done.
+                Defaults to None.
+        """
+        with self._cond:
+            futures = [f for p in self._pending.values() for f in p.futures]
+            futures += [f for waiting in self._in_flight.values() for f in waiting]
+            for pending in self._pending.values():
+                pending.due = 0
+            self._cond.notify()
+        wait(futures, timeout=timeout)
+
+    def close(self) -> None:
+        """Rejects new updates, writes everything buffered and stops the buffer"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                waiting = [key for key in self._pending if key not in self._in_flight]
+                for key in waiting:
+                    if self._closed or self._pending[key].due <= now:
+                        pending = self._pending.pop(key)
+                        self._in_flight[key] = pending.futures
+                        self._executor.submit(self._send, key, pending)
+                if self._closed and not self._pending and not self._in_flight:
+                    return
+                next_due = min(
+                    (
+                        p.due
+                        for k, p in self._pending.items()
+                        if k not in self._in_flight
+                    ),
+                    default=None,
+                )
+                self._cond.wait(None if next_due is None else max(0.0, next_due - now))
+
+    def _send(self, key: Tuple[str, str], pending: _Pending) -> None:
+        entity, id = key
+        try:
+            model = self._write(entity, id, pending.fields)
+        except Exception as e:
+            _logger.error(msg=f"Write of {entity}/{id} failed: {e}")
+            outcome = (False, e)
+        else:
+            outcome = (True, model)
+        with self._cond:
+            del self._in_flight[key]
+            self.writes += 1
+            self._cond.notify()
+        for future in pending.futures:
+            if outcome[0]:
+                future.set_result(outcome[1])
+            else:
+                future.set_exception(outcome[1])
@@ -0,0 +1,71 @@
+from datetime import date, datetime, timezone
+from enum import Enum
+from functools import lru_cache
+import sys
+from typing import Any, Callable, Type
+
+CONVERSIONS = ("off", "eager", "lazy")
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@lru_cache(maxsize=1 << 16)
+def parse_datetime(value: str) -> Any:
+    """Parses a Wrike timestamp such as '2024-01-31T12:00:00Z' to an aware UTC datetime
+
+    Timestamps repeat heavily across records (bulk edits, imports), so results are
+    cached. Values that are not timestamps are returned unchanged.
+    """
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(value)
+    except (AttributeError, TypeError, ValueError):
+        return value
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@lru_cache(maxsize=1 << 12)
+def parse_date(value: str) -> Any:
+    """Parses a Wrike date such as '2024-01-31'. Values that are not dates are returned unchanged."""
+    try:
+        return date.fromisoformat(value[:10])
+    except (TypeError, ValueError):
+        return value
+
+
+def enum_converter(enum: Type[Enum]) -> Callable[[Any], Any]:
+    """Returns a converter looking members up by value in a table built once, so
+    conversion is a dict lookup instead of Enum's call machinery. Unknown values,
+    e.g. ones Wrike added later, are returned unchanged."""
+    table = {member.value: member for member in enum}
+
+    def convert(value: Any) -> Any:
+        try:
+            return table.get(value, value)
+        except TypeError:
+            return value
+
+    convert.__name__ = f"to_{enum.__name__}"
+    return convert
+
+
+def intern_id(value: Any) -> Any:
+    """Interns ids that repeat across many records (account, author, user ids) so they
+    share one string object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def dump(value: Any) -> Any:
+    """Converts a converted value back to its wire form"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(DATE_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import logging
+import os
+import random
+import threading
+from typing import Callable, Dict, Iterator, List, TypeVar
+
+from wrike import deadlines
+from wrike.exceptions import TransientWrikeException, WrikeException
+from wrike.models import DataExport
+
+_logger = logging.getLogger(__name__)
+
+Output = TypeVar("Output")
+
+
+class DataExportDownloader:
+    def __init__(
+        self,
+        client,
+        export: DataExport,
+        directory: str,
+        chunk_size: int = 1 << 20,
+        max_workers: int = 4,
+        retries: int = 3,
+        retry_backoff: float = 0.5,
+    ) -> None:
+        """Downloads the CSV resources of a completed Data Export and reads them back
+            record by record or in columnar batches, never holding a whole file in memory
+
+        Args:
+            client (Wrike): Client whose RestAdapter streams the files
+            export (DataExport): A completed export
+            directory (str): Directory the CSV files are written to
+            chunk_size (int, optional): Bytes written per chunk. Defaults to 1 MiB.
+            max_workers (int, optional): Max number of resources downloaded or processed
+                concurrently. Defaults to 4.
+            retries (int, optional): Max retries of one download. Defaults to 3.
+            retry_backoff (float, optional): Seconds to wait before the first retry,
+                doubled on every further retry. Defaults to 0.5.
+
+        Raises:
+            WrikeException: The export is not completed
+        """
+        if export.status != "Completed":
+            raise WrikeException(f"Data export {export.id} is {export.status}")
+        self._client = client
+        self._directory = directory
+        self._chunk_size = chunk_size
+        self._max_workers = max_workers
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        self.urls = {resource["name"]: resource["url"] for resource in export.resources}
+        self.paths: Dict[str, str] = {}
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.urls)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, f"{name}.csv")
+
+    def _download(self, name: str) -> str:
+        path = self._path(name)
+        partial_path = path + ".part"
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                with open(partial_path, "wb") as file:
+                    for chunk in self._client._rest_adapter.stream(
+                        self.urls[name], chunk_size=self._chunk_size
+                    ):
+                        file.write(chunk)
+                        with self._lock:
+                            self.bytes_downloaded += len(chunk)
+                break
+            except TransientWrikeException as e:
+                if attempts > self._retries:
+                    raise
+                delay = (
+                    self._retry_backoff * 2 ** (attempts - 1) * (1 + random.random())
+                )
+                _logger.warning(msg=f"Download of {name} failed: {e}, retrying")
+                deadlines.sleep(max(delay, e.retry_after or 0))
+        # Only complete files ever appear under the final name
+        os.replace(partial_path, path)
+        self.paths[name] = path
+        return path
+
+    def download(self, names: List[str] = None) -> Dict[str, str]:
+        """Downloads resources concurrently
+
+        Args:
+            names (List[str], optional): Resources to download, None for all. Defaults to None.
+
+        Returns:
+            Dict[str, str]: Path of each downloaded file by resource name
+        """
+        names = names or self.names
+        os.makedirs(self._directory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(deadlines.bind(self._download, name)) for name in names
+            ]
+            paths = [future.result() for future in futures]
+        return dict(zip(names, paths))
+
+    def records(self, name: str) -> Iterator[Dict[str, str]]:
+        """Reads a resource row by row, downloading it first if needed
+
+        Yields:
+            Iterator[Dict[str, str]]: One dict per CSV row, keyed by column name
+        """
+        path = self.paths.get(name) or self._download(name)
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            yield from csv.DictReader(file)
+
+    def batches(self, name: str, batch_size: int = 10000) -> Iterator[Dict[str, List]]:
+        """Reads a resource in columnar batches, downloading it first if needed
+
+        Yields:
+            Iterator[Dict[str, List]]: Up to batch_size rows as one list per column
+        """
+        path = self.paths.get(name) or self._download(name)
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            columns = [[] for _ in header]
+            for row in reader:
+                # Short rows are padded so every column keeps the same length
+                for i, column in enumerate(columns):
+                    column.append(row[i] if i < len(row) else "")
+                if len(columns[0]) >= batch_size:
+                    yield dict(zip(header, columns))
+                    columns = [[] for _ in header]
+            if columns and columns[0]:
+                yield dict(zip(header, columns))
+
+    def process(
+        self,
+        fn: Callable[[str, Iterator[Dict[str, str]]], Output],
+        names: List[str] = None,
+    ) -> Dict[str, Output]:
+        """Downloads and processes resources in parallel, each on its own thread
+
+        Args:
+            fn (Callable[[str, Iterator[Dict[str, str]]], Output]): Called with the
+                resource name and its records
+            names (List[str], optional): Resources to process, None for all. Defaults to None.
+
+        Returns:
+            Dict[str, Output]: What fn returned for each resource
+        """
+        names = names or self.names
+        os.makedirs(self._directory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(
+                    deadlines.bind(lambda name: fn(name, self.records(name)), name)
+                )
+                for name in names
+            ]
+            outputs = [future.result() for future in futures]
+        return dict(zip(names, outputs))
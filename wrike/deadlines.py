@@ -0,0 +1,202 @@
+from contextlib import contextmanager
+import contextvars
+import functools
+import math
+import threading
+import time
+from typing import Callable, Iterator, Optional, Tuple
+
+from wrike.exceptions import WrikeCancelledException, WrikeTimeoutException
+
+# Deadline of the operation running in the current thread or task, None for no limit
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "wrike_deadline", default=None
+)
+
+
+class CancellationToken:
+    def __init__(self) -> None:
+        """Flag one caller sets to stop every request, retry and page of an operation
+
+        Queued requests and retry waits return as soon as it is set; pages, fan-out
+        workers and downloads stop at their next step. A request already sent is not
+        interrupted, its read timeout bounds how long it can take.
+        """
+        self._event = threading.Event()
+        self.reason: str = None
+
+    def cancel(self, reason: str = "Cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, seconds: float) -> bool:
+        """Sleeps for seconds, returning True early if the token is cancelled"""
+        return self._event.wait(seconds)
+
+
+class Deadline:
+    def __init__(
+        self,
+        timeout: float = None,
+        token: CancellationToken = None,
+        parent: "Deadline" = None,
+    ) -> None:
+        """Time budget and cancellation token of one operation
+
+        A deadline nested in another never outlives it and is cancelled with it.
+
+        Args:
+            timeout (float, optional): Seconds the operation may take, None for no
+                limit. Defaults to None.
+            token (CancellationToken, optional): Token cancelling the operation.
+                Defaults to None.
+            parent (Deadline, optional): Enclosing deadline. Defaults to None.
+        """
+        self.timeout = timeout
+        self.token = token
+        self.parent = parent
+        self.expires_at = math.inf if timeout is None else time.monotonic() + timeout
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+
+    def remaining(self) -> float:
+        """Seconds left, math.inf for no limit"""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def cancelled(self) -> Optional[CancellationToken]:
+        """The cancelled token of this or an enclosing deadline, None if there is none"""
+        return next((token for token in self._tokens() if token.cancelled), None)
+
+    def check(self) -> None:
+        """Raises if the operation was cancelled or ran out of time
+
+        Raises:
+            WrikeCancelledException: A token was cancelled
+            WrikeTimeoutException: The deadline passed
+        """
+        token = self.cancelled
+        if token is not None:
+            raise WrikeCancelledException(token.reason)
+        if self.expired:
+            raise WrikeTimeoutException(f"Deadline of {self.timeout}s exceeded")
+
+    def _tokens(self) -> Iterator[CancellationToken]:
+        deadline = self
+        while deadline is not None:
+            if deadline.token is not None:
+                yield deadline.token
+            deadline = deadline.parent
+
+    def sleep(self, seconds: float) -> None:
+        """Waits for seconds, waking as soon as a token is cancelled and raising if
+            the wait runs past the deadline
+
+        Raises:
+            WrikeCancelledException: A token was cancelled
+            WrikeTimeoutException: The deadline passes before the wait is over
+        """
+        if seconds >= self.remaining():
+            self.check()
+            raise WrikeTimeoutException(
+                f"Deadline of {self.timeout}s would pass while waiting {seconds:.2f}s"
+            )
+        tokens = list(self._tokens())
+        if not tokens:
+            time.sleep(seconds)
+        elif len(tokens) == 1:
+            tokens[0].wait(seconds)
+        else:
+            end = time.monotonic() + seconds
+            while not any(token.cancelled for token in tokens):
+                left = end - time.monotonic()
+                if left <= 0:
+                    break
+                tokens[0].wait(min(left, 0.05))
+        self.check()
+
+
+def current() -> Optional[Deadline]:
+    """Deadline of the running operation, None outside of one"""
+    return _current.get()
+
+
+@contextmanager
+def deadline(
+    timeout: float = None, token: CancellationToken = None
+) -> Iterator[Deadline]:
+    """Limits every request made inside the with block, on this thread and on the
+        workers it fans out to, to timeout seconds in total
+
+    Args:
+        timeout (float, optional): Seconds the block may take, None for no limit.
+            Defaults to None.
+        token (CancellationToken, optional): Token that cancels the block.
+            Defaults to None.
+
+    Yields:
+        Iterator[Deadline]: The active deadline
+    """
+    with use(Deadline(timeout, token, _current.get())) as active:
+        yield active
+
+
+@contextmanager
+def use(active: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Makes an existing deadline current again, e.g. in a Pager iterated after the
+    with block that created it has exited"""
+    reset = _current.set(active)
+    try:
+        yield active
+    finally:
+        _current.reset(reset)
+
+
+def check() -> None:
+    """Raises if the running operation was cancelled or ran out of time"""
+    active = _current.get()
+    if active is not None:
+        active.check()
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep() that respects the running operation's deadline and cancellation"""
+    active = _current.get()
+    if active is None:
+        time.sleep(seconds)
+    else:
+        active.sleep(seconds)
+
+
+def timeouts(connect: float, read: float) -> Tuple[float, float]:
+    """(connect, read) timeouts of a request, capped to what is left of the deadline
+
+    Raises:
+        WrikeCancelledException: The operation was cancelled
+        WrikeTimeoutException: No time is left to send the request
+    """
+    active = _current.get()
+    if active is None:
+        return connect, read
+    active.check()
+    remaining = active.remaining()
+    if remaining == math.inf:
+        return connect, read
+    return (
+        remaining if connect is None else min(connect, remaining),
+        remaining if read is None else min(read, remaining),
+    )
+
+
+def bind(fn: Callable, *args, **kwargs) -> Callable[[], object]:
+    """Wraps fn to run with the caller's deadline, for work submitted to other threads"""
+    return functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
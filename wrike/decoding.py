@@ -0,0 +1,122 @@
+import concurrent.futures
+import json
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from wrike import models
+from wrike.exceptions import WrikeException
+from wrike.lazy import lazy_import
+from wrike.models import Model, Result
+
+# Only imported once the pool starts its first worker
+multiprocessing = lazy_import("multiprocessing")
+
+# Envelope: kind, state, nextPageToken, responseSize and any other top level keys
+# Layouts: distinct attribute name tuples; rows: (layout index, attribute values)
+Decoded = Tuple[Dict, List[Tuple[str, ...]], List[Tuple[int, Tuple]]]
+
+
+def _decode(content: bytes, model_name: str = None, conversion: str = "off") -> Decoded:
+    # Runs in the worker process: decode the JSON, build the models and flatten them so
+    # the records sharing a set of attributes only send their attribute names once
+    try:
+        payload = json.loads(content)
+    except (TypeError, ValueError) as e:
+        raise WrikeException("Bad JSON in response") from e
+    envelope = {key: value for key, value in payload.items() if key != "data"}
+    if model_name is None:
+        records = payload.get("data") or []
+    else:
+        from_dict = getattr(models, model_name).constructor(conversion)
+        result = Result(200, {}, data=payload)
+        records = [from_dict(datum).__dict__ for datum in result.data]
+
+    layouts = {}
+    rows = []
+    for record in records:
+        layout = tuple(record)
+        index = layouts.setdefault(layout, len(layouts))
+        rows.append((index, tuple(record.values())))
+    return envelope, list(layouts), rows
+
+
+def _rebuild(decoded: Decoded, model: Callable[..., Model] = None) -> Tuple[Dict, List]:
+    envelope, layouts, rows = decoded
+    if model is None:
+        return envelope, [dict(zip(layouts[index], values)) for index, values in rows]
+    new = object.__new__
+    output = []
+    for index, values in rows:
+        instance = new(model)
+        instance.__dict__.update(zip(layouts[index], values))
+        output.append(instance)
+    return envelope, output
+
+
+class DecodePool:
+    def __init__(self, max_workers: int = None, min_bytes: int = 256 * 1024) -> None:
+        """Process pool that decodes raw response bodies and builds models off the calling
+            process, so JSON decoding and model construction can use every core
+
+        The pool is started on first use and reused by every later call until close().
+
+        Args:
+            max_workers (int, optional): Number of worker processes, None for one per CPU.
+                Defaults to None.
+            min_bytes (int, optional): Bodies smaller than this are decoded in-process,
+                where the round trip to a worker would cost more than it saves.
+                Defaults to 256 KiB.
+        """
+        self._max_workers = max_workers
+        self._min_bytes = min_bytes
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> "concurrent.futures.ProcessPoolExecutor":
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn, since forking a process with live client threads is unsafe
+                    # concurrent.futures imports its process pool on first access
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self._max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                executor = self._executor
+        return executor
+
+    def decode(
+        self,
+        content: bytes,
+        model: Callable[..., Model] = None,
+        conversion: str = "off",
+    ) -> Tuple[Dict, List]:
+        """Decodes a raw response body into its envelope and its models
+
+        Args:
+            content (bytes): Raw JSON response body
+            model (Callable[..., Model], optional): wrike.models class to build from each
+                record, None to return the records as dictionaries. Defaults to None.
+            conversion (str, optional): Conversion of the models' fields, see
+                Method.constructor. Defaults to 'off'.
+
+        Returns:
+            Tuple[Dict, List]: Envelope (kind, nextPageToken, ...) and the models or records
+        """
+        model_name = model.__name__ if model is not None else None
+        if len(content) < self._min_bytes:
+            decoded = _decode(content, model_name, conversion)
+        else:
+            decoded = (
+                self._get_executor()
+                .submit(_decode, content, model_name, conversion)
+                .result()
+            )
+        return _rebuild(decoded, model)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,286 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from wrike.exceptions import WrikeException
+from wrike.models import Dates, Dependency, Task
+
+FINISH_TO_START = "FinishToStart"
+START_TO_START = "StartToStart"
+FINISH_TO_FINISH = "FinishToFinish"
+START_TO_FINISH = "StartToFinish"
+
+# Relation types stored as small ints on each edge
+_RELATIONS = (FINISH_TO_START, START_TO_START, FINISH_TO_FINISH, START_TO_FINISH)
+_RELATION_CODES = {relation: code for code, relation in enumerate(_RELATIONS)}
+
+
+def task_duration(task: Task) -> int:
+    """Returns the planned duration of a task in minutes from its dates, 0 if unknown"""
+    dates = getattr(task, "dates", None)
+    if isinstance(dates, Dates):
+        return dates.duration or 0
+    if isinstance(dates, dict):
+        return dates.get("duration") or 0
+    return 0
+
+
+class DependencyGraph:
+    def __init__(self) -> None:
+        """Task dependency graph for schedule analysis
+
+        Task ids are interned to dense ints and edges are kept in per-task adjacency
+        dictionaries (neighbour index -> (relation code, lag minutes)), so ordering, cycle
+        detection and critical path are linear passes over plain lists. Tasks and
+        dependencies can be added, changed and removed without rebuilding the graph.
+        """
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._durations: List[int] = []
+        self._successors: List[Dict[int, Tuple[int, int]]] = []
+        self._predecessors: List[Dict[int, Tuple[int, int]]] = []
+        self._dependency_edges: Dict[str, Tuple[int, int]] = {}
+        self._order: Optional[List[int]] = None
+
+    @classmethod
+    def from_models(
+        cls, dependencies: Iterable[Dependency], tasks: Iterable[Task] = ()
+    ) -> "DependencyGraph":
+        """Builds a graph from Dependency models, taking task durations from Task dates"""
+        graph = cls()
+        for task in tasks:
+            graph.add_task(task.id, task_duration(task))
+        for dependency in dependencies:
+            graph.add_dependency(
+                dependency.predecessor_id,
+                dependency.successor_id,
+                dependency.relation_type,
+                dependency.lag_time or 0,
+                id=dependency.id,
+            )
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._index
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(successors) for successors in self._successors)
+
+    def _intern(self, task_id: str) -> int:
+        index = self._index.get(task_id)
+        if index is None:
+            index = len(self._ids)
+            self._index[task_id] = index
+            self._ids.append(task_id)
+            self._durations.append(0)
+            self._successors.append({})
+            self._predecessors.append({})
+            self._order = None
+        return index
+
+    def add_task(self, task_id: str, duration: int = 0) -> None:
+        """Adds a task, or updates the duration (minutes) of a known one"""
+        self._durations[self._intern(task_id)] = duration
+
+    def add_dependency(
+        self,
+        predecessor_id: str,
+        successor_id: str,
+        relation_type: str = FINISH_TO_START,
+        lag_time: int = 0,
+        id: str = None,
+    ) -> None:
+        """Adds a dependency, or replaces the one between the same two tasks
+
+        Args:
+            predecessor_id (str): Predecessor task ID
+            successor_id (str): Successor task ID
+            relation_type (str, optional): Relation type. Defaults to 'FinishToStart'.
+            lag_time (int, optional): Lag in minutes. Defaults to 0.
+            id (str, optional): Wrike dependency ID, to remove it by ID later. Defaults to None.
+
+        Raises:
+            ValueError: Unknown relation type
+        """
+        if relation_type not in _RELATION_CODES:
+            raise ValueError(
+                f"Expected relation_type to be one of {_RELATIONS}, {relation_type} was provided"
+            )
+        predecessor = self._intern(predecessor_id)
+        successor = self._intern(successor_id)
+        edge = (_RELATION_CODES[relation_type], lag_time)
+        self._successors[predecessor][successor] = edge
+        self._predecessors[successor][predecessor] = edge
+        if id is not None:
+            self._dependency_edges[id] = (predecessor, successor)
+        self._order = None
+
+    def remove_dependency(
+        self, predecessor_id: str = None, successor_id: str = None, id: str = None
+    ) -> bool:
+        """Removes a dependency by its Wrike ID or by its two task IDs
+
+        Returns:
+            bool: True if a dependency was removed
+        """
+        if id is not None:
+            if id not in self._dependency_edges:
+                return False
+            predecessor, successor = self._dependency_edges.pop(id)
+        else:
+            if predecessor_id not in self._index or successor_id not in self._index:
+                return False
+            predecessor = self._index[predecessor_id]
+            successor = self._index[successor_id]
+        if self._successors[predecessor].pop(successor, None) is None:
+            return False
+        del self._predecessors[successor][predecessor]
+        self._order = None
+        return True
+
+    def successors(self, task_id: str) -> List[str]:
+        return [self._ids[i] for i in self._successors[self._index[task_id]]]
+
+    def predecessors(self, task_id: str) -> List[str]:
+        return [self._ids[i] for i in self._predecessors[self._index[task_id]]]
+
+    def _topological(self) -> Tuple[List[int], bool]:
+        # Kahn's algorithm; the order is partial when the graph has a cycle
+        if self._order is not None:
+            return self._order, True
+        in_degree = [len(predecessors) for predecessors in self._predecessors]
+        ready = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor in self._successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
+        acyclic = len(order) == len(self._ids)
+        if acyclic:
+            self._order = order
+        return order, acyclic
+
+    def has_cycle(self) -> bool:
+        return not self._topological()[1]
+
+    def topological_order(self) -> List[str]:
+        """Returns the task IDs ordered so every predecessor comes before its successors
+
+        Raises:
+            WrikeException: The dependencies contain a cycle
+        """
+        order, acyclic = self._topological()
+        if not acyclic:
+            raise WrikeException(
+                f"Dependencies contain {len(self.find_cycles())} cycle(s)"
+            )
+        return [self._ids[i] for i in order]
+
+    def find_cycles(self) -> List[List[str]]:
+        """Returns each group of tasks that depend on each other in a cycle (the strongly
+        connected components with more than one task, or a task depending on itself)"""
+        # Iterative Tarjan, so deep dependency chains do not hit the recursion limit
+        index_of = [-1] * len(self._ids)
+        low = [0] * len(self._ids)
+        on_stack = [False] * len(self._ids)
+        stack = []
+        cycles = []
+        counter = 0
+        for root in range(len(self._ids)):
+            if index_of[root] != -1:
+                continue
+            work = [(root, iter(self._successors[root]))]
+            index_of[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if index_of[successor] == -1:
+                        index_of[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        work.append((successor, iter(self._successors[successor])))
+                        advanced = True
+                        break
+                    if on_stack[successor]:
+                        low[node] = min(low[node], index_of[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self._successors[node]:
+                        cycles.append([self._ids[i] for i in reversed(component)])
+        return cycles
+
+    def critical_path(self) -> Tuple[int, List[str]]:
+        """Finds the longest chain of dependent tasks, which sets the schedule's length
+
+        Every task starts as early as its dependencies allow:
+        FinishToStart: successor start >= predecessor finish + lag
+        StartToStart: successor start >= predecessor start + lag
+        FinishToFinish: successor finish >= predecessor finish + lag
+        StartToFinish: successor finish >= predecessor start + lag
+
+        Raises:
+            WrikeException: The dependencies contain a cycle
+
+        Returns:
+            Tuple[int, List[str]]: Schedule length in minutes and the task IDs on the
+                critical path, first to last
+        """
+        order, acyclic = self._topological()
+        if not acyclic:
+            raise WrikeException("Critical path is undefined for cyclic dependencies")
+        durations = self._durations
+        start = [0] * len(self._ids)
+        binding = [-1] * len(self._ids)
+        for node in order:
+            duration = durations[node]
+            best, best_predecessor = 0, -1
+            for predecessor, (relation, lag) in self._predecessors[node].items():
+                predecessor_start = start[predecessor]
+                if relation == 0:
+                    candidate = predecessor_start + durations[predecessor] + lag
+                elif relation == 1:
+                    candidate = predecessor_start + lag
+                elif relation == 2:
+                    candidate = (
+                        predecessor_start + durations[predecessor] + lag - duration
+                    )
+                else:
+                    candidate = predecessor_start + lag - duration
+                if candidate > best or (candidate == best and best_predecessor == -1):
+                    best, best_predecessor = candidate, predecessor
+            start[node] = best
+            binding[node] = best_predecessor
+        if not order:
+            return 0, []
+        # Ties go to the task latest in the order, so the path runs to the end of its chain
+        last = max(reversed(order), key=lambda node: start[node] + durations[node])
+        length = start[last] + durations[last]
+        path = []
+        while last != -1:
+            path.append(self._ids[last])
+            last = binding[last]
+        path.reverse()
+        return length, path
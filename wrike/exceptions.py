@@ -6,3 +6,63 @@ class WrikeException(Exception):
     """
 
     pass
+
+
+class TransientWrikeException(WrikeException):
+    """Raised for failures that may succeed when retried: connection errors,
+    429 Too Many Requests and 5xx server errors
+
+    Args:
+        WrikeException (varies): pass through what to throw
+        status_code (int, optional): HTTP status code, None if no response was received
+        retry_after (float, optional): Seconds the server asked to wait before retrying
+    """
+
+    def __init__(self, *args, status_code: int = None, retry_after: float = None):
+        super().__init__(*args)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class NotFoundWrikeException(WrikeException):
+    """Raised when a requested id is missing from the records Wrike returned
+
+    Args:
+        WrikeException (varies): pass through what to throw
+    """
+
+    pass
+
+
+class WrikeTimeoutException(TransientWrikeException):
+    """Raised when a request times out or an operation runs past its deadline
+
+    Args:
+        TransientWrikeException (varies): pass through what to throw
+    """
+
+    pass
+
+
+class WrikeCancelledException(WrikeException):
+    """Raised when an operation is stopped through its CancellationToken
+
+    Args:
+        WrikeException (varies): pass through what to throw
+    """
+
+    pass
+
+
+class CircuitOpenException(WrikeException):
+    """Raised without sending a request while the circuit of its endpoint is open.
+    Not retried, so callers fail fast while Wrike is degraded
+
+    Args:
+        WrikeException (varies): pass through what to throw
+        retry_after (float, optional): Seconds until the circuit lets a probe through
+    """
+
+    def __init__(self, *args, retry_after: float = None):
+        super().__init__(*args)
+        self.retry_after = retry_after
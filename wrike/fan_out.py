@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+from wrike import deadlines
+
+Item = TypeVar("Item")
+
+# Sentinel put on a queue by a worker once its source iterator is exhausted
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    # Block while the queue is full, but give up as soon as the consumer stops
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, active: Optional[deadlines.Deadline]):
+    # Wait for the next item, but stop as soon as the consumer's operation is cancelled
+    # or out of time, even while every worker is still waiting on Wrike
+    if active is None:
+        return q.get()
+    while True:
+        active.check()
+        try:
+            return q.get(timeout=0.05)
+        except queue.Empty:
+            continue
+
+
+def _drain(source: Callable[[], Iterator[Item]], q: queue.Queue, stop: threading.Event):
+    try:
+        for item in source():
+            if not _put(q, item, stop):
+                return
+    except BaseException as e:
+        _put(q, _Failure(e), stop)
+        return
+    _put(q, _DONE, stop)
+
+
+def fan_out(
+    sources: List[Callable[[], Iterator[Item]]],
+    max_workers: int = 8,
+    ordered: bool = False,
+    max_amt: int = None,
+    buffer_size: int = 1000,
+) -> Iterator[Item]:
+    """Runs several iterators concurrently and merges them into one stream
+
+    Each source is a zero-argument callable returning its own iterator, so every source
+    keeps its own (e.g. paging) state. At most max_workers sources run at a time and
+    each buffers at most buffer_size items ahead of the consumer, so memory stays
+    bounded no matter how large the sources are.
+
+    Args:
+        sources (List[Callable[[], Iterator[Item]]]): Callables returning the iterators to merge
+        max_workers (int, optional): Max number of sources iterated concurrently. Defaults to 8.
+        ordered (bool, optional): If True, yield all items of the first source, then the
+            second, and so on; otherwise yield items as they arrive. Defaults to False.
+        max_amt (int, optional): Global cap on the number of items yielded across all
+            sources, None for no cap. Defaults to None.
+        buffer_size (int, optional): Max number of items buffered per queue. Defaults to 1000.
+
+    Sources run with the consumer's deadline and cancellation token, see wrike.deadlines.
+
+    Raises:
+        WrikeTimeoutException: The consumer's deadline passed
+        WrikeCancelledException: The consumer's operation was cancelled
+        BaseException: The first exception raised by any source, re-raised to the consumer
+
+    Yields:
+        Iterator[Item]: Merged items from all sources
+    """
+    if not sources or (max_amt is not None and max_amt <= 0):
+        return
+    active = deadlines.current()
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources))))
+    if ordered:
+        queues = [queue.Queue(maxsize=buffer_size) for _ in sources]
+    else:
+        queues = [queue.Queue(maxsize=buffer_size)] * len(sources)
+    try:
+        for source, q in zip(sources, queues):
+            executor.submit(deadlines.bind(_drain, source, q, stop))
+
+        amt_yielded = 0
+        q_index = 0
+        remaining = len(sources)
+        while remaining:
+            item = _get(queues[q_index], active)
+            if item is _DONE:
+                remaining -= 1
+                if ordered:
+                    q_index += 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+            amt_yielded += 1
+            if max_amt is not None and amt_yielded >= max_amt:
+                return
+    finally:
+        # Also reached when the consumer closes the generator early
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,128 @@
+from collections import deque
+import math
+import threading
+from typing import Deque, Dict, Optional
+
+from wrike.page_sizing import endpoint_group
+
+
+class _Latencies:
+    def __init__(self, size: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.added = 0
+        self.delay: Optional[float] = None
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 1000,
+        refresh: int = 32,
+        max_workers: int = 32,
+    ) -> None:
+        """When to send a second copy of a GET whose response is late
+
+        A GET that has not been answered after the given percentile of the recent
+        latencies of its endpoint group (see page_sizing.endpoint_group) is sent again,
+        and whichever copy answers first wins. Hedges are only sent while they stay
+        within budget of all GETs, so a slow Wrike never sees more than that much
+        extra traffic.
+
+        Args:
+            percentile (float, optional): Percentile of recent latencies to wait for
+                before hedging. Defaults to 95.0.
+            budget (float, optional): Max hedges as a fraction of GETs. Defaults to 0.05.
+            min_delay (float, optional): Shortest wait before hedging, in seconds.
+                Defaults to 0.01.
+            min_samples (int, optional): Latencies an endpoint group needs before its
+                GETs are hedged. Defaults to 20.
+            window (int, optional): Recent latencies kept per endpoint group.
+                Defaults to 1000.
+            refresh (int, optional): New latencies between recomputing the percentile.
+                Defaults to 32.
+            max_workers (int, optional): Threads sending the copies of hedged GETs.
+                Defaults to 32.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(
+                f"percentile must be between 0 and 100, {percentile} was provided"
+            )
+        if not 0 <= budget <= 1:
+            raise ValueError(f"budget must be between 0 and 1, {budget} was provided")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.refresh = refresh
+        self.max_workers = max_workers
+        self._latencies: Dict[str, _Latencies] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    def _group(self, endpoint: str) -> _Latencies:
+        group = endpoint_group(endpoint)
+        latencies = self._latencies.get(group)
+        if latencies is None:
+            latencies = self._latencies[group] = _Latencies(self.window)
+        return latencies
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait for a GET before hedging it, None to never hedge it
+
+        Every call counts as one GET towards the budget.
+        """
+        with self._lock:
+            self.requests += 1
+            return self._group(endpoint).delay
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Adds the latency of an answered GET"""
+        with self._lock:
+            latencies = self._group(endpoint)
+            latencies.samples.append(latency)
+            latencies.added += 1
+            # Sorting the window on every response would cost more than it saves
+            if len(latencies.samples) >= self.min_samples and (
+                latencies.delay is None or latencies.added % self.refresh == 0
+            ):
+                ordered = sorted(latencies.samples)
+                rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+                latencies.delay = max(self.min_delay, ordered[rank])
+
+    def try_hedge(self) -> bool:
+        """Takes a hedge from the budget, False when it is spent"""
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                self.over_budget += 1
+                return False
+            self.hedges += 1
+            return True
+
+    def won(self) -> None:
+        """Counts a hedge that answered before the GET it copied"""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def metrics(self) -> Dict:
+        """Hedge counts and rates, for dashboards and logs"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "over_budget": self.over_budget,
+                "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+                "win_rate": self.hedge_wins / self.hedges if self.hedges else 0.0,
+                "delays": {
+                    group: latencies.delay
+                    for group, latencies in self._latencies.items()
+                },
+            }
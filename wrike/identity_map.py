@@ -0,0 +1,84 @@
+import threading
+from typing import Optional, Type
+import weakref
+
+from wrike.models import Model
+from wrike.schema import RAW_PREFIX
+
+# Attributes compared to tell whether an incoming copy is older than the mapped one
+_FRESHNESS_ATTRS = ("updated_date", "updatedDate")
+
+
+def _updated(model: Model):
+    for attr in _FRESHNESS_ATTRS:
+        # getattr, so a lazily converted date is compared converted
+        value = getattr(model, attr, None)
+        if value:
+            return value
+    return None
+
+
+class IdentityMap:
+    def __init__(self) -> None:
+        """Maps each (model class, Wrike id) to the one live model instance of it
+
+        Entries are weak references, so a model nobody uses any more drops out of the map.
+        Safe to share between threads.
+        """
+        self._models = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def merge(self, model: Model) -> Model:
+        """Returns the mapped instance for the model's id, updated in place with the
+            model's attributes unless the model is older, or maps the model if it is new
+
+        Args:
+            model (Model): Freshly built model
+
+        Returns:
+            Model: The one live instance for the model's id
+        """
+        id = model.__dict__.get("id")
+        if id is None:
+            return model
+        key = (type(model), id)
+        with self._lock:
+            existing = self._models.get(key)
+            if existing is None:
+                self._models[key] = model
+                self.misses += 1
+                return model
+            self.hits += 1
+        incoming, current = _updated(model), _updated(existing)
+        if not (
+            incoming
+            and current
+            and type(incoming) is type(current)
+            and incoming < current
+        ):
+            attrs = existing.__dict__
+            attrs.update(model.__dict__)
+            # A raw value arriving for a lazy field outdates the one converted earlier
+            for key in model.__dict__:
+                if key.startswith(RAW_PREFIX):
+                    attrs.pop(key[len(RAW_PREFIX) :], None)
+        return existing
+
+    def get(self, model: Type[Model], id: str) -> Optional[Model]:
+        """Returns the live instance of a model class and id, None if there is none"""
+        return self._models.get((model, id))
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of merged models that were already mapped"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,28 @@
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    def __init__(self, name: str) -> None:
+        """Stands in for a module that is only imported when one of its attributes is
+            first read, e.g. requests, which costs more to import than the rest of wrike
+
+        Every attribute read goes through importlib.import_module, which returns the
+        module from sys.modules once imported and is safe to call from several threads.
+
+        Args:
+            name (str): Absolute name of the module
+        """
+        super().__init__(name)
+
+    def __getattr__(self, attr: str):
+        return getattr(importlib.import_module(self.__name__), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Returns the module if it is already imported, otherwise a LazyModule for it"""
+    return sys.modules.get(name) or LazyModule(name)
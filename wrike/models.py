@@ -1,11 +1,25 @@
 from datetime import datetime
 from enum import Enum
-from requests.structures import CaseInsensitiveDict
-from typing import Dict, List, Optional, TypeVar
-import warnings
-
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from wrike.conversion import (
+    CONVERSIONS,
+    enum_converter,
+    intern_id,
+    parse_date,
+    parse_datetime,
+)
 from wrike.exceptions import WrikeException
-from wrike.warnings import KindWarning
+from wrike.schema import (
+    RAW_PREFIX,
+    REQUIRED,
+    Field,
+    compile_from_dict,
+    compile_to_dict,
+)
+
+if TYPE_CHECKING:
+    from requests.structures import CaseInsensitiveDict
 
 Model = TypeVar("Model", covariant=True)
 
@@ -57,6 +71,22 @@ class Role(Enum):
     USER = "User"
 
 
+# Value to member tables, built once for every Enum above
+ENUM_CONVERTERS = {
+    enum: enum_converter(enum)
+    for enum in (
+        AccessType,
+        ContractType,
+        TypeEnum,
+        Importance,
+        TaskScope,
+        Scope,
+        Status,
+        Role,
+    )
+}
+
+
 class Dates:
     type: TypeEnum
     duration: Optional[int]
@@ -137,22 +167,25 @@ class Project:
 
 class Result:
     status_code: int
-    headers: CaseInsensitiveDict
+    headers: "CaseInsensitiveDict"
     message: str
     kind: str
     state: str
     next_page_token: str
     response_size: int
     data: List[Dict]
+    content: Optional[bytes]
+    stale: bool
     _response_data: Dict
     _data: List[Dict]
 
     def __init__(
         self,
         status_code: int,
-        headers: CaseInsensitiveDict,
+        headers: "CaseInsensitiveDict",
         message: str = "",
         data: Dict = None,
+        content: bytes = None,
     ):
         """Result returned from low-level RestAdapter
 
@@ -160,10 +193,15 @@ class Result:
             status_code (int): Standard HTTP Status code
             message (str, optional): Human readable result. Defaults to ''.
             data (Dict, optional): Python Dictionary. Defaults to None.
+            content (bytes, optional): Raw response body, only set when the JSON was left
+                undecoded for the caller to decode. Defaults to None.
         """
         self.status_code = int(status_code)
         self.headers = headers
         self.message = str(message)
+        self.content = content
+        # Set on a cached copy served while the endpoint's circuit is open
+        self.stale = False
         self._response_data = data if data else {}
         self._parse_data(**self._response_data)
 
@@ -206,28 +244,116 @@ class Result:
         ]
         self.__dict__.update(kwargs)
 
+    def check_kind(self, expected_kind: str, records: int = None) -> bool:
+        """Checks the kind of the response once for all of its records
+
+        Args:
+            expected_kind (str): The expected entity type
+            records (int, optional): Number of records in the response, for records
+                decoded outside of this Result, None to count its data. Defaults to None.
+
+        Returns:
+            bool: True if the kind matches, or there are no records to check
+        """
+        if records is None:
+            records = len(self._data)
+        return not records or not expected_kind or self.kind == expected_kind
+
+
+class _Compiled:
+    def __init__(self, name: str, compile: Callable[[type], object]) -> None:
+        # Compiles an attribute of a model class on first access, then replaces itself
+        # on the class with the result, so later accesses cost nothing extra
+        self._name = name
+        self._compile = compile
+
+    def __get__(self, instance: object, owner: type):
+        setattr(owner, self._name, self._compile(owner))
+        return getattr(owner if instance is None else instance, self._name)
+
 
 class Method:
     kind: str
     state: str
     next_page_token: str
     response_size: int
-    _expected_kind: str
+    _expected_kind: str = ""
+    # Fields every record carries from its response, see Result.data
+    _envelope = (
+        Field("kind", default=""),
+        Field("state", default=""),
+        Field("next_page_token", default=""),
+        Field("response_size", default=0),
+    )
+    _schema: Tuple[Field, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Each model's schema is compiled once, on the first from_dict or to_dict, so
+        # importing the models costs no code generation
+        super().__init_subclass__(**kwargs)
+        cls._converters = {f.attr: f.converter for f in cls._schema if f.converter}
+        cls._constructors = {}
+        cls.from_dict = _Compiled(
+            "from_dict", lambda model: staticmethod(model.constructor("off"))
+        )
+        cls.to_dict = _Compiled(
+            "to_dict",
+            lambda model: compile_to_dict(
+                model, model._schema, tuple(field.attr for field in model._envelope)
+            ),
+        )
+
+    @classmethod
+    def constructor(cls, conversion: str = "off"):
+        """Returns the compiled from_dict for a conversion, compiling it on first use
+
+        Args:
+            conversion (str, optional): 'off' keeps values as they arrive, 'eager'
+                converts dates, enums and ids while building, 'lazy' converts each field
+                on its first access. Defaults to 'off'.
+
+        Raises:
+            ValueError: Unknown conversion
+
+        Returns:
+            Callable[[Dict], Model]: Builds one instance from one record
+        """
+        try:
+            return cls._constructors[conversion]
+        except KeyError:
+            if conversion not in CONVERSIONS:
+                raise ValueError(
+                    f"Expected conversion to be in {CONVERSIONS}, {conversion} was provided"
+                )
+        constructor = compile_from_dict(cls, cls._envelope + cls._schema, conversion)
+        return cls._constructors.setdefault(conversion, constructor)
+
+    def __getattr__(self, name: str):
+        # Only reached for unset attributes: converts a lazily built field on first access
+        attrs = self.__dict__
+        try:
+            raw = attrs[RAW_PREFIX + name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        value = attrs[name] = self._converters[name](raw)
+        attrs.pop(RAW_PREFIX + name, None)
+        return value
 
     def __init__(
         self,
-        expected_kind: str = "",
         kind: str = "",
         state: str = "",
         next_page_token: str = "",
         response_size: int = 0,
         **kwargs,
     ):
-        """Base class for Wrike based method classes that confirms the response kind matches
-            the expected kind, and passes along state
+        """Base class for Wrike based method classes that passes along state. Subclasses
+            declare the kind of response they are built from as _expected_kind, which
+            is checked once per response by Result.check_kind
 
         Args:
-            expected_kind (str, optional): The expected entity type. Defaults to ''.
             kind (str, optional): The entity type. Defaults to ''.
             state (str, optional): Client can pass an additional state parameter. Defaults to ''.
             next_page_token (str, optional): The returned pagination token.
@@ -236,19 +362,42 @@ class Method:
                 Divide by your page size to get the number of pages.
                 Returned in response if page size was provided. Defaults to 0.
         """
-        self._expected_kind = expected_kind
         self.kind = kind
         self.state = state
         self.next_page_token = next_page_token
         self.response_size = response_size
-        if self._expected_kind != self.kind:
-            warnings.warn(
-                f"Response kind ({self.kind}) does not match expected kind ({self._expected_kind})",
-                KindWarning,
-            )
 
 
 class Contact(Method):
+    _expected_kind = "contacts"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("firstName", "first_name"),
+        Field("lastName", "last_name"),
+        Field("type"),
+        Field("profiles"),
+        Field("avatarUrl", "avatar_url"),
+        Field("timezone"),
+        Field("locale"),
+        Field("deleted"),
+        Field("me"),
+        Field("memberIds", "member_ids"),
+        Field("metadata"),
+        Field("myTeam", "my_team"),
+        Field("title"),
+        Field("companyName", "company_name"),
+        Field("phone"),
+        Field("location"),
+        Field("workScheduleId", "work_schedule_id"),
+        Field("currentBillRate", "current_bill_rate"),
+        Field("currentCostRate", "current_cost_rate"),
+        Field("jobRoleId", "job_role_id"),
+        Field("primaryEmail", "primary_email"),
+        Field("customFields", "custom_fields"),
+        Field("billRateHistory", "bill_rate_history"),
+        Field("costRateHistory", "cost_rate_history"),
+    )
+
     def __init__(
         self,
         id: str,
@@ -311,7 +460,7 @@ class Contact(Method):
             billRateHistory (List[Dict], optional): Bill rate change history. Defaults to None.
             costRateHistory (List[Dict], optional): Cost rate change history. Defaults to None.
         """
-        super().__init__("contacts", **kwargs)
+        super().__init__(**kwargs)
         self.id = id
         self.first_name = firstName
         self.last_name = lastName
@@ -354,6 +503,17 @@ class Contact(Method):
 
 
 class Folder(Method):
+    _expected_kind = "folders"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("title", default=REQUIRED),
+        Field("childIds", "child_ids", default=REQUIRED),
+        Field("scope", default=REQUIRED, converter=ENUM_CONVERTERS[Scope]),
+        Field("customColumnIds", "custom_column_ids", default_factory=list),
+        Field("space", default=False),
+        Field("project", default_factory=list),
+    )
+
     id: str
     title: str
     child_ids: List[str]
@@ -374,7 +534,7 @@ class Folder(Method):
         **kwargs,
     ) -> None:
         # TODO: Folders & Projects https://developers.wrike.com/api/v4/folders-projects/
-        super().__init__("tasks", **kwargs)
+        super().__init__(**kwargs)
         self.id = id
         self.title = title
         self.child_ids = childIds
@@ -386,6 +546,23 @@ class Folder(Method):
 
 
 class Task(Method):
+    _expected_kind = "tasks"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("accountId", "account_id", default="", converter=intern_id),
+        Field("title", default=REQUIRED),
+        Field("status", default=REQUIRED, converter=ENUM_CONVERTERS[Status]),
+        Field("importance", default=REQUIRED, converter=ENUM_CONVERTERS[Importance]),
+        Field("createdDate", "created_date", converter=parse_datetime),
+        Field("updatedDate", "updated_date", converter=parse_datetime),
+        Field("completedDate", "completed_date", converter=parse_datetime),
+        Field("dates", default=REQUIRED),
+        Field("scope", default=REQUIRED, converter=ENUM_CONVERTERS[TaskScope]),
+        Field("customStatusId", "custom_status_id", default=""),
+        Field("permalink", default=REQUIRED),
+        Field("priority", default=REQUIRED),
+    )
+
     id: str
     account_id: Optional[str]
     title: str
@@ -410,32 +587,45 @@ class Task(Method):
         scope: TaskScope,
         permalink: str,
         priority: str,
-        account_id: str = "",
-        created_date: datetime = None,
-        updated_date: datetime = None,
-        completed_date: datetime = None,
-        custom_status_id: str = "",
+        accountId: str = "",
+        createdDate: datetime = None,
+        updatedDate: datetime = None,
+        completedDate: datetime = None,
+        customStatusId: str = "",
         **kwargs,
     ) -> None:
         # TODO: Create Docstring https://developers.wrike.com/api/v4/tasks/
-        super().__init__("tasks", **kwargs)
+        super().__init__(**kwargs)
         self.id = id
-        self.account_id = account_id
+        self.account_id = accountId
         self.title = title
         self.status = status
         self.importance = importance
-        self.created_date = created_date
-        self.updated_date = updated_date
-        self.completed_date = completed_date
+        self.created_date = createdDate
+        self.updated_date = updatedDate
+        self.completed_date = completedDate
         self.dates = dates
         self.scope = scope
-        self.custom_status_id = custom_status_id
+        self.custom_status_id = customStatusId
         self.permalink = permalink
         self.priority = priority
         self.__dict__.update(kwargs)
 
 
 class Comment(Method):
+    _expected_kind = "comments"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("authorId", "author_id", default=REQUIRED, converter=intern_id),
+        Field("text", default=REQUIRED),
+        Field("updatedDate", "updated_date", converter=parse_datetime),
+        Field(
+            "createdDate", "created_date", default=REQUIRED, converter=parse_datetime
+        ),
+        Field("taskId", "task_id"),
+        Field("folderId", "folder_id"),
+    )
+
     id: str
     author_id: str
     text: str
@@ -447,12 +637,12 @@ class Comment(Method):
     def __init__(
         self,
         id: str,
-        author_id: str,
+        authorId: str,
         text: str,
-        updated_date: datetime,
-        created_date: datetime,
-        task_id: Optional[str],
-        folder_id: Optional[str],
+        createdDate: datetime,
+        updatedDate: datetime = None,
+        taskId: Optional[str] = None,
+        folderId: Optional[str] = None,
         **kwargs,
     ) -> None:
         """Comments
@@ -460,53 +650,231 @@ class Comment(Method):
 
         Args:
             id (str): Comment ID
-            author_id (str): Author ID
+            authorId (str): Author ID
             text (str): Comment text
-            updated_date (datetime): Deprecated because this field gets created date instead of updated date.
+            createdDate (datetime): Created date
+            updatedDate (datetime, optional): Deprecated because this field gets created date instead of updated date.
                 Please use the createdDate field instead.
-            created_date (datetime): Created date
-            task_id (Optional[str]): ID of related task. Only one of taskId/folderId fields is present
-            folder_id (Optional[str]): ID of related folder. Only one of taskId/folderId fields is present
+            taskId (Optional[str], optional): ID of related task. Only one of taskId/folderId fields is present
+            folderId (Optional[str], optional): ID of related folder. Only one of taskId/folderId fields is present
         """
-        super().__init__("comments", **kwargs)
+        super().__init__(**kwargs)
         self.id = id
-        self.author_id = author_id
+        self.author_id = authorId
         self.text = text
-        self.updated_date = updated_date
-        self.created_date = created_date
-        self.task_id = task_id
-        self.folder_id = folder_id
+        self.updated_date = updatedDate
+        self.created_date = createdDate
+        self.task_id = taskId
+        self.folder_id = folderId
         self.__dict__.update(kwargs)
 
 
 class Dependency(Method):
+    _expected_kind = "dependencies"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("predecessorId", "predecessor_id", default=REQUIRED),
+        Field("successorId", "successor_id", default=REQUIRED),
+        Field("relationType", "relation_type", default=REQUIRED),
+        Field("lagTime", "lag_time", default=0),
+    )
+
+    id: str
+    predecessor_id: str
+    successor_id: str
+    relation_type: str
+    lag_time: int
+
     def __init__(
         self,
         id: str,
-        predecessor_id: str,
-        successor_id: str,
-        relation_type: str,
-        lag_time: int,
+        predecessorId: str,
+        successorId: str,
+        relationType: str,
+        lagTime: int = 0,
         **kwargs,
     ) -> None:
-        # TODO: Create Docstring https://developers.wrike.com/api/v4/dependencies/
-        super().__init__("version", **kwargs)
+        """Dependency between two tasks
+        https://developers.wrike.com/api/v4/dependencies/
+
+        Args:
+            id (str): Dependency ID
+            predecessorId (str): Predecessor task ID
+            successorId (str): Successor task ID
+            relationType (str): Relation type, one of StartToStart, StartToFinish,
+                FinishToStart, FinishToFinish
+            lagTime (int, optional): Lag time in minutes. Defaults to 0.
+        """
+        super().__init__(**kwargs)
         self.id = id
-        self.predecessor_id = predecessor_id
-        self.successor_id = successor_id
-        self.relation_type = relation_type
-        self.lag_time = lag_time
+        self.predecessor_id = predecessorId
+        self.successor_id = successorId
+        self.relation_type = relationType
+        self.lag_time = lagTime
         self.__dict__.update(kwargs)
 
 
-# TODO: Timelogs https://developers.wrike.com/api/v4/timelogs/
+class Timelog(Method):
+    _expected_kind = "timelogs"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("taskId", "task_id", default=REQUIRED),
+        Field("userId", "user_id", default=REQUIRED, converter=intern_id),
+        Field("categoryId", "category_id"),
+        Field("hours", default=REQUIRED),
+        Field("createdDate", "created_date", converter=parse_datetime),
+        Field("updatedDate", "updated_date", converter=parse_datetime),
+        Field("trackedDate", "tracked_date", default=REQUIRED, converter=parse_date),
+        Field("comment", default=""),
+        Field("billingType", "billing_type", converter=ENUM_CONVERTERS[ContractType]),
+    )
+
+    id: str
+    task_id: str
+    user_id: str
+    category_id: Optional[str]
+    hours: float
+    created_date: datetime
+    updated_date: datetime
+    tracked_date: str
+    comment: str
+    billing_type: Optional[str]
+
+    def __init__(
+        self,
+        id: str,
+        taskId: str,
+        userId: str,
+        hours: float,
+        trackedDate: str,
+        createdDate: datetime = None,
+        updatedDate: datetime = None,
+        categoryId: Optional[str] = None,
+        comment: str = "",
+        billingType: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Timelogs
+        https://developers.wrike.com/api/v4/timelogs/
+
+        Args:
+            id (str): Timelog ID
+            taskId (str): ID of the task the time was logged on
+            userId (str): ID of the user who logged the time
+            hours (float): Hours logged
+            trackedDate (str): Date the time was tracked for, e.g. 2024-01-31
+            createdDate (datetime, optional): Created date. Defaults to None.
+            updatedDate (datetime, optional): Updated date. Defaults to None.
+            categoryId (Optional[str], optional): Timelog category ID. Defaults to None.
+            comment (str, optional): Comment. Defaults to ''.
+            billingType (Optional[str], optional): Billable or NonBillable. Defaults to None.
+        """
+        super().__init__(**kwargs)
+        self.id = id
+        self.task_id = taskId
+        self.user_id = userId
+        self.category_id = categoryId
+        self.hours = hours
+        self.created_date = createdDate
+        self.updated_date = updatedDate
+        self.tracked_date = trackedDate
+        self.comment = comment
+        self.billing_type = billingType
+        self.__dict__.update(kwargs)
+
 
 # TODO: Timelog categories https://developers.wrike.com/api/v4/timelog-categories/
 
-# TODO: Attachments https://developers.wrike.com/api/v4/attachments/
+
+class Attachment(Method):
+    _expected_kind = "attachments"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("authorId", "author_id", default=REQUIRED, converter=intern_id),
+        Field("name", default=REQUIRED),
+        Field(
+            "createdDate", "created_date", default=REQUIRED, converter=parse_datetime
+        ),
+        Field("version", default=1),
+        Field("size"),
+        Field("type", default=""),
+        Field("contentType", "content_type", default=""),
+        Field("taskId", "task_id"),
+        Field("folderId", "folder_id"),
+        Field("commentId", "comment_id"),
+        Field("url"),
+    )
+
+    id: str
+    author_id: str
+    name: str
+    created_date: datetime
+    version: int
+    size: int
+    type: str
+    content_type: str
+    task_id: Optional[str]
+    folder_id: Optional[str]
+    comment_id: Optional[str]
+    url: Optional[str]
+
+    def __init__(
+        self,
+        id: str,
+        authorId: str,
+        name: str,
+        createdDate: datetime,
+        version: int = 1,
+        size: int = None,
+        type: str = "",
+        contentType: str = "",
+        taskId: Optional[str] = None,
+        folderId: Optional[str] = None,
+        commentId: Optional[str] = None,
+        url: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Attachments
+        https://developers.wrike.com/api/v4/attachments/
+
+        Args:
+            id (str): Attachment ID
+            authorId (str): ID of the user who uploaded the attachment
+            name (str): Attachment filename
+            createdDate (datetime): Created date
+            version (int, optional): Version number. Defaults to 1.
+            size (int, optional): Size in bytes, unknown for external attachments. Defaults to None.
+            type (str, optional): Storage, e.g. Wrike or Google. Defaults to ''.
+            contentType (str, optional): MIME type. Defaults to ''.
+            taskId (Optional[str], optional): ID of related task. Defaults to None.
+            folderId (Optional[str], optional): ID of related folder. Defaults to None.
+            commentId (Optional[str], optional): ID of related comment. Defaults to None.
+            url (Optional[str], optional): Download URL, present when requested with
+                withUrls. Defaults to None.
+        """
+        super().__init__(**kwargs)
+        self.id = id
+        self.author_id = authorId
+        self.name = name
+        self.created_date = createdDate
+        self.version = version
+        self.size = size
+        self.type = type
+        self.content_type = contentType
+        self.task_id = taskId
+        self.folder_id = folderId
+        self.comment_id = commentId
+        self.url = url
+        self.__dict__.update(kwargs)
 
 
 class Version(Method):
+    _expected_kind = "version"
+    _schema = (
+        Field("major", default=REQUIRED),
+        Field("minor", default=REQUIRED),
+    )
+
     major: str
     minor: str
 
@@ -523,7 +891,7 @@ class Version(Method):
             major (int): Major version number
             minor (int): Minor version number
         """
-        super().__init__("version", **kwargs)
+        super().__init__(**kwargs)
         self.major = major
         self.minor = minor
         self.__dict__.update(kwargs)
@@ -535,6 +903,26 @@ class Version(Method):
 
 
 class Space(Method):
+    _expected_kind = "spaces"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("title", default=REQUIRED),
+        Field("avatarUrl", "avatar_url", default=REQUIRED),
+        Field(
+            "accessType",
+            "access_type",
+            default=REQUIRED,
+            converter=ENUM_CONVERTERS[AccessType],
+        ),
+        Field("archived", default=REQUIRED),
+        Field("guestRoleId", "guest_role_id", default=REQUIRED),
+        Field(
+            "defaultProjectWorkflowId", "default_project_workflow_id", default=REQUIRED
+        ),
+        Field("defaultTaskWorkflowId", "default_task_workflow_id", default=REQUIRED),
+        Field("description", default=""),
+    )
+
     id: str
     title: str
     avatar_url: str
@@ -558,8 +946,9 @@ class Space(Method):
         description: Optional[str] = "",
         **kwargs,
     ) -> None:
-        # TODO: Spaces https://developers.wrike.com/api/v4/spaces/self.id = id
-        super().__init__("spaces", **kwargs)
+        # TODO: Spaces https://developers.wrike.com/api/v4/spaces/
+        super().__init__(**kwargs)
+        self.id = id
         self.title = title
         self.avatar_url = avatarUrl
         self.access_type = accessType
@@ -571,13 +960,89 @@ class Space(Method):
         self.__dict__.update(kwargs)
 
 
-# TODO: Data Export https://developers.wrike.com/api/v4/data-export/
+class DataExport(Method):
+    _expected_kind = "data_export"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("status", default=REQUIRED),
+        Field("completedDate", "completed_date", converter=parse_datetime),
+        Field("resources", default_factory=list),
+    )
+
+    id: str
+    completed_date: Optional[datetime]
+    status: str
+    resources: List[Dict]
+
+    def __init__(
+        self,
+        id: str,
+        status: str,
+        completedDate: datetime = None,
+        resources: List[Dict] = None,
+        **kwargs,
+    ) -> None:
+        """Data Export
+        https://developers.wrike.com/api/v4/data-export/
+
+        Args:
+            id (str): Data export ID
+            status (str): Export status, e.g. InProgress or Completed
+            completedDate (datetime, optional): Date the export was completed. Defaults to None.
+            resources (List[Dict], optional): Exported CSV files, each with a name and url.
+                Defaults to None.
+        """
+        super().__init__(**kwargs)
+        self.id = id
+        self.status = status
+        self.completed_date = completedDate
+        self.resources = resources or []
+        self.__dict__.update(kwargs)
+
 
 # TODO: Audit Log https://developers.wrike.com/api/v4/audit-log/
 
 # TODO: Access Roles https://developers.wrike.com/api/v4/access-roles/
 
-# TODO: Async job https://developers.wrike.com/api/v4/async-job/
+
+class AsyncJob(Method):
+    _expected_kind = "async_job"
+    _schema = (
+        Field("id", default=REQUIRED),
+        Field("status", default=REQUIRED),
+        Field("type", default=""),
+        Field("progress"),
+    )
+
+    id: str
+    status: str
+    type: str
+    progress: Optional[int]
+
+    def __init__(
+        self,
+        id: str,
+        status: str,
+        type: str = "",
+        progress: int = None,
+        **kwargs,
+    ) -> None:
+        """Async job, started by long running operations such as copying a folder
+        https://developers.wrike.com/api/v4/async-job/
+
+        Args:
+            id (str): Async job ID
+            status (str): Job status, e.g. InProgress, Completed or Failed
+            type (str, optional): Job type. Defaults to ''.
+            progress (int, optional): Percent done, if reported. Defaults to None.
+        """
+        super().__init__(**kwargs)
+        self.id = id
+        self.status = status
+        self.type = type
+        self.progress = progress
+        self.__dict__.update(kwargs)
+
 
 # TODO: Approvals https://developers.wrike.com/api/v4/approvals/
 
@@ -0,0 +1,168 @@
+from collections import deque
+import logging
+import math
+import re
+import threading
+import time
+from typing import Deque, Dict, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# Path segments holding one or more Wrike ids, e.g. IEAAAAAQI4AAAAAA
+_ID_SEGMENT = re.compile(r"^[A-Z0-9]{8,}(,[A-Z0-9]{8,})*$")
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Endpoint with its ids replaced by '*', so 'folders/IEAB/tasks' and
+    'folders/IEAC/tasks' share what is learnt about them"""
+    return "/".join(
+        "*" if _ID_SEGMENT.match(segment) else segment
+        for segment in endpoint.strip("/").split("/")
+    )
+
+
+class _EndpointState:
+    def __init__(self, page_size: int) -> None:
+        self.page_size = page_size
+        self.seconds_per_record: float = None
+        self.bytes_per_record: float = None
+
+
+class PageSizeTuner:
+    def __init__(
+        self,
+        min_size: int = 100,
+        max_size: int = 1000,
+        target_latency: float = 2.0,
+        max_bytes: int = 8 << 20,
+        bounds: Dict[str, Tuple[int, int]] = None,
+        smoothing: float = 0.3,
+        history_size: int = 256,
+    ) -> None:
+        """Chooses the pageSize of each endpoint group from the latency and payload size
+            of its earlier pages
+
+        Per record latency and bytes are smoothed per group. The next page is sized to
+        take about target_latency and stay below max_bytes, changing by at most a factor
+        of 2 per page and always within the group's bounds. A page that fails with a
+        transient error halves the size.
+
+        Args:
+            min_size (int, optional): Smallest pageSize. Defaults to 100.
+            max_size (int, optional): Largest pageSize, also the first one tried.
+                Defaults to 1000.
+            target_latency (float, optional): Seconds one page should take. Defaults to 2.0.
+            max_bytes (int, optional): Largest payload one page should carry.
+                Defaults to 8 MiB.
+            bounds (Dict[str, Tuple[int, int]], optional): (min, max) pageSize by endpoint
+                group, see endpoint_group(), overriding min_size and max_size.
+                Defaults to None.
+            smoothing (float, optional): Weight of the newest page in the per record
+                averages. Defaults to 0.3.
+            history_size (int, optional): Number of decisions kept. Defaults to 256.
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError(
+                f"Expected 1 <= min_size <= max_size, {min_size}, {max_size} were provided"
+            )
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.bounds = dict(bounds or {})
+        self.smoothing = smoothing
+        self._states: Dict[str, _EndpointState] = {}
+        self._lock = threading.Lock()
+        # (monotonic time, endpoint group, old size, new size, reason) of every change
+        self.decisions: Deque[Tuple[float, str, int, int, str]] = deque(
+            maxlen=history_size
+        )
+
+    def _bounds(self, group: str) -> Tuple[int, int]:
+        return self.bounds.get(group, (self.min_size, self.max_size))
+
+    def _state(self, group: str) -> _EndpointState:
+        state = self._states.get(group)
+        if state is None:
+            state = self._states[group] = _EndpointState(self._bounds(group)[1])
+        return state
+
+    def page_size(self, endpoint: str) -> int:
+        """pageSize to request next from the endpoint"""
+        with self._lock:
+            return self._state(endpoint_group(endpoint)).page_size
+
+    def _set(self, group: str, state: _EndpointState, size: float, reason: str) -> int:
+        low, high = self._bounds(group)
+        size = min(high, max(low, int(size)))
+        if size != state.page_size:
+            self.decisions.append(
+                (time.monotonic(), group, state.page_size, size, reason)
+            )
+            _logger.info(
+                msg=f"pageSize of {group}: {state.page_size} -> {size} ({reason})"
+            )
+            state.page_size = size
+        return size
+
+    def observe(
+        self,
+        endpoint: str,
+        records: int,
+        latency: float,
+        payload_bytes: int = None,
+    ) -> int:
+        """Records one page and returns the pageSize to request next
+
+        Args:
+            endpoint (str): Endpoint the page came from
+            records (int): Records on the page
+            latency (float): Seconds the page took to fetch
+            payload_bytes (int, optional): Size of the response body, None if unknown.
+                Defaults to None.
+
+        Returns:
+            int: Next pageSize
+        """
+        group = endpoint_group(endpoint)
+        with self._lock:
+            state = self._state(group)
+            # An empty page says nothing about the cost of a record
+            if records <= 0:
+                return state.page_size
+            seconds = latency / records
+            if state.seconds_per_record is None:
+                state.seconds_per_record = seconds
+            else:
+                state.seconds_per_record += self.smoothing * (
+                    seconds - state.seconds_per_record
+                )
+            if payload_bytes:
+                per_record = payload_bytes / records
+                if state.bytes_per_record is None:
+                    state.bytes_per_record = per_record
+                else:
+                    state.bytes_per_record += self.smoothing * (
+                        per_record - state.bytes_per_record
+                    )
+            wanted = (
+                self.target_latency / state.seconds_per_record
+                if state.seconds_per_record > 0
+                else math.inf
+            )
+            reason = f"{latency:.2f}s for {records} records"
+            if state.bytes_per_record:
+                by_bytes = self.max_bytes / state.bytes_per_record
+                if by_bytes < wanted:
+                    wanted = by_bytes
+                    reason = f"{state.bytes_per_record * records:.0f} bytes for {records} records"
+            # At most double or halve per page, so one outlier cannot swing it far
+            wanted = min(max(wanted, state.page_size / 2), state.page_size * 2)
+            return self._set(group, state, wanted, reason)
+
+    def failed(self, endpoint: str) -> int:
+        """Halves the pageSize after a page failed, e.g. timed out, and returns it"""
+        group = endpoint_group(endpoint)
+        with self._lock:
+            state = self._state(group)
+            return self._set(group, state, state.page_size / 2, "failed")
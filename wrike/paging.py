@@ -0,0 +1,376 @@
+import logging
+import math
+import random
+import time
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+from wrike import deadlines
+from wrike.exceptions import TransientWrikeException, WrikeTimeoutException
+from wrike.models import Model, Result
+from wrike.page_sizing import PageSizeTuner
+from wrike.schema import RAW_PREFIX
+
+_logger = logging.getLogger(__name__)
+
+
+class PageCursor:
+    endpoint: str
+    model: str
+    ep_params: Dict
+    page_size: int
+    max_amt: int
+    page_token: str
+    page_offset: int
+    next_page_token: str
+    amt_yielded: int
+    curr_page: int
+    last_page: int
+    response_size: int
+
+    def __init__(
+        self,
+        endpoint: str,
+        model: str,
+        ep_params: Dict = None,
+        page_size: int = 1000,
+        max_amt: int = 1000,
+        page_token: str = "",
+        page_offset: int = 0,
+        next_page_token: str = "",
+        amt_yielded: int = 0,
+        curr_page: int = 0,
+        last_page: int = 0,
+        response_size: int = 0,
+        amt_fetched: int = 0,
+    ) -> None:
+        """Serializable position of a Pager, used to resume a paged pull after a failure
+
+        Args:
+            endpoint (str): URL Endpoint being paged
+            model (str): Name of the wrike.models class built from each record
+            ep_params (Dict, optional): Endpoint parameters, without paging parameters.
+                Defaults to None.
+            page_size (int, optional): Page size requested from Wrike. Defaults to 1000.
+            max_amt (int, optional): Max number of models to yield overall. Defaults to 1000.
+            page_token (str, optional): Token that fetched the page being consumed,
+                '' for the first page. Defaults to ''.
+            page_offset (int, optional): Number of records already yielded from that page.
+                Defaults to 0.
+            next_page_token (str, optional): Token of the page after the one being consumed.
+                Defaults to ''.
+            amt_yielded (int, optional): Number of models yielded so far. Defaults to 0.
+            curr_page (int, optional): Number of pages fetched so far. Defaults to 0.
+            last_page (int, optional): Last page number, from the response size. Defaults to 0.
+            response_size (int, optional): Total number of records reported by Wrike.
+                Defaults to 0.
+            amt_fetched (int, optional): Number of records on the pages before the one
+                being consumed, which sizes the remaining pages when pageSize varies.
+                Defaults to 0.
+        """
+        self.endpoint = endpoint
+        self.model = model
+        self.ep_params = dict(ep_params or {})
+        self.page_size = page_size
+        self.max_amt = max_amt
+        self.page_token = page_token
+        self.page_offset = page_offset
+        self.next_page_token = next_page_token
+        self.amt_yielded = amt_yielded
+        self.curr_page = curr_page
+        self.last_page = last_page
+        self.response_size = response_size
+        self.amt_fetched = amt_fetched
+
+    def to_dict(self) -> Dict:
+        """Returns the cursor as a JSON serializable dictionary"""
+        return dict(self.__dict__, ep_params=dict(self.ep_params))
+
+    @classmethod
+    def from_dict(cls, cursor: Dict) -> "PageCursor":
+        """Rebuilds a cursor saved with to_dict()"""
+        return cls(**cursor)
+
+
+def _attrs(model: Model) -> Dict:
+    # Attributes of a model by name, converting lazily built fields instead of
+    # exposing their raw values
+    names = dict.fromkeys(
+        name[len(RAW_PREFIX) :] if name.startswith(RAW_PREFIX) else name
+        for name in model.__dict__
+    )
+    return {name: getattr(model, name) for name in names}
+
+
+class Batch:
+    items: List[Union[Model, Dict]]
+    response_size: int
+    next_page_token: str
+    fetch_latency: float
+    pages: int
+
+    def __init__(
+        self,
+        items: List[Union[Model, Dict]],
+        response_size: int = 0,
+        next_page_token: str = "",
+        fetch_latency: float = 0.0,
+        pages: int = 0,
+    ) -> None:
+        """A batch of records from a paged endpoint with the metadata of the pages it came from
+
+        Args:
+            items (List[Union[Model, Dict]]): Models, or raw records when paging with raw=True
+            response_size (int, optional): Total number of records reported by Wrike.
+                Defaults to 0.
+            next_page_token (str, optional): Token of the page after the last page fetched.
+                Defaults to ''.
+            fetch_latency (float, optional): Seconds spent fetching the pages that were
+                first read by this batch. Defaults to 0.0.
+            pages (int, optional): Number of pages first read by this batch. Defaults to 0.
+        """
+        self.items = items
+        self.response_size = response_size
+        self.next_page_token = next_page_token
+        self.fetch_latency = fetch_latency
+        self.pages = pages
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Union[Model, Dict]]:
+        return iter(self.items)
+
+    def columns(self) -> Dict[str, List]:
+        """Returns the batch as columns, one list per attribute (or record key when raw),
+        with None where an item lacks the attribute"""
+        records = [
+            item if isinstance(item, dict) else _attrs(item) for item in self.items
+        ]
+        keys = {}
+        for record in records:
+            keys.update(dict.fromkeys(record))
+        return {key: [record.get(key) for record in records] for key in keys}
+
+
+class Pager:
+    def __init__(
+        self,
+        client,
+        endpoint: str,
+        model: Callable[..., Model],
+        max_amt: int = 1000,
+        ep_params: Dict = None,
+        page_size: int = 1000,
+        cursor: PageCursor = None,
+        retries: int = 3,
+        retry_backoff: float = 0.5,
+        page_sizer: PageSizeTuner = None,
+    ) -> None:
+        """Iterator over the models of a paged Wrike endpoint that can be checkpointed
+            through its cursor and resumed from it
+
+        Args:
+            client (Wrike): Client whose RestAdapter fetches pages and which builds the models
+            endpoint (str): URL Endpoint to page through
+            model (Callable[..., Model]): Model class built from each record
+            max_amt (int, optional): Max number of models to yield. Defaults to 1000.
+            ep_params (Dict, optional): Endpoint parameters. Defaults to None.
+            page_size (int, optional): Page size requested from Wrike. Defaults to 1000.
+            cursor (PageCursor, optional): Saved cursor to resume from; overrides the paging
+                arguments above. Defaults to None.
+            retries (int, optional): Retries of a page on a TransientWrikeException before
+                it is raised to the caller. Defaults to 3.
+            retry_backoff (float, optional): Seconds to wait before the first retry,
+                doubled on every further retry. Defaults to 0.5.
+            page_sizer (PageSizeTuner, optional): Picks the pageSize of each page from
+                the latency and size of earlier ones instead of page_size.
+                Defaults to None.
+        """
+        self._client = client
+        self._model = model
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        self._page_sizer = page_sizer
+        if cursor is None and page_sizer is not None:
+            page_size = page_sizer.page_size(endpoint)
+        self._cursor = cursor or PageCursor(
+            endpoint, model.__name__, ep_params, page_size, max_amt
+        )
+        # pageSize of the page after the current one; a resumed page keeps its own size
+        self._next_page_size = self._cursor.page_size
+        # Pages fetched after the with block that created the Pager keep its deadline
+        self._deadline = deadlines.current()
+        self._iterator = self._iterate()
+
+    @property
+    def cursor(self) -> PageCursor:
+        """Snapshot of the current position, safe to save and resume from later"""
+        return PageCursor.from_dict(self._cursor.to_dict())
+
+    @property
+    def next_page_token(self) -> str:
+        return self._cursor.next_page_token
+
+    @property
+    def amt_yielded(self) -> int:
+        return self._cursor.amt_yielded
+
+    def __iter__(self) -> "Pager":
+        return self
+
+    def __next__(self) -> Model:
+        return next(self._iterator)
+
+    def _fetch(self, page_token: str) -> Result:
+        with deadlines.use(self._deadline or deadlines.current()):
+            return self._fetch_page(page_token)
+
+    def _fetch_page(self, page_token: str) -> Result:
+        ep_params = {**self._cursor.ep_params, "pageSize": self._cursor.page_size}
+        if page_token:
+            ep_params["nextPageToken"] = page_token
+        attempt = 0
+        while True:
+            try:
+                return self._client._get(
+                    endpoint=self._cursor.endpoint, ep_params=ep_params
+                )
+            except TransientWrikeException as e:
+                active = deadlines.current()
+                if active is not None and (active.expired or active.cancelled):
+                    raise
+                # A smaller page may get through a timeout or a server error, unless part
+                # of this one was yielded; a 429 is about the rate, not the page
+                if (
+                    self._page_sizer is not None
+                    and not self._cursor.page_offset
+                    and (
+                        isinstance(e, WrikeTimeoutException)
+                        or (e.status_code or 0) >= 500
+                    )
+                ):
+                    self._cursor.page_size = self._page_sizer.failed(
+                        self._cursor.endpoint
+                    )
+                    ep_params["pageSize"] = self._cursor.page_size
+                if attempt >= self._retries:
+                    raise
+                delay = self._retry_backoff * 2**attempt * (1 + random.random())
+                delay = max(delay, e.retry_after or 0)
+                attempt += 1
+                _logger.warning(
+                    msg=f"Retry {attempt}/{self._retries} of page {self._cursor.curr_page + 1} "
+                    f"of {self._cursor.endpoint} in {delay:.2f}s: {e}"
+                )
+                # Raises at once when the wait would outlast the deadline
+                deadlines.sleep(delay)
+
+    def _next_page(self, raw: bool = False) -> Tuple[List[Union[Model, Dict]], float]:
+        cursor = self._cursor
+        start = time.perf_counter()
+        result = self._fetch(cursor.page_token)
+        latency = time.perf_counter() - start
+        if raw:
+            records = self._client._records(result, self._model)
+        else:
+            records = self._client._models(result, self._model)
+
+        if self._page_sizer is not None:
+            if result.content is not None:
+                payload_bytes = len(result.content)
+            else:
+                payload_bytes = int((result.headers or {}).get("Content-Length") or 0)
+            self._next_page_size = self._page_sizer.observe(
+                cursor.endpoint, len(records), latency, payload_bytes
+            )
+
+        # Increment curr_page by 1 and update the last_page based on header info returned:
+        # this page plus the remaining records at the next page's size
+        cursor.next_page_token = result.next_page_token
+        cursor.curr_page += 1
+        if result.response_size > 0:
+            cursor.response_size = result.response_size
+            remaining = result.response_size - cursor.amt_fetched - len(records)
+            cursor.last_page = cursor.curr_page + int(
+                math.ceil(max(remaining, 0) / self._next_page_size)
+            )
+        return records, latency
+
+    def _pages(self, raw: bool = False) -> Iterator[Tuple[List, float]]:
+        # Yields the records of each page not yet consumed, up to max_amt, with the page's
+        # fetch latency. The consumer advances amt_yielded/page_offset as it hands them out
+        cursor = self._cursor
+
+        # Keep fetching pages until the last page
+        while (
+            cursor.curr_page <= cursor.last_page and cursor.amt_yielded < cursor.max_amt
+        ):
+            # A resumed cursor re-fetches its page and skips what was already yielded
+            if cursor.page_offset:
+                cursor.curr_page -= 1
+            records, latency = self._next_page(raw)
+            remaining = cursor.max_amt - cursor.amt_yielded
+            yield records[cursor.page_offset : cursor.page_offset + remaining], latency
+            if cursor.amt_yielded >= cursor.max_amt:
+                return
+
+            # No token means this was the last page; asking again without one restarts at page 1
+            if not cursor.next_page_token:
+                return
+            cursor.page_token = cursor.next_page_token
+            cursor.page_offset = 0
+            cursor.amt_fetched += len(records)
+            cursor.page_size = self._next_page_size
+
+    def _iterate(self) -> Iterator[Model]:
+        cursor = self._cursor
+        for models, _ in self._pages():
+            for model in models:
+                cursor.amt_yielded += 1
+                cursor.page_offset += 1
+                yield model
+
+    def batches(self, batch_size: int = None, raw: bool = False) -> Iterator[Batch]:
+        """Iterates over whole batches instead of single models, sharing this Pager's cursor
+
+        Args:
+            batch_size (int, optional): Number of records per batch, None for one batch
+                per page. The last batch may be smaller. Defaults to None.
+            raw (bool, optional): If True, skip model construction and batch the records
+                as received from Wrike. Defaults to False.
+
+        Yields:
+            Iterator[Batch]: Batches of models or records with their page metadata
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(
+                f"batch_size must be at least 1, {batch_size} was provided"
+            )
+        cursor = self._cursor
+        items, latency, pages = [], 0.0, 0
+        for records, page_latency in self._pages(raw):
+            latency += page_latency
+            pages += 1
+            while records:
+                if batch_size is None:
+                    taken, records = records, []
+                else:
+                    split = batch_size - len(items)
+                    taken, records = records[:split], records[split:]
+                items += taken
+                cursor.amt_yielded += len(taken)
+                cursor.page_offset += len(taken)
+                if batch_size is None or len(items) >= batch_size:
+                    yield self._batch(items, latency, pages)
+                    items, latency, pages = [], 0.0, 0
+        if items:
+            yield self._batch(items, latency, pages)
+
+    def _batch(self, items: List, latency: float, pages: int) -> Batch:
+        return Batch(
+            items,
+            response_size=self._cursor.response_size,
+            next_page_token=self._cursor.next_page_token,
+            fetch_latency=latency,
+            pages=pages,
+        )
@@ -0,0 +1,68 @@
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = None) -> None:
+        """Token bucket shared by every thread sending requests through one RestAdapter
+
+        Args:
+            rate (float): Requests allowed per second on average, e.g. 400 / 60 for
+                Wrike's 400 requests per minute
+            burst (int, optional): Max number of requests sent back to back after an idle
+                period, None for one second's worth. Defaults to None.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be greater than 0, {rate} was provided")
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Takes tokens from the bucket, going into debt if needed, without blocking
+
+        Returns:
+            float: Seconds the caller must wait before sending
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Takes tokens only if the bucket holds them, so a caller can wait its turn
+            elsewhere instead of going into debt
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise seconds until they will be there
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Blocks until the caller may send
+
+        Returns:
+            float: Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def available(self) -> float:
+        """Tokens currently in the bucket, negative while callers are waiting"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
@@ -1,11 +1,44 @@
+from concurrent import futures
+import copy
 from json import JSONDecodeError
 import logging
-import requests
-import requests.packages
-from typing import List, Dict
+import threading
+import time
+from urllib.parse import quote, urlsplit
+from typing import BinaryIO, Dict, Iterator, List, Union
+import weakref
 
+from wrike import deadlines
+from wrike.adaptive import AdaptiveConcurrency
+from wrike.circuit_breaker import CircuitBreaker
+from wrike.hedging import HedgePolicy
+from wrike.lazy import lazy_import
 from wrike.models import Result
-from wrike.exceptions import WrikeException
+from wrike.rate_limiter import RateLimiter
+from wrike.scheduling import RequestScheduler, check_priority
+from wrike.exceptions import (
+    CircuitOpenException,
+    TransientWrikeException,
+    WrikeException,
+    WrikeTimeoutException,
+)
+
+# Imported on the first request, not when the client is created
+requests = lazy_import("requests")
+
+
+def _outcome(status_code: int) -> str:
+    # How a response counts for adaptive concurrency
+    if status_code == 429:
+        return "throttled"
+    return "error" if (status_code or 0) >= 500 else "ok"
+
+
+def _retry_after(headers: Dict) -> float:
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
 
 
 class RestAdapter:
@@ -16,9 +49,24 @@ class RestAdapter:
         ver: str = "v4",
         ssl_verify: bool = True,
         logger: logging.Logger = None,
+        pool_maxsize: int = 10,
+        rate_limit: float = None,
+        max_concurrency: int = None,
+        interactive_reserved: int = 1,
+        priority: str = "interactive",
+        adaptive_concurrency: Union[bool, AdaptiveConcurrency] = False,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 120.0,
+        hedging: Union[bool, HedgePolicy] = False,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
     ):
         """Constructor for RestAdapter
 
+        A single RestAdapter is safe to share between threads. Each thread gets its own
+        requests.Session (and so its own connection pool), the immutable request settings
+        are read without locking, and a lock is only taken the first time a thread
+        sends a request.
+
         Args:
             hostname (str, optional): base url. Defaults to "www.wrike.com/api".
             api_key (str, optional): string used for authentication. Defaults to "".
@@ -28,17 +76,141 @@ class RestAdapter:
                 Defaults to True.
             logger (logging.Logger, optional): If your app has a logger, pass it in here.
                 Defaults to None.
+            pool_maxsize (int, optional): Max number of kept-alive connections in each
+                thread's connection pool. Defaults to 10.
+            rate_limit (float, optional): Max requests per second across all threads,
+                None for no limit. Defaults to None.
+            max_concurrency (int, optional): Max requests in flight across all threads,
+                None for no limit. Defaults to None.
+            interactive_reserved (int, optional): Slots of max_concurrency kept free for
+                interactive requests. Defaults to 1.
+            priority (str, optional): Lane of requests not tagged otherwise,
+                'interactive' or 'batch', see with_priority(). Defaults to 'interactive'.
+            adaptive_concurrency (Union[bool, AdaptiveConcurrency], optional): Tune the
+                max requests in flight from response latency, errors and 429s instead of
+                fixing it; True for an AdaptiveConcurrency growing up to max_concurrency
+                (or 32). Defaults to False.
+            connect_timeout (float, optional): Seconds to wait for a connection, None
+                to wait forever. Defaults to 10.0.
+            read_timeout (float, optional): Seconds to wait for each read from the
+                server, None to wait forever. Defaults to 120.0.
+            hedging (Union[bool, HedgePolicy], optional): Send a second copy of a GET
+                whose response is later than usual and keep whichever answers first;
+                True for a HedgePolicy with its defaults. Defaults to False.
+            circuit_breaker (Union[bool, CircuitBreaker], optional): Fail requests to
+                an endpoint group at once while Wrike keeps failing them; True for a
+                CircuitBreaker with its defaults. Defaults to False.
+
+        Both timeouts are lowered to whatever is left of the deadline of the running
+        operation, see wrike.deadlines.
         """
         self._logger = logger or logging.getLogger(__name__)
         self.url = "https://{}/{}/".format(hostname, ver)
         self._api_key = api_key
         self._ssl_verify = ssl_verify
+        self._pool_maxsize = pool_maxsize
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        if adaptive_concurrency is True:
+            max_limit = max_concurrency or 32
+            adaptive_concurrency = AdaptiveConcurrency(
+                initial_limit=min(4, max_limit), max_limit=max_limit
+            )
+        self.concurrency = adaptive_concurrency or None
+        # Queues requests by priority when there is a limit to share out
+        self.scheduler = (
+            RequestScheduler(
+                max_concurrency,
+                interactive_reserved,
+                self.rate_limiter,
+                self.concurrency,
+            )
+            if max_concurrency or self.rate_limiter or self.concurrency
+            else None
+        )
+        self.priority = check_priority(priority)
+        if hedging is True:
+            hedging = HedgePolicy()
+        self.hedging = hedging or None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker = circuit_breaker or None
+        # Hedged GETs and their copies are sent from here, so the caller can take
+        # whichever answers first; the threads are only started once they are needed
+        self._hedge_executor = (
+            futures.ThreadPoolExecutor(
+                max_workers=self.hedging.max_workers, thread_name_prefix="wrike-hedge"
+            )
+            if self.hedging
+            else None
+        )
+        self._local = threading.local()
+        self._sessions = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
         if not ssl_verify:
             # noinspection PyUnresolvedReferences
             requests.packages.urllib3.disable_warnings()
 
+    def _session(self) -> "requests.Session":
+        """Returns the calling thread's Session, creating it on the thread's first request
+
+        Returns:
+            requests.Session: Session owned by the calling thread
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            http_adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=self._pool_maxsize
+            )
+            session.mount("https://", http_adapter)
+            session.mount("http://", http_adapter)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.add(session)
+        return session
+
+    def with_priority(self, priority: str) -> "RestAdapter":
+        """Returns a handle sending its requests in another lane, sharing this adapter's
+            connections, rate limit and scheduler
+
+        Args:
+            priority (str): 'interactive' or 'batch'
+
+        Returns:
+            RestAdapter: The handle
+        """
+        handle = copy.copy(self)
+        handle.priority = check_priority(priority)
+        return handle
+
+    def close(self) -> None:
+        """Closes the Sessions of every thread that has used this RestAdapter"""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+        if self._hedge_executor is not None:
+            # Stops the idle hedging threads; a new pool starts them again on demand
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = futures.ThreadPoolExecutor(
+                max_workers=self.hedging.max_workers, thread_name_prefix="wrike-hedge"
+            )
+
     def _do(
-        self, http_method: str, endpoint: str, ep_params: Dict = None, data: Dict = None
+        self,
+        http_method: str,
+        endpoint: str,
+        ep_params: Dict = None,
+        data: Dict = None,
+        raw: bool = False,
+        body: BinaryIO = None,
+        extra_headers: Dict = None,
+        priority: str = None,
+        timeout: float = None,
     ) -> Result:
         """Private method for get(), post(), delete(), etc. methods
 
@@ -47,8 +219,22 @@ class RestAdapter:
             endpoint (str): URL Endpoint as a string
             ep_params (Dict, optional): Dictionary of Endpoint parameters. Defaults to None.
             data (Dict, optional): Dictionary of data to pass to Wrike. Defaults to None.
+            raw (bool, optional): If True, a successful response body is not decoded but
+                returned as Result.content. Defaults to False.
+            body (BinaryIO, optional): File handle streamed as the request body instead of
+                JSON data. Defaults to None.
+            extra_headers (Dict, optional): Headers sent besides Authorization.
+                Defaults to None.
+            priority (str, optional): Lane of the request, None for the adapter's.
+                Defaults to None.
+            timeout (float, optional): Deadline of this call in seconds, within that of
+                the running operation. Defaults to None.
 
         Raises:
+            CircuitOpenException: The endpoint's circuit is open and no stale response
+                was kept
+            WrikeTimeoutException: Request timed out or the deadline passed
+            WrikeCancelledException: The running operation was cancelled
             WrikeException: Request failed
             WrikeException: Unable to deseralize JSON
             WrikeException: Successful status code not returned
@@ -56,27 +242,112 @@ class RestAdapter:
         Returns:
             Result: a Result object
         """
+        if timeout is not None:
+            with deadlines.deadline(timeout):
+                return self._do(
+                    http_method,
+                    endpoint,
+                    ep_params,
+                    data,
+                    raw,
+                    body,
+                    extra_headers,
+                    priority,
+                )
         full_url = self.url + endpoint
-        headers = {"Authorization": "bearer " + self._api_key}
+        headers = {"Authorization": "bearer " + self._api_key, **(extra_headers or {})}
         log_line_pre = f"method={http_method}, url={full_url}, params={ep_params}"
         log_line_post = ", ".join(
-            (log_line_pre, "success={}, status_code={}, message={}")
+            (
+                log_line_pre.replace("{", "{{").replace("}", "}}"),
+                "success={}, status_code={}, message={}",
+            )
         )
 
+        scheduler = self.scheduler
+        breaker = self.circuit_breaker
+        priority = priority or self.priority
+        deadlines.check()
+        if breaker:
+            try:
+                permit = breaker.before(endpoint)
+            except CircuitOpenException:
+                # Fail fast, unless an earlier response to the same GET can stand in
+                stale = (
+                    breaker.stale(endpoint, ep_params, raw)
+                    if http_method == "GET"
+                    else None
+                )
+                if stale is None:
+                    raise
+                self._logger.warning(msg=f"{log_line_pre}, circuit open, serving stale")
+                return stale
+        if scheduler:
+            try:
+                scheduler.acquire(priority)
+            except WrikeException:
+                # Cancelled or out of time while queued, so never sent
+                if breaker:
+                    breaker.after(permit, None)
+                raise
+        sent = None
+        outcome = "error"
+
         # Log HTTP params and perform an HTTP request, catching and re-raising any exceptions
         try:
+            # Time spent queuing counts against the deadline
+            timeouts = deadlines.timeouts(self._connect_timeout, self._read_timeout)
             self._logger.debug(msg=log_line_pre)
-            response = requests.request(
+            sent = time.monotonic()
+            response = self._session().request(
                 method=http_method,
                 url=full_url,
                 verify=self._ssl_verify,
                 headers=headers,
                 params=ep_params,
                 json=data,
+                data=body,
+                timeout=timeouts,
             )
+            outcome = _outcome(response.status_code)
+        except requests.exceptions.Timeout as e:
+            self._logger.error(msg=(str(e)))
+            raise WrikeTimeoutException(f"Request timed out after {timeouts}") from e
         except requests.exceptions.RequestException as e:
             self._logger.error(msg=(str(e)))
-            raise WrikeException("Request failed") from e
+            raise TransientWrikeException("Request failed") from e
+        finally:
+            if scheduler:
+                latency = None if sent is None else time.monotonic() - sent
+                scheduler.release(priority, latency, outcome)
+            if breaker:
+                breaker.after(permit, None if sent is None else outcome)
+
+        # Throttled or server side failures are worth retrying, and often do not carry JSON
+        if response.status_code == 429 or (response.status_code or 0) >= 500:
+            self._logger.error(
+                msg=log_line_post.format(False, response.status_code, response.reason)
+            )
+            raise TransientWrikeException(
+                f"{response.status_code}: {response.reason}",
+                status_code=response.status_code,
+                retry_after=_retry_after(response.headers),
+            )
+
+        # Leave decoding of successful responses to the caller when asked to
+        if raw and 299 >= response.status_code >= 200:
+            self._logger.debug(
+                msg=log_line_post.format(True, response.status_code, response.reason)
+            )
+            result = Result(
+                response.status_code,
+                response.headers,
+                message=response.reason,
+                content=response.content,
+            )
+            if breaker and http_method == "GET":
+                breaker.store(endpoint, ep_params, raw, result)
+            return result
 
         # Deserialize JSON output to Python object, or return failed Result on exception
         try:
@@ -93,27 +364,147 @@ class RestAdapter:
         )
         if is_success:
             self._logger.debug(msg=log_line)
-            return Result(
+            result = Result(
                 response.status_code,
                 response.headers,
                 message=response.reason,
                 data=data_out,
             )
+            if breaker and http_method == "GET":
+                breaker.store(endpoint, ep_params, raw, result)
+            return result
         self._logger.error(msg=log_line)
         # TODO: Errors https://developers.wrike.com/errors/
         raise WrikeException(f"{response.status_code}: {response.reason}")
 
-    def get(self, endpoint: str, ep_params: Dict = None) -> Result:
+    def get(
+        self,
+        endpoint: str,
+        ep_params: Dict = None,
+        raw: bool = False,
+        priority: str = None,
+        timeout: float = None,
+    ) -> Result:
         """Query - HTTP GET setup for Wrike
 
         Args:
             endpoint (str): URL Endpoint as a string
             ep_params (Dict, optional): Dictionary of Endpoint parameters. Defaults to None.
+            raw (bool, optional): If True, return the undecoded body as Result.content.
+                Defaults to False.
+            priority (str, optional): Lane of the request, None for the adapter's.
+                Defaults to None.
+            timeout (float, optional): Deadline of this call in seconds, within that of
+                the running operation. Defaults to None.
+
+        Returns:
+            Result: a Result object
+        """
+        if self.hedging is not None:
+            return self._hedged_get(endpoint, ep_params, raw, priority, timeout)
+        return self._do(
+            http_method="GET",
+            endpoint=endpoint,
+            ep_params=ep_params,
+            raw=raw,
+            priority=priority,
+            timeout=timeout,
+        )
+
+    def _attempt(
+        self,
+        token: deadlines.CancellationToken,
+        endpoint: str,
+        ep_params: Dict,
+        raw: bool,
+        priority: str,
+    ) -> Result:
+        # One copy of a hedged GET, stopped through the token once the other one wins
+        with deadlines.deadline(token=token):
+            start = time.monotonic()
+            result = self._do("GET", endpoint, ep_params, raw=raw, priority=priority)
+        self.hedging.record(endpoint, time.monotonic() - start)
+        return result
+
+    def _hedged_get(
+        self,
+        endpoint: str,
+        ep_params: Dict,
+        raw: bool,
+        priority: str,
+        timeout: float,
+    ) -> Result:
+        """Sends a GET and, if it is not answered within the hedging delay of its
+            endpoint and the budget allows, a copy of it
+
+        The GET is sent from the calling thread and a timer sends the copy from the
+        hedging pool, so the pool only ever holds copies. Once one of them succeeds the
+        other is cancelled: it leaves the scheduler queue or its retry wait, and a
+        response already on its way is dropped. If both fail, the error of the GET is
+        raised.
 
         Returns:
             Result: a Result object
         """
-        return self._do(http_method="GET", endpoint=endpoint, ep_params=ep_params)
+        if timeout is not None:
+            # One deadline for the call, inherited by both copies through bind()
+            with deadlines.deadline(timeout):
+                return self._hedged_get(endpoint, ep_params, raw, priority, None)
+        policy = self.hedging
+        delay = policy.delay(endpoint)
+        if delay is None:
+            # Too few latencies to know what late is: send it from this thread
+            return self._attempt(None, endpoint, ep_params, raw, priority)
+        token = deadlines.CancellationToken()
+        args = (token, endpoint, ep_params, raw, priority)
+        lock = threading.Lock()
+        hedges = []
+        finished = False
+
+        def answered(future: futures.Future) -> None:
+            if future.exception() is None:
+                token.cancel("Hedged GET already answered")
+
+        def hedge() -> None:
+            with lock:
+                if finished or not policy.try_hedge():
+                    return
+                self._logger.debug(
+                    msg=f"method=GET, url={self.url + endpoint}, hedged after {delay:.3f}s"
+                )
+                future = self._hedge_executor.submit(
+                    deadlines.bind(self._attempt, *args)
+                )
+                future.add_done_callback(answered)
+                hedges.append(future)
+
+        timer = threading.Timer(delay, deadlines.bind(hedge))
+        timer.daemon = True
+        timer.start()
+        error = None
+        try:
+            result = self._attempt(*args)
+        except Exception as e:
+            error = e
+        finally:
+            timer.cancel()
+            with lock:
+                finished = True
+        if hedges and hedges[0].done() and hedges[0].exception() is None:
+            policy.won()
+            return hedges[0].result()
+        if error is None:
+            token.cancel("Hedged GET already answered")
+            return result
+        if not hedges:
+            raise error
+        # The GET failed while its copy is still out: the copy is the last chance
+        try:
+            result = hedges[0].result()
+        except Exception:
+            raise error
+        policy.won()
+        return result
 
     def post(self, endpoint: str, ep_params: Dict = None, data: Dict = None) -> Result:
         """Create - HTTP POST setup for Wrike
@@ -161,3 +552,149 @@ class RestAdapter:
         return self._do(
             http_method="DELETE", endpoint=endpoint, ep_params=ep_params, data=data
         )
+
+    def stream(
+        self, url: str, chunk_size: int = 1 << 20, offset: int = 0
+    ) -> Iterator[bytes]:
+        """Downloads a file in chunks without holding the whole body in memory
+
+        Args:
+            url (str): URL Endpoint, or an absolute URL such as a Data Export resource.
+                The API key is only sent to the API itself.
+            chunk_size (int, optional): Max bytes per chunk. Defaults to 1 MiB.
+            offset (int, optional): Byte to start from, requested with a Range header to
+                resume an interrupted download. A 416 answer means nothing is left and
+                yields no chunks. Defaults to 0.
+
+        Raises:
+            CircuitOpenException: The circuit of the endpoint, or of the file's host, is
+                open
+            WrikeTimeoutException: Request timed out or the deadline passed
+            TransientWrikeException: Request failed, throttled or a server side error
+            WrikeException: Successful status code not returned
+
+        Yields:
+            Iterator[bytes]: Chunks of the response body
+        """
+        full_url = url if "://" in url else self.url + url
+        headers = {}
+        if full_url.startswith(self.url):
+            headers["Authorization"] = "bearer " + self._api_key
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        log_line = f"method=GET, url={full_url}, stream=True, offset={offset}"
+
+        # A download holds its slot only until the response headers arrive, so long
+        # transfers do not starve other requests
+        breaker = self.circuit_breaker
+        deadlines.check()
+        if breaker:
+            # Files outside the API, e.g. exported CSVs, share a circuit per host
+            permit = breaker.before(url if "://" not in url else urlsplit(url).netloc)
+        if self.scheduler:
+            try:
+                self.scheduler.acquire(self.priority)
+            except WrikeException:
+                if breaker:
+                    breaker.after(permit, None)
+                raise
+        sent = None
+        outcome = "error"
+        try:
+            timeouts = deadlines.timeouts(self._connect_timeout, self._read_timeout)
+            self._logger.debug(msg=log_line)
+            sent = time.monotonic()
+            response = self._session().request(
+                method="GET",
+                url=full_url,
+                verify=self._ssl_verify,
+                headers=headers,
+                stream=True,
+                timeout=timeouts,
+            )
+            outcome = _outcome(response.status_code)
+        except requests.exceptions.Timeout as e:
+            self._logger.error(msg=(str(e)))
+            raise WrikeTimeoutException(f"Request timed out after {timeouts}") from e
+        except requests.exceptions.RequestException as e:
+            self._logger.error(msg=(str(e)))
+            raise TransientWrikeException("Request failed") from e
+        finally:
+            if self.scheduler:
+                latency = None if sent is None else time.monotonic() - sent
+                self.scheduler.release(self.priority, latency, outcome)
+            if breaker:
+                breaker.after(permit, None if sent is None else outcome)
+
+        with response:
+            if response.status_code == 429 or (response.status_code or 0) >= 500:
+                self._logger.error(
+                    msg=f"{log_line}, status_code={response.status_code}"
+                )
+                raise TransientWrikeException(
+                    f"{response.status_code}: {response.reason}",
+                    status_code=response.status_code,
+                    retry_after=_retry_after(response.headers),
+                )
+            if response.status_code == 416 and offset:
+                # Nothing past offset: the bytes before it already make the whole file,
+                # unless the server reports a different size
+                size = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if not size.isdigit() or int(size) == offset:
+                    self._logger.debug(msg=f"{log_line}, already complete")
+                    return
+            if not 299 >= response.status_code >= 200:
+                self._logger.error(
+                    msg=f"{log_line}, status_code={response.status_code}"
+                )
+                raise WrikeException(f"{response.status_code}: {response.reason}")
+            # A server ignoring the Range header resends the file from its first byte
+            skip = offset if offset and response.status_code != 206 else 0
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    # A cancelled or expired download stops between chunks
+                    deadlines.check()
+                    if skip:
+                        dropped = min(skip, len(chunk))
+                        chunk = chunk[dropped:]
+                        skip -= dropped
+                    if chunk:
+                        yield chunk
+            except requests.exceptions.Timeout as e:
+                self._logger.error(msg=(str(e)))
+                raise WrikeTimeoutException("Download timed out") from e
+            except requests.exceptions.RequestException as e:
+                self._logger.error(msg=(str(e)))
+                raise TransientWrikeException("Download interrupted") from e
+
+    def upload(
+        self,
+        endpoint: str,
+        file: BinaryIO,
+        file_name: str,
+        content_type: str = "application/octet-stream",
+        http_method: str = "POST",
+    ) -> Result:
+        """Upload - streams a file handle as the request body, for attachments
+
+        Args:
+            endpoint (str): URL Endpoint as a string
+            file (BinaryIO): File opened in binary mode, read in chunks while sending
+            file_name (str): Name the file is stored under
+            content_type (str, optional): MIME type of the file.
+                Defaults to 'application/octet-stream'.
+            http_method (str, optional): POST to add a file, PUT to replace one.
+                Defaults to 'POST'.
+
+        Returns:
+            Result: a Result object
+        """
+        return self._do(
+            http_method=http_method,
+            endpoint=endpoint,
+            body=file,
+            extra_headers={
+                "X-File-Name": quote(file_name),
+                "Content-Type": content_type,
+            },
+        )
@@ -0,0 +1,163 @@
+from contextlib import contextmanager
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Iterator
+
+from wrike import deadlines
+from wrike.adaptive import AdaptiveConcurrency
+from wrike.rate_limiter import RateLimiter
+
+# Lanes in the order they are served
+PRIORITIES = ("interactive", "batch")
+# Seconds between checks of the running operation's cancellation token while queued
+_CANCEL_POLL = 0.05
+
+
+def check_priority(priority: str) -> str:
+    if priority not in PRIORITIES:
+        raise ValueError(
+            f"Expected priority to be one of {PRIORITIES}, {priority} was provided"
+        )
+    return priority
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        interactive_reserved: int = 1,
+        rate_limiter: RateLimiter = None,
+        adaptive: AdaptiveConcurrency = None,
+    ) -> None:
+        """Admits requests from every thread sharing a RestAdapter in priority order
+
+        Waiting requests form one queue ordered by lane, then arrival. Only the head of
+        the queue is admitted, once a concurrency slot is free for its lane and the rate
+        limiter has a token, so an interactive request overtakes all queued batch work
+        and takes the next token. Batch requests can never hold the slots reserved for
+        interactive ones, and fill whatever rate budget interactive requests leave.
+
+        Args:
+            max_concurrency (int, optional): Max requests in flight across all lanes,
+                None for no limit. Defaults to None.
+            interactive_reserved (int, optional): Slots of max_concurrency only
+                interactive requests may use. Defaults to 1.
+            rate_limiter (RateLimiter, optional): Token bucket every admitted request
+                takes a token from. Defaults to None.
+            adaptive (AdaptiveConcurrency, optional): Replaces max_concurrency with a
+                limit tuned from the samples passed to release(). Defaults to None.
+        """
+        if adaptive is not None:
+            max_concurrency = adaptive.max_limit
+        if max_concurrency is not None and not (
+            0 <= interactive_reserved < max_concurrency
+        ):
+            raise ValueError(
+                f"interactive_reserved must be at least 0 and less than max_concurrency "
+                f"({max_concurrency}), {interactive_reserved} was provided"
+            )
+        self.max_concurrency = max_concurrency
+        self.interactive_reserved = interactive_reserved if max_concurrency else 0
+        self.rate_limiter = rate_limiter
+        self.adaptive = adaptive
+        self._cond = threading.Condition()
+        self._queue = []
+        self._arrivals = itertools.count()
+        self.in_flight: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.admitted: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.wait_time: Dict[str, float] = dict.fromkeys(PRIORITIES, 0.0)
+
+    @property
+    def queued(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    @property
+    def limit(self) -> int:
+        """Current max requests in flight, None for no limit"""
+        return self.adaptive.limit if self.adaptive else self.max_concurrency
+
+    def _slot_free(self, priority: str) -> bool:
+        limit = self.limit
+        if limit is None:
+            return True
+        if priority != "interactive":
+            # An adaptive limit may drop to the reserve, batch work still gets one slot
+            limit = max(limit - self.interactive_reserved, 1)
+        return sum(self.in_flight.values()) < limit
+
+    def acquire(self, priority: str = "interactive") -> float:
+        """Blocks until the request may be sent
+
+        Args:
+            priority (str, optional): Lane of the request, 'interactive' or 'batch'.
+                Defaults to 'interactive'.
+
+        Raises:
+            ValueError: Unknown priority
+            WrikeTimeoutException: The running operation's deadline passed while queued
+            WrikeCancelledException: The running operation was cancelled while queued
+
+        Returns:
+            float: Seconds waited
+        """
+        entry = (PRIORITIES.index(check_priority(priority)), next(self._arrivals))
+        active = deadlines.current()
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    if active is not None:
+                        active.check()
+                    timeout = None
+                    if self._queue[0] == entry and self._slot_free(priority):
+                        if self.rate_limiter is None:
+                            break
+                        timeout = self.rate_limiter.try_acquire()
+                        if not timeout:
+                            break
+                    if active is not None:
+                        timeout = min(
+                            timeout or _CANCEL_POLL, _CANCEL_POLL, active.remaining()
+                        )
+                    self._cond.wait(timeout)
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                # The next in line may be admissible now
+                self._cond.notify_all()
+            waited = time.monotonic() - start
+            self.in_flight[priority] += 1
+            self.admitted[priority] += 1
+            self.wait_time[priority] += waited
+        return waited
+
+    def release(
+        self, priority: str = "interactive", latency: float = None, outcome: str = "ok"
+    ) -> None:
+        """Frees the slot of a request
+
+        Args:
+            priority (str, optional): Lane the slot was acquired in. Defaults to 'interactive'.
+            latency (float, optional): Seconds the request took, None if it was not
+                sent. Defaults to None.
+            outcome (str, optional): 'ok', 'throttled' or 'error', see
+                AdaptiveConcurrency.record. Defaults to 'ok'.
+        """
+        if self.adaptive is not None and latency is not None:
+            self.adaptive.record(latency, outcome)
+        with self._cond:
+            self.in_flight[priority] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: str = "interactive") -> Iterator[float]:
+        """Holds a slot for the duration of the with block"""
+        waited = self.acquire(priority)
+        try:
+            yield waited
+        finally:
+            self.release(priority)
@@ -0,0 +1,182 @@
+from typing import Any, Callable, Dict, Tuple
+
+from wrike.conversion import dump
+
+# Marks a field without a default, which every record must carry
+REQUIRED = object()
+# Prefix of the attribute holding a lazily converted field's raw value
+RAW_PREFIX = "_raw_"
+
+
+class Field:
+    wire: str
+    attr: str
+    default: Any
+    default_factory: Callable[[], Any]
+    converter: Callable[[Any], Any]
+
+    def __init__(
+        self,
+        wire: str,
+        attr: str = None,
+        default: Any = None,
+        converter: Callable[[Any], Any] = None,
+        default_factory: Callable[[], Any] = None,
+    ) -> None:
+        """One field of a model's schema
+
+        Args:
+            wire (str): Key of the field in Wrike's JSON, e.g. 'authorId'
+            attr (str, optional): Attribute on the model, None for the wire name.
+                Defaults to None.
+            default (Any, optional): Value when the record lacks the field, REQUIRED if it
+                must be present. Defaults to None.
+            converter (Callable[[Any], Any], optional): Applied to the value read from
+                the record (not to the default). Defaults to None.
+            default_factory (Callable[[], Any], optional): Called for a new default on
+                every record lacking the field, e.g. list, so mutable defaults are never
+                shared between models. Replaces default. Defaults to None.
+        """
+        self.wire = wire
+        self.attr = attr or wire
+        self.default = default
+        self.converter = converter
+        self.default_factory = default_factory
+
+    def __repr__(self) -> str:
+        return f"Field({self.wire!r}, {self.attr!r})"
+
+
+def compile_from_dict(
+    cls: type, fields: Tuple[Field, ...], conversion: str = "eager"
+) -> Callable[[Dict], Any]:
+    """Generates a constructor specialised to one schema. The record is copied whole, so
+    keys outside the schema stay attributes as with the hand-written constructors'
+    **kwargs, and only renamed, defaulted or converted fields cost a Python level step
+
+    Args:
+        cls (type): Model class to build
+        fields (Tuple[Field, ...]): The class's fields, base class fields first
+        conversion (str, optional): 'eager' applies converters while building, 'lazy'
+            keeps the raw value under RAW_PREFIX + attr for the class to convert on
+            first access, 'off' ignores converters. Defaults to 'eager'.
+
+    Raises:
+        KeyError: From the generated constructor, when a record lacks a required field
+
+    Returns:
+        Callable[[Dict], Any]: Builds one instance from one record
+    """
+    namespace = {
+        "cls": cls,
+        "new": object.__new__,
+        "required": frozenset(f.wire for f in fields if f.default is REQUIRED),
+    }
+    lines = [
+        "def from_dict(record):",
+        "    if not required <= record.keys():",
+        "        raise KeyError(sorted(required - record.keys()))",
+        "    attrs = record.copy()",
+    ]
+    for i, field in enumerate(fields):
+        namespace[f"d{i}"] = field.default
+        namespace[f"c{i}"] = field.converter
+        namespace[f"f{i}"] = field.default_factory
+        required = field.default is REQUIRED
+        renamed = field.wire != field.attr
+        factory = field.default_factory is not None
+        if factory and (field.converter is None or conversion == "off"):
+            # A new default only for records lacking the field
+            if renamed:
+                lines.append(
+                    f"    attrs[{field.attr!r}] = attrs.pop({field.wire!r}) "
+                    f"if {field.wire!r} in attrs else f{i}()"
+                )
+            else:
+                lines.append(f"    if {field.wire!r} not in attrs:")
+                lines.append(f"        attrs[{field.wire!r}] = f{i}()")
+            continue
+        if factory:
+            # Shadows the shared default with a new one for this record
+            lines.append(f"    d{i} = f{i}()")
+        if field.converter is None or conversion == "off":
+            if renamed:
+                default = "" if required else f", d{i}"
+                lines.append(
+                    f"    attrs[{field.attr!r}] = attrs.pop({field.wire!r}{default})"
+                )
+            elif not required:
+                lines.append(f"    attrs.setdefault({field.wire!r}, d{i})")
+            continue
+        if conversion == "lazy":
+            # The attribute itself stays unset until the first access converts it
+            raw = RAW_PREFIX + field.attr
+            if required:
+                lines.append(f"    attrs[{raw!r}] = attrs.pop({field.wire!r})")
+            else:
+                lines.append(f"    v = attrs.pop({field.wire!r}, d{i})")
+                lines.append(f"    if v is d{i}:")
+                lines.append(f"        attrs[{field.attr!r}] = v")
+                lines.append(f"    else:")
+                lines.append(f"        attrs[{raw!r}] = v")
+        elif required:
+            read = f"attrs.pop({field.wire!r})" if renamed else f"attrs[{field.wire!r}]"
+            lines.append(f"    attrs[{field.attr!r}] = c{i}({read})")
+        else:
+            get = "pop" if renamed else "get"
+            lines.append(f"    v = attrs.{get}({field.wire!r}, d{i})")
+            lines.append(f"    attrs[{field.attr!r}] = d{i} if v is d{i} else c{i}(v)")
+    lines += [
+        "    instance = new(cls)",
+        "    instance.__dict__ = attrs",
+        "    return instance",
+    ]
+    exec(compile("\n".join(lines), f"<{cls.__name__}.from_dict>", "exec"), namespace)
+    return namespace["from_dict"]
+
+
+def compile_to_dict(
+    cls: type, fields: Tuple[Field, ...], envelope: Tuple[str, ...] = ()
+) -> Callable[[Any], Dict]:
+    """Generates the inverse of compile_from_dict: wire keys for the schema's fields plus
+    any extra attributes, leaving out the response envelope. Converted fields are dumped
+    back to their wire form, whichever conversion built the instance
+
+    Args:
+        cls (type): Model class to dump
+        fields (Tuple[Field, ...]): The class's own fields
+        envelope (Tuple[str, ...], optional): Attributes never dumped, e.g. kind and
+            the paging state. Defaults to ().
+
+    Returns:
+        Callable[[Any], Dict]: Dumps one instance to one record
+    """
+    converted = [field.attr for field in fields if field.converter]
+    namespace = {
+        "dump": dump,
+        "skip": frozenset(envelope)
+        | {field.attr for field in fields}
+        | {RAW_PREFIX + attr for attr in converted},
+    }
+    entries = [
+        (
+            f"        {field.wire!r}: dump(getattr(model, {field.attr!r})),"
+            if field.converter
+            else f"        {field.wire!r}: attrs[{field.attr!r}],"
+        )
+        for field in fields
+    ]
+    source = "\n".join(
+        [
+            "def to_dict(model):",
+            "    attrs = model.__dict__",
+            "    record = {",
+            *entries,
+            "    }",
+            "    for key in attrs.keys() - skip:",
+            "        record[key] = attrs[key]",
+            "    return record",
+        ]
+    )
+    exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+    return namespace["to_dict"]
@@ -0,0 +1,262 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import json
+import logging
+import queue
+import sys
+import threading
+from typing import Callable, Dict, Iterator, List
+
+from wrike import deadlines
+from wrike.fan_out import _get, _put
+from wrike.models import Model
+
+_logger = logging.getLogger(__name__)
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class Shard:
+    field: str
+    start: datetime
+    end: datetime
+    ep_params: Dict
+    depth: int
+
+    def __init__(
+        self,
+        field: str,
+        start: datetime,
+        end: datetime,
+        ep_params: Dict = None,
+        depth: int = 0,
+    ) -> None:
+        """One disjoint slice of a collection: a date window on one field, optionally
+            narrowed further by other server side filters
+
+        Args:
+            field (str): Date field to window on, e.g. 'createdDate' or 'updatedDate'
+            start (datetime): Window start (UTC)
+            end (datetime): Window end (UTC)
+            ep_params (Dict, optional): Extra filter parameters of the partition. Defaults to None.
+            depth (int, optional): Number of times the window was split. Defaults to 0.
+        """
+        self.field = field
+        self.start = start
+        self.end = end
+        self.ep_params = dict(ep_params or {})
+        self.depth = depth
+
+    def params(self) -> Dict:
+        window = {
+            "start": self.start.strftime(DATE_FORMAT),
+            "end": self.end.strftime(DATE_FORMAT),
+        }
+        return {**self.ep_params, self.field: json.dumps(window)}
+
+    def split(self) -> List["Shard"]:
+        middle = self.start + (self.end - self.start) / 2
+        return [
+            Shard(self.field, self.start, middle, self.ep_params, self.depth + 1),
+            Shard(self.field, middle, self.end, self.ep_params, self.depth + 1),
+        ]
+
+    def __repr__(self) -> str:
+        return f"Shard({self.field}, {self.start.strftime(DATE_FORMAT)}, {self.end.strftime(DATE_FORMAT)}, {self.ep_params})"
+
+
+class ShardProgress:
+    shard: Shard
+    state: str
+    records: int
+    pages: int
+    response_size: int
+
+    def __init__(
+        self,
+        shard: Shard,
+        state: str,
+        records: int = 0,
+        pages: int = 0,
+        response_size: int = 0,
+    ) -> None:
+        """Progress report of one shard, passed to the progress callback of a ShardedScan
+
+        Args:
+            shard (Shard): The shard reported on
+            state (str): 'done', 'split' (too dense, replaced by two halves) or 'failed'
+            records (int, optional): Records fetched from the shard. Defaults to 0.
+            pages (int, optional): Pages fetched from the shard. Defaults to 0.
+            response_size (int, optional): Records in the shard reported by Wrike. Defaults to 0.
+        """
+        self.shard = shard
+        self.state = state
+        self.records = records
+        self.pages = pages
+        self.response_size = response_size
+
+
+def time_windows(start: datetime, end: datetime, count: int) -> List[tuple]:
+    """Splits [start, end] into count equal, adjacent windows"""
+    step = (end - start) / count
+    return [(start + step * i, start + step * (i + 1)) for i in range(count)]
+
+
+class ShardedScan:
+    def __init__(
+        self,
+        client,
+        endpoint: str,
+        model: Callable[..., Model],
+        start: datetime,
+        end: datetime = None,
+        field: str = "createdDate",
+        shards: int = 8,
+        max_workers: int = 8,
+        max_shard_size: int = None,
+        min_window: timedelta = timedelta(minutes=1),
+        partitions: List[Dict] = None,
+        progress: Callable[[ShardProgress], None] = None,
+        max_amt: int = None,
+    ) -> None:
+        """Scans a collection through many disjoint shards paged concurrently, so one scan
+            can use several connections instead of a single nextPageToken chain
+
+        Windows holding more than max_shard_size records are split in half (down to
+        min_window) before they are paged. Records are deduplicated by id, since records on
+        a window boundary, or updated during the scan, can show up in two shards.
+
+        Args:
+            client (Wrike): Client used to page each shard
+            endpoint (str): URL Endpoint of the collection
+            model (Callable[..., Model]): Model class built from each record
+            start (datetime): Start of the scanned range (UTC)
+            end (datetime, optional): End of the scanned range (UTC), None for now. Defaults to None.
+            field (str, optional): Date field to window on. Defaults to 'createdDate'.
+            shards (int, optional): Initial number of windows. Defaults to 8.
+            max_workers (int, optional): Max number of shards paged concurrently. Defaults to 8.
+            max_shard_size (int, optional): Records above which a window is split,
+                None for 10 pages of the client's page size. Defaults to None.
+            min_window (timedelta, optional): Windows this short are never split.
+                Defaults to 1 minute.
+            partitions (List[Dict], optional): Other server side filters, e.g.
+                [{'status': 'Active'}, {'status': 'Completed'}]; every window is scanned once
+                per partition. Defaults to None.
+            progress (Callable[[ShardProgress], None], optional): Called from the consuming
+                thread each time a shard is done, split or failed. Defaults to None.
+            max_amt (int, optional): Max number of unique records to yield, None for no cap.
+                Defaults to None.
+        """
+        self._client = client
+        self._endpoint = endpoint
+        self._model = model
+        self._max_workers = max_workers
+        self._max_shard_size = max_shard_size or client._page_size * 10
+        self._min_window = min_window
+        self._progress = progress
+        self._max_amt = max_amt
+        end = end or datetime.now(timezone.utc).replace(microsecond=0)
+        self.pending = [
+            Shard(field, window_start, window_end, partition)
+            for partition in (partitions or [{}])
+            for window_start, window_end in time_windows(start, end, shards)
+        ]
+        self.shards_done = 0
+        self.shards_split = 0
+        self.records = 0
+        self.duplicates = 0
+
+    def _scan_shard(self, shard: Shard, out: queue.Queue, stop: threading.Event):
+        pager = self._client._page(
+            self._endpoint, self._model, max_amt=sys.maxsize, ep_params=shard.params()
+        )
+        records = 0
+        pages = 0
+        response_size = 0
+        try:
+            for batch in pager.batches():
+                if stop.is_set():
+                    return
+                pages += 1
+                response_size = batch.response_size
+                # Only the first page is needed to tell whether the window is too dense
+                if (
+                    pages == 1
+                    and response_size > self._max_shard_size
+                    and shard.end - shard.start > self._min_window
+                ):
+                    _put(
+                        out,
+                        ("split", ShardProgress(shard, "split", 0, 1, response_size)),
+                        stop,
+                    )
+                    return
+                records += len(batch)
+                _put(out, ("batch", batch.items), stop)
+        except Exception as e:
+            _put(
+                out,
+                ("failed", (ShardProgress(shard, "failed", records, pages), e)),
+                stop,
+            )
+            return
+        _put(
+            out,
+            ("done", ShardProgress(shard, "done", records, pages, response_size)),
+            stop,
+        )
+
+    def __iter__(self) -> Iterator[Model]:
+        out = queue.Queue(maxsize=self._max_workers * 2)
+        active = deadlines.current()
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        seen = set()
+        running = 0
+        try:
+            for shard in self.pending:
+                executor.submit(deadlines.bind(self._scan_shard, shard, out, stop))
+                running += 1
+            self.pending = []
+
+            while running:
+                event, payload = _get(out, active)
+                if event == "batch":
+                    for model in payload:
+                        if model.id in seen:
+                            self.duplicates += 1
+                            continue
+                        seen.add(model.id)
+                        self.records += 1
+                        yield model
+                        if self._max_amt is not None and self.records >= self._max_amt:
+                            return
+                    continue
+
+                running -= 1
+                if event == "failed":
+                    progress, error = payload
+                    self._report(progress)
+                    raise error
+                if event == "split":
+                    self.shards_split += 1
+                    for child in payload.shard.split():
+                        executor.submit(
+                            deadlines.bind(self._scan_shard, child, out, stop)
+                        )
+                        running += 1
+                else:
+                    self.shards_done += 1
+                self._report(payload)
+        finally:
+            # Also reached when the consumer closes the generator early
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _report(self, progress: ShardProgress) -> None:
+        _logger.debug(
+            msg=f"endpoint={self._endpoint}, shard={progress.shard}, state={progress.state}, "
+            f"records={progress.records}, pages={progress.pages}, response_size={progress.response_size}"
+        )
+        if self._progress:
+            self._progress(progress)
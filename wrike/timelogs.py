@@ -0,0 +1,183 @@
+from array import array
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+EPOCH = date(1970, 1, 1)
+_EPOCH_ORDINAL = EPOCH.toordinal()
+
+KEYS = ("user", "task", "category", "day", "week", "month", "year")
+# Periods are derived from the day column after aggregating, never per row
+_PERIODS: Dict[str, Callable[[date], Any]] = {
+    "day": lambda day: day,
+    "week": lambda day: day - timedelta(days=day.weekday()),
+    "month": lambda day: day.strftime("%Y-%m"),
+    "year": lambda day: day.year,
+}
+
+
+class _All:
+    def __repr__(self) -> str:
+        return "ALL"
+
+
+# Stands in for rolled up levels in rollup(), so it never clashes with a None category
+ALL = _All()
+
+
+def epoch_day(day: date) -> int:
+    return day.toordinal() - _EPOCH_ORDINAL
+
+
+class Interner:
+    def __init__(self) -> None:
+        """Maps string ids to dense ints and back"""
+        self.ids: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> str:
+        return self.ids[index]
+
+    def intern(self, id: str) -> int:
+        index = self._index.get(id)
+        if index is None:
+            index = self._index[id] = len(self.ids)
+            self.ids.append(id)
+        return index
+
+
+class TimelogStore:
+    def __init__(self) -> None:
+        """Columnar store of timelog entries, one typed array per column
+
+        Each entry costs 20 bytes: int32 minutes, int32 epoch day, and int32 indexes of
+        its interned user, task and category (-1 for none). Group-by and rollup run over
+        the arrays, so reports never build a Python object per entry.
+        """
+        self.minutes = array("i")
+        self.days = array("i")
+        self.users = array("i")
+        self.tasks = array("i")
+        self.categories = array("i")
+        self.user_ids = Interner()
+        self.task_ids = Interner()
+        self.category_ids = Interner()
+        self._day_cache: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def _day(self, tracked_date: str) -> int:
+        day = self._day_cache.get(tracked_date)
+        if day is None:
+            day = epoch_day(date.fromisoformat(tracked_date[:10]))
+            self._day_cache[tracked_date] = day
+        return day
+
+    def append(self, record: Dict) -> None:
+        """Adds one raw timelog record as returned by Wrike"""
+        category = record.get("categoryId")
+        self.minutes.append(round(record["hours"] * 60))
+        self.days.append(self._day(record["trackedDate"]))
+        self.users.append(self.user_ids.intern(record["userId"]))
+        self.tasks.append(self.task_ids.intern(record["taskId"]))
+        self.categories.append(
+            -1 if category is None else self.category_ids.intern(category)
+        )
+
+    def extend(self, records: Iterable[Dict]) -> None:
+        for record in records:
+            self.append(record)
+
+    @property
+    def total_minutes(self) -> int:
+        return sum(self.minutes)
+
+    def _column(self, key: str) -> Tuple[array, Callable[[int], Any]]:
+        if key == "user":
+            return self.users, self.user_ids.__getitem__
+        if key == "task":
+            return self.tasks, self.task_ids.__getitem__
+        if key == "category":
+            return self.categories, lambda i: None if i < 0 else self.category_ids[i]
+        period = _PERIODS[key]
+        return self.days, lambda day: period(EPOCH + timedelta(days=day))
+
+    def _selected(self, start: date, end: date) -> Iterable[bool]:
+        if start is None and end is None:
+            return None
+        first = epoch_day(start) if start else -(2**31)
+        last = epoch_day(end) if end else 2**31 - 1
+        return [first <= day <= last for day in self.days]
+
+    def group_by(self, *keys: str, start: date = None, end: date = None) -> Dict:
+        """Sums minutes per group
+
+        Args:
+            *keys (str): Columns to group by: 'user', 'task', 'category', or a period of
+                the tracked date: 'day', 'week' (its Monday), 'month' ('2024-01') or 'year'
+            start (date, optional): First tracked date included. Defaults to None.
+            end (date, optional): Last tracked date included. Defaults to None.
+
+        Raises:
+            ValueError: Unknown key
+
+        Returns:
+            Dict: Minutes by group; keys are plain values for one key, tuples otherwise
+        """
+        unknown = [key for key in keys if key not in KEYS]
+        if unknown:
+            raise ValueError(f"Expected keys to be in {KEYS}, {unknown} was provided")
+        selected = self._selected(start, end)
+        if not keys:
+            if selected is None:
+                return {(): self.total_minutes}
+            return {(): sum(m for m, s in zip(self.minutes, selected) if s)}
+        columns = [self._column(key) for key in keys]
+        totals = defaultdict(int)
+        if len(columns) == 1:
+            column = columns[0][0]
+            rows = zip(column, self.minutes)
+        else:
+            rows = zip(zip(*(column for column, _ in columns)), self.minutes)
+        if selected is not None:
+            rows = (row for row, s in zip(rows, selected) if s)
+        for group, minutes in rows:
+            totals[group] += minutes
+        # Decode the (few) aggregated groups; periods can merge several days into one
+        decoders = [decode for _, decode in columns]
+        result = defaultdict(int)
+        if len(decoders) == 1:
+            decode = decoders[0]
+            for group, minutes in totals.items():
+                result[decode(group)] += minutes
+        else:
+            for group, minutes in totals.items():
+                decoded = tuple(decode(g) for decode, g in zip(decoders, group))
+                result[decoded] += minutes
+        return dict(result)
+
+    def rollup(self, *keys: str, start: date = None, end: date = None) -> Dict:
+        """Sums minutes per group with subtotals, like SQL's GROUP BY ROLLUP
+
+        For keys ('user', 'month') the result holds (user, month) totals, (user, ALL)
+        subtotals per user and the (ALL, ALL) grand total.
+
+        Returns:
+            Dict[Tuple, int]: Minutes by group, rolled up levels set to ALL
+        """
+        finest = self.group_by(*keys, start=start, end=end)
+        if len(keys) == 1:
+            finest = {(group,): minutes for group, minutes in finest.items()}
+        result = dict(finest)
+        for level in range(len(keys) - 1, -1, -1):
+            padding = (ALL,) * (len(keys) - level)
+            for group, minutes in finest.items():
+                rolled = group[:level] + padding
+                result[rolled] = result.get(rolled, 0) + minutes
+        if not finest:
+            result[(ALL,) * len(keys)] = 0
+        return result